@@ -11,7 +11,7 @@ sys.path.append(str(Path(__file__).resolve().parents[1]))
 
 from app.db.base import Base
 from app.core.config import DATABASE_URL
-from app.models import user,category,product,uom,token_blacklist,product_image,email_setting,main_category,sub_category,zone,product_variants,otp,customer,slider # IMPORTANT: import models
+from app.models import user,category,product,uom,token_blacklist,product_image,email_setting,main_category,sub_category,zone,product_variants,otp,customer,slider,catalog_snapshot # IMPORTANT: import models
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
 config = context.config
@@ -29,6 +29,19 @@ fileConfig(config.config_file_name)
 # target_metadata = mymodel.Base.metadata
 target_metadata = Base.metadata
 
+
+# zones.geom is managed by raw SQL (optional PostGIS migration),
+# keep autogenerate from trying to drop it
+def include_object(object, name, type_, reflected, compare_to):
+    if type_ == "column" and name == "geom" and object.table.name == "zones":
+        return False
+    if type_ == "index" and name == "ix_zones_geom":
+        return False
+    # Optional pg_trgm indexes (search), not declared on the model
+    if type_ == "index" and name and name.startswith("ix_products_") and name.endswith("_trgm"):
+        return False
+    return True
+
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
 # my_important_option = config.get_main_option("my_important_option")
@@ -51,6 +64,7 @@ def run_migrations_offline() -> None:
     context.configure(
         url=url,
         target_metadata=target_metadata,
+        include_object=include_object,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
     )
@@ -74,7 +88,9 @@ def run_migrations_online() -> None:
 
     with connectable.connect() as connection:
         context.configure(
-            connection=connection, target_metadata=target_metadata
+            connection=connection,
+            target_metadata=target_metadata,
+            include_object=include_object,
         )
 
         with context.begin_transaction():
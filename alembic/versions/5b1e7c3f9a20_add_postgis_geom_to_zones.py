@@ -0,0 +1,108 @@
+"""add postgis geom to zones
+
+Revision ID: 5b1e7c3f9a20
+Revises: c7f0d3b9c69b
+Create Date: 2026-10-18 18:05:12.418203
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b1e7c3f9a20'
+down_revision: Union[str, Sequence[str], None] = 'c7f0d3b9c69b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    OPTIONAL: geometry copy of zones.polygon for ZONE_LOOKUP_MODE=postgis
+
+    Skipped when the PostGIS extension is not available on the server,
+    the app then keeps using the pure Python lookup.
+    """
+    bind = op.get_bind()
+
+    available = bind.execute(sa.text("""
+        SELECT 1 FROM pg_available_extensions WHERE name = 'postgis'
+    """)).scalar()
+
+    if not available:
+        return
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS postgis;")
+
+    op.execute("""
+        ALTER TABLE zones ADD COLUMN IF NOT EXISTS geom geometry(Polygon, 4326);
+    """)
+
+    # [{"lat": .., "lng": ..}, ...]  →  closed POLYGON((lng lat, ...))
+    op.execute("""
+        CREATE OR REPLACE FUNCTION zones_polygon_to_geom(polygon json)
+        RETURNS geometry AS $$
+            SELECT CASE
+                WHEN json_array_length(polygon) >= 3 THEN
+                    ST_SetSRID(ST_MakePolygon(ST_AddPoint(line, ST_StartPoint(line))), 4326)
+            END
+            FROM (
+                SELECT ST_MakeLine(
+                    ST_MakePoint((p->>'lng')::float8, (p->>'lat')::float8)
+                    ORDER BY ord
+                ) AS line
+                FROM json_array_elements(polygon) WITH ORDINALITY AS t(p, ord)
+            ) s
+        $$ LANGUAGE sql IMMUTABLE;
+    """)
+
+    # Keep geom in sync with the JSON column on every write
+    op.execute("""
+        CREATE OR REPLACE FUNCTION zones_sync_geom()
+        RETURNS trigger AS $$
+        BEGIN
+            NEW.geom := zones_polygon_to_geom(NEW.polygon);
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
+
+    op.execute("""
+        DROP TRIGGER IF EXISTS trg_zones_sync_geom ON zones;
+        CREATE TRIGGER trg_zones_sync_geom
+        BEFORE INSERT OR UPDATE OF polygon ON zones
+        FOR EACH ROW EXECUTE FUNCTION zones_sync_geom();
+    """)
+
+    # Backfill existing zones
+    op.execute("""
+        UPDATE zones SET geom = zones_polygon_to_geom(polygon);
+    """)
+
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS ix_zones_geom ON zones USING GIST (geom);
+    """)
+
+
+def downgrade() -> None:
+    """
+    Drop the geometry copy (PostGIS extension itself is kept)
+    """
+    op.execute("DROP INDEX IF EXISTS ix_zones_geom;")
+
+    bind = op.get_bind()
+
+    has_column = bind.execute(sa.text("""
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = 'zones' AND column_name = 'geom'
+    """)).scalar()
+
+    if not has_column:
+        return
+
+    op.execute("DROP TRIGGER IF EXISTS trg_zones_sync_geom ON zones;")
+    op.execute("DROP FUNCTION IF EXISTS zones_sync_geom();")
+    op.execute("DROP FUNCTION IF EXISTS zones_polygon_to_geom(json);")
+    op.execute("ALTER TABLE zones DROP COLUMN IF EXISTS geom;")
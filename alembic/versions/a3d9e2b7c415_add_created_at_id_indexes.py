@@ -0,0 +1,42 @@
+"""add created_at id indexes for keyset pagination
+
+Revision ID: a3d9e2b7c415
+Revises: 5b1e7c3f9a20
+Create Date: 2026-10-18 18:32:40.917355
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3d9e2b7c415'
+down_revision: Union[str, Sequence[str], None] = '5b1e7c3f9a20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+TABLES = [
+    'products',
+    'users',
+    'product_variants',
+    'categories',
+    'sliders',
+    'sub_categories',
+    'main_categories',
+    'uoms',
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in TABLES:
+        op.create_index(f'ix_{table}_created_at_id', table, ['created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in TABLES:
+        op.drop_index(f'ix_{table}_created_at_id', table_name=table)
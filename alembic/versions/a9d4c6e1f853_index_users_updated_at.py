@@ -0,0 +1,28 @@
+"""index users updated_at
+
+Revision ID: a9d4c6e1f853
+Revises: f2b6d8a1c374
+Create Date: 2026-10-19 00:12:38.904517
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a9d4c6e1f853'
+down_revision: Union[str, Sequence[str], None] = 'f2b6d8a1c374'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(op.f('ix_users_updated_at'), 'users', ['updated_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_users_updated_at'), table_name='users')
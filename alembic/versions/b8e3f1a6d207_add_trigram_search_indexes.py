@@ -0,0 +1,55 @@
+"""add trigram search indexes to products
+
+Revision ID: b8e3f1a6d207
+Revises: e4a7c2d91b36
+Create Date: 2026-10-18 20:41:37.512864
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b8e3f1a6d207'
+down_revision: Union[str, Sequence[str], None] = 'e4a7c2d91b36'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Same expressions as search_service._rank_postgres
+SEARCH_COLUMNS = ("product_name", "product_short_name", "slug", "sku_code")
+
+
+def upgrade() -> None:
+    """
+    OPTIONAL: pg_trgm GIN indexes for SEARCH_MODE=postgres
+
+    Skipped when the pg_trgm extension is not available on the server,
+    the app then keeps using the in-process search index.
+    """
+    bind = op.get_bind()
+
+    available = bind.execute(sa.text("""
+        SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'
+    """)).scalar()
+
+    if not available:
+        return
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm;")
+
+    for column in SEARCH_COLUMNS:
+        op.execute(f"""
+            CREATE INDEX IF NOT EXISTS ix_products_{column}_trgm ON products
+            USING GIN (lower(coalesce({column}, '')) gin_trgm_ops);
+        """)
+
+
+def downgrade() -> None:
+    """
+    Drop the trigram indexes (pg_trgm extension itself is kept)
+    """
+    for column in SEARCH_COLUMNS:
+        op.execute(f"DROP INDEX IF EXISTS ix_products_{column}_trgm;")
@@ -0,0 +1,45 @@
+"""add jti and expires_at to token_blacklist
+
+Revision ID: c3f8a5e2d914
+Revises: b8e3f1a6d207
+Create Date: 2026-10-18 21:26:03.184527
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3f8a5e2d914'
+down_revision: Union[str, Sequence[str], None] = 'b8e3f1a6d207'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('token_blacklist', sa.Column('jti', sa.String(length=64), nullable=True))
+    op.add_column('token_blacklist', sa.Column('expires_at', sa.DateTime(timezone=True), nullable=True))
+    op.alter_column('token_blacklist', 'token', existing_type=sa.String(length=500), nullable=True)
+
+    # Existing rows: keyed by the token hash (security.token_jti),
+    # kept for the longest token lifetime (refresh, 7 days)
+    op.execute("""
+        UPDATE token_blacklist
+        SET jti = encode(sha256(convert_to(token, 'UTF8')), 'hex'),
+            expires_at = coalesce(created_at, now()) + interval '7 days'
+        WHERE jti IS NULL AND token IS NOT NULL;
+    """)
+
+    op.create_unique_constraint('uq_token_blacklist_jti', 'token_blacklist', ['jti'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint('uq_token_blacklist_jti', 'token_blacklist', type_='unique')
+    op.execute("DELETE FROM token_blacklist WHERE token IS NULL;")
+    op.alter_column('token_blacklist', 'token', existing_type=sa.String(length=500), nullable=False)
+    op.drop_column('token_blacklist', 'expires_at')
+    op.drop_column('token_blacklist', 'jti')
@@ -0,0 +1,36 @@
+"""index catalog updated_at / deleted_at
+
+Revision ID: c5e8b2d7a419
+Revises: a9d4c6e1f853
+Create Date: 2026-10-19 10:27:44.318092
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5e8b2d7a419'
+down_revision: Union[str, Sequence[str], None] = 'a9d4c6e1f853'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# max(updated_at) / max(deleted_at) of the storefront validators
+TABLES = ("products", "product_variants", "uoms", "categories", "sliders")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in TABLES:
+        op.create_index(f'ix_{table}_updated_at', table, ['updated_at'], unique=False)
+        op.create_index(f'ix_{table}_deleted_at', table, ['deleted_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in TABLES:
+        op.drop_index(f'ix_{table}_deleted_at', table_name=table)
+        op.drop_index(f'ix_{table}_updated_at', table_name=table)
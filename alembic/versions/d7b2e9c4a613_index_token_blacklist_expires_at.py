@@ -0,0 +1,31 @@
+"""index token_blacklist expires_at
+
+Revision ID: d7b2e9c4a613
+Revises: c3f8a5e2d914
+Create Date: 2026-10-18 22:04:51.730219
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd7b2e9c4a613'
+down_revision: Union[str, Sequence[str], None] = 'c3f8a5e2d914'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Rows that can never be used again, the purge job drops them from now on
+    op.execute("DELETE FROM token_blacklist WHERE expires_at < now();")
+
+    op.create_index(op.f('ix_token_blacklist_expires_at'), 'token_blacklist', ['expires_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_token_blacklist_expires_at'), table_name='token_blacklist')
@@ -0,0 +1,38 @@
+"""create catalog snapshots table
+
+Revision ID: e4a7c2d91b36
+Revises: a3d9e2b7c415
+Create Date: 2026-10-18 19:05:12.481920
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e4a7c2d91b36'
+down_revision: Union[str, Sequence[str], None] = 'a3d9e2b7c415'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'catalog_snapshots',
+        sa.Column('zone_id', sa.Integer(), nullable=False),
+        sa.Column('payload', sa.Text(), nullable=False),
+        sa.Column('etag', sa.String(length=64), nullable=False),
+        sa.Column('is_stale', sa.Boolean(), nullable=False),
+        sa.Column('version', sa.Integer(), nullable=False),
+        sa.Column('built_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.ForeignKeyConstraint(['zone_id'], ['zones.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('zone_id')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('catalog_snapshots')
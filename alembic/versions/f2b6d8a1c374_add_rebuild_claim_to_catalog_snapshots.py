@@ -0,0 +1,28 @@
+"""add rebuild claim to catalog snapshots
+
+Revision ID: f2b6d8a1c374
+Revises: d7b2e9c4a613
+Create Date: 2026-10-18 23:41:07.518362
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2b6d8a1c374'
+down_revision: Union[str, Sequence[str], None] = 'd7b2e9c4a613'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('catalog_snapshots', sa.Column('rebuild_claimed_at', sa.DateTime(timezone=True), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('catalog_snapshots', 'rebuild_claimed_at')
@@ -1,4 +1,9 @@
-from app.db.session import SessionLocal
+from fastapi import Depends
+from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.session import SessionLocal, AsyncSessionLocal, ReadSessionLocal, AsyncReadSessionLocal
+from app.core.config import DATABASE_REPLICA_URL, ASYNC_DATABASE_REPLICA_URL
 # Gives DB session to routes
 
 def get_db():
@@ -9,16 +14,46 @@ def get_db():
         db.close()
 
 
+# Async DB session (async def routes)
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+# Read-only routes: replica first, primary once the session writes.
+# Without a replica the request's get_db / get_async_db session is
+# reused, so a route that also authenticates holds one connection.
+if DATABASE_REPLICA_URL:
+    def get_read_db():
+        db = ReadSessionLocal()
+        try:
+            yield db
+        finally:
+            db.close()
+else:
+    def get_read_db(db: Session = Depends(get_db)):
+        return db
+
+
+if ASYNC_DATABASE_REPLICA_URL:
+    async def get_async_read_db():
+        async with AsyncReadSessionLocal() as db:
+            yield db
+else:
+    async def get_async_read_db(db: AsyncSession = Depends(get_async_db)):
+        return db
+
+
 
 from fastapi import Depends, Header
 from jose import jwt, JWTError
 from sqlalchemy.orm import Session
 
-from app.core.security import SECRET_KEY, ALGORITHM
+from app.core.security import SECRET_KEY, ALGORITHM, token_jti
 from app.core.exceptions import AppException
-from app.models.user import User
+from app.core.revocation import is_token_revoked
+from app.core.user_cache import get_active_user
 from app.api.dependencies import get_db
-from app.models.token_blacklist import TokenBlacklist
 
 
 def get_current_user(
@@ -31,13 +66,6 @@ def get_current_user(
 
     token = authorization.split(" ")[1]
 
-    # ❌ BLOCK LOGGED-OUT TOKENS
-    blacklisted = db.query(TokenBlacklist).filter(
-            TokenBlacklist.token == token
-        ).first()
-    if blacklisted:
-        raise AppException(status=401, message="Token expired. Please login again")
-
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
         user_id = payload.get("user_id")
@@ -45,11 +73,11 @@ def get_current_user(
     except JWTError:
         raise AppException(status=401, message="Token expired or invalid")
 
-    user = db.query(User).filter(
-        User.id == user_id,
-        User.is_active == True,
-        User.is_delete == False
-    ).first()
+    # ❌ BLOCK LOGGED-OUT TOKENS (in-memory, no DB query)
+    if is_token_revoked(token_jti(payload, token)):
+        raise AppException(status=401, message="Token expired. Please login again")
+
+    user = get_active_user(db, user_id)
 
     if not user:
         raise AppException(status=401, message="User not authorized")
@@ -12,7 +12,8 @@ from app.api.v1.admin.routes import (
     zones,
     product_variants,
     profile_update,
-    slider
+    slider,
+    metrics
 )
 
 router = APIRouter(
@@ -32,3 +33,4 @@ router.include_router(zones.router, prefix="/zone")
 router.include_router(product_variants.router, prefix="/product-variants")
 router.include_router(profile_update.router, prefix="/users", tags=["Users"])
 router.include_router(slider.router, prefix="/slider")
+router.include_router(metrics.router, prefix="/metrics")
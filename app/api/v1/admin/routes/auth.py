@@ -1,20 +1,20 @@
 from fastapi import APIRouter, Depends,Header
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.api.dependencies import get_current_user
 
-from app.api.dependencies import get_db
+from app.api.dependencies import get_db, get_async_db
 from app.schemas.auth import LoginRequest, LoginResponse, RefreshTokenRequest
 from app.schemas.response import APIResponse
-from app.services.auth_service import login_user, refresh_access_token
-from app.models.token_blacklist import TokenBlacklist
+from app.services.auth_service import login_user, refresh_access_token, logout_tokens
 
 router = APIRouter()
 
 
 
 @router.post("/login", response_model=APIResponse[LoginResponse])
-def login(payload: LoginRequest, db: Session = Depends(get_db)):
-    data = login_user(db, payload.email, payload.password)
+async def login(payload: LoginRequest, db: AsyncSession = Depends(get_async_db)):
+    data = await login_user(db, payload.email, payload.password)
     return {
         "status": 200,
         "message": "Login successful",
@@ -23,9 +23,8 @@ def login(payload: LoginRequest, db: Session = Depends(get_db)):
 
 
 @router.post("/refresh", response_model=APIResponse[dict])
-def refresh_token(payload: RefreshTokenRequest,db: Session = Depends(get_db)
-):
-    data = refresh_access_token(payload.refresh_token,db)
+def refresh_token(payload: RefreshTokenRequest):
+    data = refresh_access_token(payload.refresh_token)
     return {
         "status": 200,
         "message": "Token refreshed",
@@ -44,17 +43,7 @@ def logout(
 ):
     access_token = authorization.split(" ")[1]
 
-    tokens = [access_token, refresh_token]
-
-    for token in tokens:
-        exists = db.query(TokenBlacklist).filter(
-            TokenBlacklist.token == token
-        ).first()
-
-        if not exists:
-            db.add(TokenBlacklist(token=token))
-
-    db.commit()
+    logout_tokens(db, [access_token, refresh_token])
 
     return {
         "status": 200,
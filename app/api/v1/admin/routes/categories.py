@@ -3,7 +3,7 @@ from sqlalchemy.orm import Session
 from typing import List
 from fastapi import Request
 
-from app.api.dependencies import get_db
+from app.api.dependencies import get_db, get_read_db
 from app.schemas.category import CategoryCreate, CategoryResponse,CategoryUpdate
 from app.schemas.response import APIResponse,PaginatedAPIResponse
 from app.services.category_service import create_category, get_categories
@@ -18,8 +18,7 @@ router = APIRouter()
 
 
 # Pagination
-from fastapi import Query
-import math
+from app.utils.pagination import PageParams, page_params, paginate
 
 
 @router.post("/create", response_model=APIResponse[CategoryResponse])
@@ -42,39 +41,19 @@ def add_category(
 
 @router.get("/list", response_model=PaginatedAPIResponse[List[CategoryResponse]])
 def list_categories(
-    page: int = Query(1, ge=1),
-    limit: int = Query(10, ge=1),
-    db: Session = Depends(get_db),
+    params: PageParams = Depends(page_params),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ):
     try:
-        # -------------------------------
-        # Pagination calculation
-        # -------------------------------
-        offset = (page - 1) * limit
-
         # -------------------------------
         # Base query (soft delete aware)
         # -------------------------------
         base_query = db.query(Category).filter(
             Category.is_delete == False
-        ).order_by(Category.created_at.desc())
-
-        total_records = base_query.count()
+        )
 
-        categories = base_query.offset(offset).limit(limit).all()
-
-        # -------------------------------
-        # Pagination metadata
-        # -------------------------------
-        total_pages = math.ceil(total_records / limit) if limit else 1
-
-        pagination = {
-            "total": total_records,
-            "per_page": limit,
-            "current_page": page,
-            "total_pages": total_pages,
-        }
+        categories, pagination = paginate(base_query, Category, params)
 
         # -------------------------------
         # Response
@@ -101,8 +80,8 @@ def list_categories(
             "data": [],
             "pagination": {
                 "total": 0,
-                "per_page": limit,
-                "current_page": page,
+                "per_page": params.limit,
+                "current_page": params.page,
                 "total_pages": 0
             }
         }
@@ -1,15 +1,15 @@
 # app/api/v1/routes/main_categories.py
-from fastapi import APIRouter, Depends, UploadFile, File, Query
+from fastapi import APIRouter, Depends, UploadFile, File
 from sqlalchemy.orm import Session
-import math
 
-from app.api.dependencies import get_db
+from app.api.dependencies import get_db, get_read_db
 from app.schemas.main_category import (
     MainCategoryCreate,
     MainCategoryUpdate,
     MainCategoryResponse
 )
 from app.schemas.response import APIResponse, PaginatedAPIResponse
+from app.utils.pagination import PageParams, page_params
 from app.services.main_category_service import (
     create_main_category,
     list_main_categories,
@@ -34,24 +34,17 @@ def create_api(
 
 @router.get("/list", response_model=PaginatedAPIResponse[list[MainCategoryResponse]])
 def list_api(
-    page: int = Query(1, ge=1),
-    limit: int = Query(10, ge=1),
-    db: Session = Depends(get_db),
+    params: PageParams = Depends(page_params),
+    db: Session = Depends(get_read_db),
     user: User = Depends(get_current_user)
 ):
-    offset = (page - 1) * limit
-    total, data = list_main_categories(db, offset, limit)
+    data, pagination = list_main_categories(db, params)
 
     return {
         "status": 200,
         "message": "Fetched successfully",
         "data": data,
-        "pagination": {
-            "total": total,
-            "per_page": limit,
-            "current_page": page,
-            "total_pages": math.ceil(total / limit)
-        }
+        "pagination": pagination
     }
 
 
@@ -0,0 +1,24 @@
+from fastapi import APIRouter, Depends
+from typing import List
+
+from app.api.dependencies import get_current_user
+from app.db.pool_metrics import pool_stats
+from app.db.session import engine, async_engine, replica_engine, async_replica_engine
+from app.models.user import User
+from app.schemas.metrics import PoolStatsResponse
+from app.schemas.response import APIResponse
+
+router = APIRouter(tags=["Metrics"])
+
+
+@router.get("/db-pool", response_model=APIResponse[List[PoolStatsResponse]])
+def db_pool_metrics(current_user: User = Depends(get_current_user)):
+    # Replica engines are the primary ones when no replica is configured
+    engines = {id(e): e for e in (engine, async_engine, replica_engine, async_replica_engine)}
+
+    # Counters are per worker process
+    return {
+        "status": 200,
+        "message": "Pool metrics fetched successfully",
+        "data": pool_stats(*engines.values())
+    }
@@ -1,15 +1,20 @@
-from fastapi import APIRouter, Depends, status,Query
+from fastapi import APIRouter, Depends, status
 from sqlalchemy.orm import Session
 from typing import List
-import math
 
-from app.api.dependencies import get_db, get_current_user
+from app.api.dependencies import get_db, get_current_user, get_read_db
 from app.models.user import User
 from app.schemas.response import APIResponse
-from app.schemas.product_variant import ProductVariantBulkCreate,ProductVariantResponse
+from app.schemas.product_variant import (
+    ProductVariantBulkCreate,
+    ProductVariantResponse,
+    ProductVariantBulkPriceUpdate,
+    VariantPriceUpdateResult
+)
 
-from app.services.product_variant_service import bulk_create_product_variants,list_all_product_variants,update_product_variant,soft_delete_product_variant
+from app.services.product_variant_service import bulk_create_product_variants,list_all_product_variants,update_product_variant,soft_delete_product_variant,bulk_update_variant_prices
 from app.schemas.response import APIResponse, PaginatedAPIResponse
+from app.utils.pagination import PageParams, page_params
 from app.schemas.response import APIResponse
 
 router = APIRouter()
@@ -39,28 +44,15 @@ def bulk_create_variants_api(
     response_model=PaginatedAPIResponse[List[ProductVariantResponse]]
 )
 def list_all_product_variants_api(
-    page: int = Query(1, ge=1),
-    limit: int = Query(10, ge=1),
-    db: Session = Depends(get_db),
+    params: PageParams = Depends(page_params),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ):
-    offset = (page - 1) * limit
-
-    variants, total = list_all_product_variants(
+    variants, pagination = list_all_product_variants(
         db=db,
-        offset=offset,
-        limit=limit
+        params=params
     )
 
-    total_pages = math.ceil(total / limit) if limit else 1
-
-    pagination = {
-        "total": total,
-        "per_page": limit,
-        "current_page": page,
-        "total_pages": total_pages,
-    }
-
     if variants:
         return {
             "status": 200,
@@ -97,6 +89,26 @@ def update_variant_api(
 
 
 
+@router.put(
+    "/bulk-price-update",
+    response_model=APIResponse[List[VariantPriceUpdateResult]]
+)
+def bulk_price_update_api(
+    payload: ProductVariantBulkPriceUpdate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    results = bulk_update_variant_prices(db, payload)
+    updated = sum(1 for result in results if result["status"] == 200)
+
+    return {
+        "status": 200,
+        "message": f"{updated} of {len(results)} product variants updated",
+        "data": results
+    }
+
+
+
 
 @router.delete(
     "/delete",
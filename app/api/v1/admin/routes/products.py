@@ -4,7 +4,7 @@ from fastapi import APIRouter, Depends, UploadFile, File
 from sqlalchemy.orm import Session
 from typing import List
 
-from app.api.dependencies import get_db, get_current_user
+from app.api.dependencies import get_db, get_current_user, get_read_db
 from app.schemas.product import ProductCreate, ProductUpdate, ProductResponse
 from app.schemas.response import APIResponse
 from app.api.dependencies import get_db
@@ -22,12 +22,16 @@ from app.services.product_service import (
 )
 from app.models.user import User
 from app.models.product import Product
+from app.schemas.catalog_import import CatalogImportReport
+from app.services.catalog_import_service import import_catalog
+from app.services.catalog_export_service import export_catalog, EXPORT_FORMATS
+from fastapi.responses import StreamingResponse
 
 router = APIRouter()
 
 # Pagination
 from fastapi import Query
-import math
+from app.utils.pagination import PageParams, page_params, paginate
 
 
 @router.post("/create", response_model=APIResponse[ProductResponse])
@@ -42,41 +46,50 @@ def add_product(
 
 
 
+@router.post("/import", response_model=APIResponse[CatalogImportReport])
+def import_products(
+    file: UploadFile = File(...),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    # Products + zone prices from CSV / XLSX, bad rows are reported not fatal
+    report = import_catalog(db, file)
+
+    return {
+        "status": 200,
+        "message": f"{report['imported']} of {report['rows']} rows imported",
+        "data": report
+    }
+
+
+@router.get("/export")
+def export_products(
+    format: str = Query("csv", pattern="^(csv|ndjson)$"),
+    current_user: User = Depends(get_current_user)
+):
+    # Products + zone prices, streamed as they are read
+    return StreamingResponse(
+        export_catalog(format),
+        media_type=EXPORT_FORMATS[format],
+        headers={"Content-Disposition": f'attachment; filename="catalog.{format}"'}
+    )
+
+
 @router.get("/list", response_model=PaginatedAPIResponse[List[ProductResponse]])
 def list_products(
-    page: int = Query(1, ge=1),
-    limit: int = Query(10, ge=1),
-    db: Session = Depends(get_db),
+    params: PageParams = Depends(page_params),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ):
     try:
-        # -------------------------------
-        # Pagination calculation
-        # -------------------------------
-        offset = (page - 1) * limit
-
         # -------------------------------
         # Base query (soft delete aware)
         # -------------------------------
         base_query = db.query(Product).filter(
             Product.is_delete == False
-        ).order_by(Product.created_at.desc())
-
-        total_records = base_query.count()
+        )
 
-        products = base_query.offset(offset).limit(limit).all()
-
-        # -------------------------------
-        # Pagination metadata
-        # -------------------------------
-        total_pages = math.ceil(total_records / limit) if limit else 1
-
-        pagination = {
-            "total": total_records,
-            "per_page": limit,
-            "current_page": page,
-            "total_pages": total_pages,
-        }
+        products, pagination = paginate(base_query, Product, params)
 
         # -------------------------------
         # Response
@@ -103,8 +116,8 @@ def list_products(
             "data": [],
             "pagination": {
                 "total": 0,
-                "per_page": limit,
-                "current_page": page,
+                "per_page": params.limit,
+                "current_page": params.page,
                 "total_pages": 0
             }
         }
@@ -1,16 +1,15 @@
 from fastapi import APIRouter, Depends, UploadFile, File
 from sqlalchemy.orm import Session
 
-from app.api.dependencies import get_db, get_current_user
+from app.api.dependencies import get_db, get_current_user, get_read_db
 from app.schemas.slider import SliderCreate, SliderResponse
 from app.schemas.response import APIResponse
 from app.services.slider_service import create_slider
 from app.models.user import User
 
-from fastapi import Query
-import math
 from app.schemas.response import PaginatedAPIResponse
 from app.services.slider_service import list_sliders
+from app.utils.pagination import PageParams, page_params
 
 
 from app.schemas.slider import SliderUpdate
@@ -50,30 +49,15 @@ def create_slider_api(
 
 @router.get("/list", response_model=PaginatedAPIResponse[list[SliderResponse]])
 def list_slider_api(
-    page: int = Query(1, ge=1),
-    limit: int = Query(10, ge=1),
-    db: Session = Depends(get_db),
+    params: PageParams = Depends(page_params),
+    db: Session = Depends(get_read_db),
     user: User = Depends(get_current_user)
 ):
     try:
         # -------------------------------
-        # Pagination
-        # -------------------------------
-        offset = (page - 1) * limit
-
-        # -------------------------------
-        # Fetch sliders
+        # Fetch sliders (page or cursor mode)
         # -------------------------------
-        total_records, sliders = list_sliders(db, offset, limit)
-
-        total_pages = math.ceil(total_records / limit) if limit else 1
-
-        pagination = {
-            "total": total_records,
-            "per_page": limit,
-            "current_page": page,
-            "total_pages": total_pages,
-        }
+        sliders, pagination = list_sliders(db, params)
 
         if sliders:
             return {
@@ -1,9 +1,8 @@
-from fastapi import APIRouter, Depends, UploadFile, File, Query
+from fastapi import APIRouter, Depends, UploadFile, File
 from sqlalchemy.orm import Session
-import math
 from typing import List
 
-from app.api.dependencies import get_db, get_current_user
+from app.api.dependencies import get_db, get_current_user, get_read_db
 from app.models.user import User
 from app.schemas.sub_category import (
     SubCategoryCreate,
@@ -11,6 +10,7 @@ from app.schemas.sub_category import (
     SubCategoryResponse
 )
 from app.schemas.response import APIResponse, PaginatedAPIResponse
+from app.utils.pagination import PageParams, page_params
 from app.services.sub_category_service import (
     create_sub_category,
     list_sub_categories,
@@ -34,24 +34,17 @@ def create_api(
 
 @router.get("/list", response_model=PaginatedAPIResponse[List[SubCategoryResponse]])
 def list_api(
-    page: int = Query(1, ge=1),
-    limit: int = Query(10, ge=1),
-    db: Session = Depends(get_db),
+    params: PageParams = Depends(page_params),
+    db: Session = Depends(get_read_db),
     user: User = Depends(get_current_user)
 ):
-    offset = (page - 1) * limit
-    total, data = list_sub_categories(db, offset, limit)
+    data, pagination = list_sub_categories(db, params)
 
     return {
         "status": 200,
         "message": "Fetched successfully",
         "data": data,
-        "pagination": {
-            "total": total,
-            "per_page": limit,
-            "current_page": page,
-            "total_pages": math.ceil(total / limit)
-        }
+        "pagination": pagination
     }
 
 
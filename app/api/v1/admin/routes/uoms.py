@@ -2,7 +2,7 @@ from fastapi import APIRouter, Depends, Request
 from sqlalchemy.orm import Session
 from typing import List
 
-from app.api.dependencies import get_db
+from app.api.dependencies import get_db, get_read_db
 from app.schemas.uom import UOMCreate, UOMUpdate, UOMResponse
 from app.schemas.response import APIResponse,PaginatedAPIResponse
 from app.services.uom_service import (
@@ -18,8 +18,7 @@ router = APIRouter()
 
 
 # Pagination
-from fastapi import Query
-import math
+from app.utils.pagination import PageParams, page_params, paginate
 
 @router.post("/create", response_model=APIResponse[UOMResponse])
 def add_uom(
@@ -38,39 +37,19 @@ def add_uom(
 
 @router.get("/list", response_model=PaginatedAPIResponse[List[UOMResponse]])
 def list_uoms(
-    page: int = Query(1, ge=1),
-    limit: int = Query(10, ge=1),
-    db: Session = Depends(get_db),
+    params: PageParams = Depends(page_params),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ):
     try:
-        # -------------------------------
-        # Pagination calculation
-        # -------------------------------
-        offset = (page - 1) * limit
-
         # -------------------------------
         # Base query (soft delete aware)
         # -------------------------------
         base_query = db.query(UOM).filter(
             UOM.is_delete == False
-        ).order_by(UOM.created_at.desc())
-
-        total_records = base_query.count()
+        )
 
-        uoms = base_query.offset(offset).limit(limit).all()
-
-        # -------------------------------
-        # Pagination metadata
-        # -------------------------------
-        total_pages = math.ceil(total_records / limit) if limit else 1
-
-        pagination = {
-            "total": total_records,
-            "per_page": limit,
-            "current_page": page,
-            "total_pages": total_pages,
-        }
+        uoms, pagination = paginate(base_query, UOM, params)
 
         # -------------------------------
         # Response
@@ -97,8 +76,8 @@ def list_uoms(
             "data": [],
             "pagination": {
                 "total": 0,
-                "per_page": limit,
-                "current_page": page,
+                "per_page": params.limit,
+                "current_page": params.page,
                 "total_pages": 0
             }
         }
@@ -2,7 +2,7 @@ from fastapi import APIRouter, Depends, status, UploadFile, File
 from sqlalchemy.orm import Session
 from typing import List
 
-from app.api.dependencies import get_db
+from app.api.dependencies import get_db, get_read_db
 from app.schemas.user import UserCreate, UserResponse
 from app.schemas.response import APIResponse,PaginatedAPIResponse
 from app.services.user_service import create_user, get_users
@@ -20,8 +20,7 @@ router = APIRouter()
 
 
 # Pagination
-from fastapi import Query
-import math
+from app.utils.pagination import PageParams, page_params, paginate
 
 
 @router.post("/create",response_model=APIResponse[UserResponse])
@@ -41,41 +40,20 @@ def add_user(
 
 @router.get("/list",response_model=PaginatedAPIResponse[List[UserResponse]])
 def list_users(
-    page: int = Query(1, ge=1),
-    limit: int = Query(10, ge=1),
-    db: Session = Depends(get_db),
+    params: PageParams = Depends(page_params),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ):
     
     try:
-        # -------------------------------
-        # Pagination inputs (Django style)
-        # -------------------------------
-        offset = (page - 1) * limit
-
         # -------------------------------
         # Base filters (soft delete aware)
         # -------------------------------
         base_query = db.query(User).filter(
             User.is_delete == False
-        ).order_by(User.created_at.desc())
-
-        total_records = base_query.count()
-
-        users = base_query.offset(offset).limit(limit).all()
+        )
 
-
-        # -------------------------------
-        # Pagination info
-        # -------------------------------
-        total_pages = math.ceil(total_records / limit) if limit else 1
-
-        pagination = {
-            "total": total_records,
-            "per_page": limit,
-            "current_page": page,
-            "total_pages": total_pages,
-        }
+        users, pagination = paginate(base_query, User, params)
 
         # -------------------------------
         # Response
@@ -1,6 +1,6 @@
 from fastapi import APIRouter, Depends,Query
 from sqlalchemy.orm import Session
-from app.api.dependencies import get_db
+from app.api.dependencies import get_db, get_read_db
 from app.schemas.zone import ZoneCreate, ZoneUpdate, ZoneResponse
 from app.services.zone_service import (
     create_zone,
@@ -32,7 +32,7 @@ def create(
 
 @router.get("/list", response_model=APIResponse[list[ZoneResponse]])
 def list_zones(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ):
     zones = get_zones(db)
@@ -78,7 +78,7 @@ def delete_zone_api(
 def list_zones_by_lat_lng(
     lat: float = Query(..., description="Latitude"),
     lng: float = Query(..., description="Longitude"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ):
     zones = get_zones_by_lat_lng(db, lat, lng)
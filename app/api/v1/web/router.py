@@ -1,6 +1,7 @@
 from fastapi import APIRouter
 from app.api.v1.web.routes import auth,web_categories,web_products
 from app.api.v1.web.routes import auth,web_slider
+from app.api.v1.web.routes import web_zones, web_catalog, web_suggestions
 
 router = APIRouter(prefix="/web", tags=["Web"])
 
@@ -15,4 +16,6 @@ router.include_router(
     prefix="/products",
 )
 router.include_router(web_slider.router, prefix="/web_slider")
-
+router.include_router(web_zones.router, prefix="/zones")
+router.include_router(web_catalog.router, prefix="/catalog")
+router.include_router(web_suggestions.router, prefix="/suggestions")
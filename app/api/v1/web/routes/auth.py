@@ -33,8 +33,8 @@ router = APIRouter()
 
 
 @router.post("/send-otp", response_model=APIResponse[dict])
-def request_otp(payload: MobileSignInRequest, db: Session = Depends(get_db)):
-    otp_entry = send_otp(db, payload.mobile)
+def request_otp(payload: MobileSignInRequest):
+    otp_entry = send_otp(payload.mobile)
 
     return {
         "status": 200,
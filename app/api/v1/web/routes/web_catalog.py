@@ -0,0 +1,57 @@
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import Response
+from sqlalchemy.orm import Session
+from typing import Optional
+
+from app.api.dependencies import get_db
+from app.core.exceptions import AppException
+from app.services.catalog_snapshot_service import get_catalog_snapshot
+from app.services.zone_service import resolve_zone_ids
+from app.utils.conditional import not_modified, validator_headers
+
+router = APIRouter()
+
+
+@router.get("/snapshot")
+def catalog_snapshot_web(
+    request: Request,
+    zone_id: Optional[int] = Query(None),
+    lat: Optional[float] = Query(None, description="Latitude"),
+    lng: Optional[float] = Query(None, description="Longitude"),
+    # Primary: a rebuild must not read from a lagging replica
+    db: Session = Depends(get_db)
+):
+    """
+    Whole storefront catalog of one zone, pre-serialized:
+    main categories → categories → sub categories → products
+    (images + zone variants)
+    """
+    if zone_id is None:
+        if lat is None or lng is None:
+            raise AppException(status=400, message="zone_id or both lat and lng are required")
+
+        zone_ids = resolve_zone_ids(db, [(lat, lng)])[0]
+        if not zone_ids:
+            raise AppException(status=404, message="No zone found for this location")
+
+        zone_id = zone_ids[0]
+
+    payload, etag = get_catalog_snapshot(db, zone_id)
+    etag = f'"{etag}"'
+
+    unchanged = not_modified(request, etag, None)
+    if unchanged:
+        return unchanged
+
+    # Envelope around the stored JSON, no re-serialization
+    body = (
+        '{"status":200,"message":"Catalog fetched successfully","data":'
+        + payload
+        + "}"
+    )
+
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers=validator_headers(etag, None)
+    )
@@ -1,51 +1,50 @@
-from fastapi import APIRouter, Depends, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, Request
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
-import math
 
-from app.api.dependencies import get_db
+from app.api.dependencies import get_async_read_db
 from app.models.category import Category
 from app.schemas.category import CategoryResponse
 from app.schemas.response import PaginatedAPIResponse
+from app.utils.pagination import PageParams, page_params, paginate_async, COUNT_ESTIMATE
+from app.core.cache import cached_json_response_async, CATALOG_CATEGORIES
+from app.utils.conditional import catalog_validator_async
 
 router = APIRouter()
 
 
 @router.get("/list", response_model=PaginatedAPIResponse[List[CategoryResponse]])
-def list_categories_web(
-    page: int = Query(1, ge=1),
-    limit: int = Query(10, ge=1),
-    db: Session = Depends(get_db)
+async def list_categories_web(
+    request: Request,
+    params: PageParams = Depends(page_params),
+    db: AsyncSession = Depends(get_async_read_db)
 ):
-    # -------------------------------
-    # Pagination calculation
-    # -------------------------------
-    offset = (page - 1) * limit
-
     # -------------------------------
     # Base query (WEB filters)
     # -------------------------------
-    base_query = db.query(Category).filter(
+    base_query = select(Category).where(
         Category.is_delete == False,
         Category.is_active == True
-    ).order_by(Category.created_at.desc())
-
-    total_records = base_query.count()
-
-    categories = base_query.offset(offset).limit(limit).all()
-
-    total_pages = math.ceil(total_records / limit) if limit else 1
-
-    pagination = {
-        "total": total_records,
-        "per_page": limit,
-        "current_page": page,
-        "total_pages": total_pages
-    }
-
-    return {
-        "status": 200,
-        "message": "Categories fetched successfully",
-        "data": categories,
-        "pagination": pagination
-    }
+    )
+
+    # 304 when the client already has this version, before any row is read
+    validator = await catalog_validator_async(db, request, [(base_query, Category)])
+
+    async def build():
+        categories, pagination = await paginate_async(db, base_query, Category, params, count=COUNT_ESTIMATE)
+
+        return {
+            "status": 200,
+            "message": "Categories fetched successfully",
+            "data": categories,
+            "pagination": pagination
+        }
+
+    return await cached_json_response_async(
+        CATALOG_CATEGORIES,
+        request,
+        PaginatedAPIResponse[List[CategoryResponse]],
+        build,
+        validator
+    )
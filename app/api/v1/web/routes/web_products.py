@@ -1,61 +1,127 @@
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
-import math
 
-from app.api.dependencies import get_db
-from app.models.product import Product
-from app.schemas.product import ProductResponse
-from app.schemas.response import PaginatedAPIResponse
+from app.api.dependencies import get_async_read_db, get_read_db
+from app.core.exceptions import AppException
+from app.schemas.product import WebProductResponse
+from app.schemas.response import APIResponse, PaginatedAPIResponse
+from app.services.web_product_service import (
+    list_products_for_web_async,
+    web_products_validator_sources
+)
+from app.services.search_service import search_products
+from app.services.zone_service import resolve_zone_ids, resolve_zone_ids_async
+from app.utils.pagination import PageParams, page_params, COUNT_WINDOW
+from app.core.cache import cached_json_response_async, CATALOG_PRODUCTS
+from app.utils.conditional import catalog_validator_async
 
 router = APIRouter()
 
 
 @router.get(
     "/list",
-    response_model=PaginatedAPIResponse[List[ProductResponse]]
+    response_model=PaginatedAPIResponse[List[WebProductResponse]]
 )
-def list_products_web(
-    page: int = Query(1, ge=1),
-    limit: int = Query(10, ge=1),
+async def list_products_web(
+    request: Request,
+    params: PageParams = Depends(page_params),
     category_id: Optional[int] = Query(None),
     sub_category_id: Optional[int] = Query(None),
-    db: Session = Depends(get_db)
+    zone_id: Optional[int] = Query(None),
+    lat: Optional[float] = Query(None, description="Latitude"),
+    lng: Optional[float] = Query(None, description="Longitude"),
+    db: AsyncSession = Depends(get_async_read_db)
 ):
-    offset = (page - 1) * limit
+    # -------------------------------
+    # Zone (explicit id or lat/lng)
+    # -------------------------------
+    zone_ids = None
+
+    if zone_id is not None:
+        zone_ids = [zone_id]
+    elif lat is not None or lng is not None:
+        if lat is None or lng is None:
+            raise AppException(status=400, message="Both lat and lng are required")
 
-    query = db.query(Product).filter(
-        Product.is_delete == False,
-        Product.is_active == True
+        zone_ids = (await resolve_zone_ids_async(db, [(lat, lng)]))[0]
+
+    # 304 when the client already has this version, before any row is read
+    validator = await catalog_validator_async(
+        db,
+        request,
+        web_products_validator_sources(category_id, sub_category_id, zone_ids)
     )
 
-    # 🔍 Optional filters
-    if category_id:
-        query = query.filter(Product.category_id == category_id)
+    async def build():
+        products, pagination = await list_products_for_web_async(
+            db,
+            params,
+            category_id=category_id,
+            sub_category_id=sub_category_id,
+            zone_ids=zone_ids,
+            count=COUNT_WINDOW  # total comes with the page, no extra COUNT(*)
+        )
 
-    if sub_category_id:
-        query = query.filter(Product.sub_category_id == sub_category_id)
+        return {
+            "status": 200,
+            "message": "Products fetched successfully",
+            "data": products,
+            "pagination": pagination
+        }
 
-    total_records = query.count()
+    # Cache per resolved zone, not per raw coordinate
+    key_params = [
+        (k, v) for k, v in request.query_params.multi_items()
+        if k not in ("lat", "lng", "zone_id")
+    ]
+    if zone_ids is not None:
+        key_params.append(("zone_ids", ",".join(map(str, zone_ids))))
 
-    products = (
-        query
-        .order_by(Product.created_at.desc())
-        .offset(offset)
-        .limit(limit)
-        .all()
+    return await cached_json_response_async(
+        CATALOG_PRODUCTS,
+        request,
+        PaginatedAPIResponse[List[WebProductResponse]],
+        build,
+        validator,
+        key_params=key_params
     )
 
-    total_pages = math.ceil(total_records / limit) if limit else 1
+
+@router.get(
+    "/search",
+    response_model=APIResponse[List[WebProductResponse]]
+)
+def search_products_web(
+    q: str = Query(..., min_length=1, max_length=100),
+    limit: int = Query(20, ge=1, le=50),
+    category_id: Optional[int] = Query(None),
+    zone_id: Optional[int] = Query(None),
+    lat: Optional[float] = Query(None, description="Latitude"),
+    lng: Optional[float] = Query(None, description="Longitude"),
+    db: Session = Depends(get_read_db)
+):
+    zone_ids = None
+
+    if zone_id is not None:
+        zone_ids = [zone_id]
+    elif lat is not None or lng is not None:
+        if lat is None or lng is None:
+            raise AppException(status=400, message="Both lat and lng are required")
+
+        zone_ids = resolve_zone_ids(db, [(lat, lng)])[0]
+
+    products = search_products(
+        db,
+        q,
+        limit,
+        category_id=category_id,
+        zone_ids=zone_ids
+    )
 
     return {
         "status": 200,
         "message": "Products fetched successfully",
-        "data": products,
-        "pagination": {
-            "total": total_records,
-            "per_page": limit,
-            "current_page": page,
-            "total_pages": total_pages
-        }
+        "data": products
     }
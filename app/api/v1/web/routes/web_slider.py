@@ -1,53 +1,63 @@
-from fastapi import APIRouter, Depends, Query
-from sqlalchemy.orm import Session
-import math
+from fastapi import APIRouter, Depends, Request
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.dependencies import get_db
+from app.api.dependencies import get_async_read_db
 from app.schemas.slider import SliderResponse
 from app.schemas.response import PaginatedAPIResponse
-from app.services.web_slider_service import list_sliders  
+from app.services.web_slider_service import list_sliders_async, web_sliders_statement
+from app.models.slider import Slider
+from app.utils.pagination import PageParams, page_params, COUNT_ESTIMATE
+from app.core.cache import cached_json_response_async, CATALOG_SLIDERS
+from app.utils.conditional import catalog_validator_async
 
 router = APIRouter()
 
 
 @router.get("/list", response_model=PaginatedAPIResponse[list[SliderResponse]])
-def list_web_sliders(
-    page: int = Query(1, ge=1),
-    limit: int = Query(10, ge=1),
-    db: Session = Depends(get_db),
+async def list_web_sliders(
+    request: Request,
+    params: PageParams = Depends(page_params),
+    db: AsyncSession = Depends(get_async_read_db),
 ):
-    try:
-        offset = (page - 1) * limit
+    async def build():
+        try:
+            sliders, pagination = await list_sliders_async(db, params, count=COUNT_ESTIMATE)
+
+            if sliders:
+                return {
+                    "status": 200,
+                    "message": "Sliders fetched successfully",
+                    "data": sliders,
+                    "pagination": pagination
+                }
 
-        total_records, sliders = list_sliders(db, offset, limit)
-
-        total_pages = math.ceil(total_records / limit) if limit else 1
-
-        pagination = {
-            "total": total_records,
-            "per_page": limit,
-            "current_page": page,
-            "total_pages": total_pages,
-        }
-
-        if sliders:
             return {
-                "status": 200,
-                "message": "Sliders fetched successfully",
-                "data": sliders,
+                "status": 300,
+                "message": "No sliders found",
+                "data": [],
                 "pagination": pagination
             }
 
-        return {
-            "status": 300,
-            "message": "No sliders found",
-            "data": [],
-            "pagination": pagination
-        }
-
-    except Exception:
-        return {
-            "status": 500,
-            "message": "Failed to fetch sliders",
-            "data": [],
-        }
+        except Exception:
+            return {
+                "status": 500,
+                "message": "Failed to fetch sliders",
+                "data": [],
+                "pagination": {
+                    "total": 0,
+                    "per_page": params.limit,
+                    "current_page": params.page,
+                    "total_pages": 0
+                }
+            }
+
+    # 304 when the client already has this version, before any row is read
+    validator = await catalog_validator_async(db, request, [(web_sliders_statement(), Slider)])
+
+    return await cached_json_response_async(
+        CATALOG_SLIDERS,
+        request,
+        PaginatedAPIResponse[list[SliderResponse]],
+        build,
+        validator
+    )
@@ -0,0 +1,26 @@
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List
+
+from app.api.dependencies import get_async_read_db
+from app.schemas.response import APIResponse
+from app.schemas.suggestion import SuggestionResponse
+from app.services.suggest_service import suggest_async
+
+router = APIRouter()
+
+
+@router.get("/list", response_model=APIResponse[List[SuggestionResponse]])
+async def list_suggestions_web(
+    q: str = Query(..., min_length=1, max_length=100),
+    limit: int = Query(10, ge=1, le=20),
+    db: AsyncSession = Depends(get_async_read_db)
+):
+    # Served from memory, the database is only read on (re)build
+    suggestions = await suggest_async(db, q, limit)
+
+    return {
+        "status": 200,
+        "message": "Suggestions fetched successfully",
+        "data": suggestions
+    }
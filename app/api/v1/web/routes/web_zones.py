@@ -0,0 +1,30 @@
+from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List
+
+from app.api.dependencies import get_async_read_db
+from app.schemas.response import APIResponse
+from app.schemas.web_zone import ZoneResolveRequest, ZoneResolveItem
+from app.services.zone_service import resolve_zone_ids_async
+
+router = APIRouter()
+
+
+@router.post("/resolve", response_model=APIResponse[List[ZoneResolveItem]])
+async def resolve_zones_web(
+    payload: ZoneResolveRequest,
+    db: AsyncSession = Depends(get_async_read_db)
+):
+    points = [(p.lat, p.lng) for p in payload.points]
+
+    # One zone snapshot for the whole batch
+    zone_ids = await resolve_zone_ids_async(db, points)
+
+    return {
+        "status": 200,
+        "message": "Zones resolved successfully",
+        "data": [
+            {"lat": lat, "lng": lng, "zone_ids": ids}
+            for (lat, lng), ids in zip(points, zone_ids)
+        ]
+    }
@@ -0,0 +1,232 @@
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Awaitable, Callable
+
+from fastapi import Request
+from fastapi.responses import Response
+
+from app.utils.conditional import not_modified, validator_headers
+from app.core.config import (
+    CACHE_BACKEND,
+    CACHE_REDIS_URL,
+    CACHE_TTL_SECONDS,
+    CACHE_MAX_ENTRIES,
+)
+
+
+# -------------------------------
+# Cache namespaces (storefront)
+# -------------------------------
+CATALOG_CATEGORIES = "categories"
+CATALOG_PRODUCTS = "products"
+CATALOG_SLIDERS = "sliders"
+
+
+# =========================
+# BACKENDS
+# =========================
+class MemoryCacheBackend:
+    """
+    In-process TTL + LRU store (per worker). invalidate_cache() only
+    reaches the worker that ran the write, use Redis with several workers.
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._data: "OrderedDict[str, tuple[float, bytes]]" = OrderedDict()
+        # Namespace versions are never evicted
+        self._counters: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> bytes | None:
+        with self._lock:
+            if key in self._counters:
+                return str(self._counters[key]).encode()
+
+            hit = self._data.get(key)
+            if hit is None:
+                return None
+
+            expires_at, value = hit
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return None
+
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: bytes, ttl: int):
+        with self._lock:
+            self._data[key] = (time.monotonic() + ttl, value)
+            self._data.move_to_end(key)
+
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def incr(self, key: str) -> int:
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + 1
+            return self._counters[key]
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self._counters.clear()
+
+
+class RedisCacheBackend:
+    """
+    Shared store for all workers.
+
+    `client` is anything speaking the redis-py API
+    (get / set(ex=) / incr), e.g. redis.Redis or a local stand-in.
+    Size bound is left to the server (maxmemory + LRU policy).
+    Calls block, async routes make them through asyncio.to_thread.
+    """
+
+    blocking = True
+
+    def __init__(self, client, prefix: str = "myvegiz:cache:"):
+        self.client = client
+        self.prefix = prefix
+
+    def get(self, key: str) -> bytes | None:
+        value = self.client.get(self.prefix + key)
+        if isinstance(value, str):
+            value = value.encode()
+        return value
+
+    def set(self, key: str, value: bytes, ttl: int):
+        self.client.set(self.prefix + key, value, ex=ttl)
+
+    def incr(self, key: str) -> int:
+        return int(self.client.incr(self.prefix + key))
+
+    def clear(self):
+        pass
+
+
+def _build_backend():
+    if CACHE_BACKEND == "redis":
+        if not CACHE_REDIS_URL:
+            raise RuntimeError("CACHE_BACKEND=redis needs CACHE_REDIS_URL")
+
+        import redis  # optional dependency, see requirements-redis.txt
+
+        return RedisCacheBackend(redis.Redis.from_url(CACHE_REDIS_URL))
+
+    return MemoryCacheBackend(max_entries=CACHE_MAX_ENTRIES)
+
+
+_backend = _build_backend()
+
+
+def get_cache_backend():
+    return _backend
+
+
+def set_cache_backend(backend):
+    global _backend
+    _backend = backend
+
+
+# =========================
+# NAMESPACE VERSIONING
+# =========================
+# Keys embed the namespace version, so invalidation is a single INCR
+# and old entries just age out through their TTL.
+def _version_key(namespace: str) -> str:
+    return f"version:{namespace}"
+
+
+def _namespace_version(namespace: str) -> int:
+    value = _backend.get(_version_key(namespace))
+    return int(value) if value else 0
+
+
+def invalidate_cache(*namespaces: str):
+    for namespace in namespaces:
+        try:
+            _backend.incr(_version_key(namespace))
+        except Exception:
+            # Cache outage must never break an admin write
+            pass
+
+
+def cache_key(namespace: str, request: Request, key_params: list | None = None) -> str:
+    items = key_params if key_params is not None else request.query_params.multi_items()
+    query = "&".join(f"{k}={v}" for k, v in sorted(items))
+    version = _namespace_version(namespace)
+    return f"{namespace}:v{version}:{request.url.path}?{query}"
+
+
+# =========================
+# READ-THROUGH RESPONSE
+# =========================
+# `validator` = catalog_validator_async() of the request, computed from
+# the database before anything else: a 304 never runs build(), and the
+# ETag is part of the key, so a cached body is only ever served under
+# the validator of the data it was built from (on any worker).
+async def cached_json_response_async(
+    namespace: str,
+    request: Request,
+    response_model,
+    build: Callable[[], Awaitable[dict]],
+    validator: tuple[str, datetime | None],
+    ttl: int = CACHE_TTL_SECONDS,
+    key_params: list | None = None,
+) -> Response:
+    """
+    Serves the serialized body of `await build()` from cache, keyed by
+    path + query params (or `key_params` when given) + ETag, with
+    ETag / Last-Modified and 304s.
+    """
+    etag, last_modified = validator
+
+    unchanged = not_modified(request, etag, last_modified)
+    if unchanged:
+        return unchanged
+
+    key, body = await _lookup(namespace, request, key_params, etag)
+
+    if body is not None:
+        cache_status = "HIT"
+    else:
+        cache_status = "MISS"
+        body = await _store(key, await build(), response_model, ttl)
+
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers={**validator_headers(etag, last_modified), "X-Cache": cache_status}
+    )
+
+
+async def _call(fn, *args):
+    # Network backends run off the event loop
+    if getattr(_backend, "blocking", False):
+        return await asyncio.to_thread(fn, *args)
+    return fn(*args)
+
+
+async def _lookup(namespace: str, request: Request, key_params: list | None, etag: str) -> tuple[str | None, bytes | None]:
+    try:
+        key = f"{await _call(cache_key, namespace, request, key_params)}|{etag}"
+        return key, await _call(_backend.get, key)
+    except Exception:
+        return None, None
+
+
+async def _store(key: str | None, data: dict, response_model, ttl: int) -> bytes:
+    body = response_model.model_validate(data, from_attributes=True).model_dump_json().encode()
+
+    if key is not None and data.get("status", 200) < 500:
+        try:
+            await _call(_backend.set, key, body, ttl)
+        except Exception:
+            pass
+
+    return body
@@ -11,6 +11,104 @@ DATABASE_URL = (
     f"{os.getenv('DB_NAME')}"
 )
 
+# Same database through asyncpg (async read paths)
+ASYNC_DATABASE_URL = os.getenv(
+    "ASYNC_DATABASE_URL",
+    DATABASE_URL.replace("postgresql://", "postgresql+asyncpg://", 1)
+)
+
+# Optional read replica (catalog / list reads), unset → primary
+DATABASE_REPLICA_URL = os.getenv("DATABASE_REPLICA_URL")
+ASYNC_DATABASE_REPLICA_URL = os.getenv(
+    "ASYNC_DATABASE_REPLICA_URL",
+    DATABASE_REPLICA_URL.replace("postgresql://", "postgresql+asyncpg://", 1)
+    if DATABASE_REPLICA_URL else None
+)
+
+# Connection pool (per engine, per worker)
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+# Seconds before a connection is replaced (-1 = never)
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+# true → SELECT 1 on every checkout, false → rely on DB_POOL_RECYCLE
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
+
 CLOUDINARY_CLOUD_NAME = os.getenv("CLOUDINARY_CLOUD_NAME")
 CLOUDINARY_API_KEY = os.getenv("CLOUDINARY_API_KEY")
 CLOUDINARY_API_SECRET = os.getenv("CLOUDINARY_API_SECRET")
+
+# Zone lookup (in-process spatial index)
+ZONE_INDEX_CELL_SIZE = float(os.getenv("ZONE_INDEX_CELL_SIZE", "0.05"))
+ZONE_INDEX_TTL_SECONDS = int(os.getenv("ZONE_INDEX_TTL_SECONDS", "60"))
+ZONE_POLYGON_CACHE_SIZE = int(os.getenv("ZONE_POLYGON_CACHE_SIZE", "2048"))
+
+# "python"  → in-process index + ray casting (default)
+# "postgis" → ST_Contains on zones.geom (needs the PostGIS migration)
+ZONE_LOOKUP_MODE = os.getenv("ZONE_LOOKUP_MODE", "python").lower()
+
+# Pagination totals (COUNT_ESTIMATE mode)
+PAGINATION_COUNT_CACHE_TTL = int(os.getenv("PAGINATION_COUNT_CACHE_TTL", "30"))
+PAGINATION_COUNT_CACHE_SIZE = int(os.getenv("PAGINATION_COUNT_CACHE_SIZE", "1024"))
+
+# Storefront response cache
+# "redis"  → shared by every worker, admin writes invalidate it for all
+#            (default when CACHE_REDIS_URL is set, needs requirements-redis.txt)
+# "memory" → per worker: a write only drops this worker's entries, the
+#            others keep theirs until CACHE_TTL_SECONDS (responses stay
+#            correct, entries are keyed by the database validator)
+CACHE_REDIS_URL = os.getenv("CACHE_REDIS_URL")
+CACHE_BACKEND = os.getenv("CACHE_BACKEND", "redis" if CACHE_REDIS_URL else "memory").lower()
+CACHE_TTL_SECONDS = int(os.getenv("CACHE_TTL_SECONDS", "60"))
+CACHE_MAX_ENTRIES = int(os.getenv("CACHE_MAX_ENTRIES", "2048"))
+
+# Catalog import (rows per transaction, errors kept in the report)
+IMPORT_BATCH_SIZE = int(os.getenv("IMPORT_BATCH_SIZE", "500"))
+IMPORT_MAX_ERRORS = int(os.getenv("IMPORT_MAX_ERRORS", "1000"))
+
+# Catalog export (rows fetched per server-side cursor round-trip)
+EXPORT_YIELD_PER = int(os.getenv("EXPORT_YIELD_PER", "1000"))
+
+# Per-zone catalog snapshot, rebuilt at least this often (seconds)
+CATALOG_SNAPSHOT_MAX_AGE = int(os.getenv("CATALOG_SNAPSHOT_MAX_AGE", "3600"))
+# A rebuild claim older than this is taken over (builder crashed)
+CATALOG_SNAPSHOT_REBUILD_LEASE = int(os.getenv("CATALOG_SNAPSHOT_REBUILD_LEASE", "60"))
+
+# Product search
+# "python"   → in-process trigram index (default)
+# "postgres" → pg_trgm word_similarity (needs the pg_trgm migration)
+SEARCH_MODE = os.getenv("SEARCH_MODE", "python").lower()
+SEARCH_INDEX_TTL_SECONDS = int(os.getenv("SEARCH_INDEX_TTL_SECONDS", "300"))
+SEARCH_MIN_SIMILARITY = float(os.getenv("SEARCH_MIN_SIMILARITY", "0.3"))
+# Ranked matches per zone / category filter query (first batch,
+# later batches grow until the page is filled)
+SEARCH_MAX_CANDIDATES = int(os.getenv("SEARCH_MAX_CANDIDATES", "500"))
+
+# Autocomplete (product + category names), full rebuild interval
+SUGGEST_INDEX_TTL_SECONDS = int(os.getenv("SUGGEST_INDEX_TTL_SECONDS", "300"))
+
+# Seconds between reloads of revoked token ids from token_blacklist
+REVOCATION_SYNC_SECONDS = float(os.getenv("REVOCATION_SYNC_SECONDS", "5"))
+
+# Authenticated user lookups in get_current_user
+AUTH_USER_CACHE_TTL_SECONDS = float(os.getenv("AUTH_USER_CACHE_TTL_SECONDS", "30"))
+AUTH_USER_CACHE_SIZE = int(os.getenv("AUTH_USER_CACHE_SIZE", "1024"))
+
+# Password hashing (bcrypt cost, hashes are upgraded on next login)
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", str(os.cpu_count() or 2)))
+PASSWORD_HASH_MAX_PENDING = int(os.getenv("PASSWORD_HASH_MAX_PENDING", "32"))
+PASSWORD_HASH_WAIT_SECONDS = float(os.getenv("PASSWORD_HASH_WAIT_SECONDS", "5"))
+
+# Expired token_blacklist rows, deleted in batches by a background job
+TOKEN_PURGE_INTERVAL_SECONDS = float(os.getenv("TOKEN_PURGE_INTERVAL_SECONDS", "3600"))
+TOKEN_PURGE_BATCH_SIZE = int(os.getenv("TOKEN_PURGE_BATCH_SIZE", "1000"))
+
+# OTP store (must be shared by every worker)
+# "sql"    → mobile_otp table (default)
+# "redis"  → OTP_REDIS_URL
+# "memory" → per process, single-worker dev only
+OTP_BACKEND = os.getenv("OTP_BACKEND", "sql").lower()
+OTP_REDIS_URL = os.getenv("OTP_REDIS_URL", CACHE_REDIS_URL)
+OTP_TTL_SECONDS = int(os.getenv("OTP_TTL_SECONDS", "600"))
+OTP_MAX_ENTRIES = int(os.getenv("OTP_MAX_ENTRIES", "100000"))
@@ -0,0 +1,63 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from app.core.exceptions import AppException
+
+
+class HashPool:
+    """
+    Bounded pool for password hashing (bcrypt releases the GIL,
+    so threads run in parallel).
+
+    At most `workers` hashes run at once and `max_pending` more may
+    wait. Past that a caller waits up to `wait_seconds` for a slot,
+    then gets a 503 instead of piling more work on the worker.
+    """
+
+    def __init__(self, workers: int, max_pending: int, wait_seconds: float):
+        self.wait_seconds = wait_seconds
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="password-hash")
+        self._slots = threading.BoundedSemaphore(workers + max_pending)
+
+    def _busy(self):
+        return AppException(status=503, message="Server is busy, please try again")
+
+    def _submit(self, fn, *args):
+        future = self._executor.submit(fn, *args)
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+    def _release_unused(self, waiter: asyncio.Future):
+        if not waiter.cancelled() and waiter.exception() is None and waiter.result():
+            self._slots.release()
+
+    def run(self, fn, *args):
+        """
+        Blocking call, for sync routes (already in a threadpool)
+        """
+        if not self._slots.acquire(timeout=self.wait_seconds):
+            raise self._busy()
+
+        return self._submit(fn, *args).result()
+
+    async def run_async(self, fn, *args):
+        """
+        Awaitable call, the event loop never runs bcrypt itself
+        """
+        if not self._slots.acquire(blocking=False):
+            waiter = asyncio.ensure_future(
+                asyncio.to_thread(self._slots.acquire, True, self.wait_seconds)
+            )
+            try:
+                # shield: the thread keeps waiting even if we are cancelled
+                acquired = await asyncio.shield(waiter)
+            except asyncio.CancelledError:
+                # e.g. client gone: a slot it still gets goes straight back
+                waiter.add_done_callback(self._release_unused)
+                raise
+
+            if not acquired:
+                raise self._busy()
+
+        return await asyncio.wrap_future(self._submit(fn, *args))
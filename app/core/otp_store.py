@@ -0,0 +1,208 @@
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import NamedTuple
+
+from app.core.config import (
+    OTP_BACKEND,
+    OTP_REDIS_URL,
+    OTP_MAX_ENTRIES,
+)
+
+
+class OTPEntry(NamedTuple):
+    mobile: str
+    otp: str
+    expires_in: int  # seconds
+
+
+# verify() results
+OTP_OK = "ok"
+OTP_MISSING = "missing"    # never sent, expired or already used
+OTP_MISMATCH = "mismatch"
+
+
+# =========================
+# BACKENDS
+# =========================
+# Every backend: issue() keeps an OTP that is still valid (resend),
+# verify() consumes it exactly once.
+class MemoryOTPStore:
+    """
+    In-process TTL store (per worker: single-process dev only)
+    """
+
+    def __init__(self, max_entries: int = 100_000):
+        self.max_entries = max_entries
+        self._data: dict[str, tuple[float, str]] = {}
+        self._lock = threading.Lock()
+
+    def _live(self, mobile: str, now: float) -> tuple[float, str] | None:
+        hit = self._data.get(mobile)
+        if hit is not None and hit[0] <= now:
+            del self._data[mobile]
+            return None
+        return hit
+
+    def issue(self, mobile: str, otp: str, ttl: int) -> OTPEntry:
+        now = time.monotonic()
+
+        with self._lock:
+            hit = self._live(mobile, now)
+            if hit is None:
+                if len(self._data) >= self.max_entries:
+                    self._evict(now)
+                hit = (now + ttl, otp)
+                self._data[mobile] = hit
+
+            return OTPEntry(mobile, hit[1], int(hit[0] - now))
+
+    def _evict(self, now: float):
+        self._data = {k: v for k, v in self._data.items() if v[0] > now}
+
+        # Still full: drop the ones closest to expiry
+        overflow = len(self._data) - self.max_entries + 1
+        if overflow > 0:
+            for mobile in sorted(self._data, key=lambda k: self._data[k][0])[:overflow]:
+                del self._data[mobile]
+
+    def verify(self, mobile: str, otp: str) -> str:
+        with self._lock:
+            hit = self._live(mobile, time.monotonic())
+            if hit is None:
+                return OTP_MISSING
+            if hit[1] != otp:
+                return OTP_MISMATCH
+
+            del self._data[mobile]
+            return OTP_OK
+
+
+class RedisOTPStore:
+    """
+    Shared store for all workers, expiry is Redis' own TTL.
+
+    `client` is anything speaking the redis-py API
+    (get / set(nx=, ex=) / ttl / delete), e.g. redis.Redis
+    or a local stand-in.
+    """
+
+    def __init__(self, client, prefix: str = "myvegiz:otp:"):
+        self.client = client
+        self.prefix = prefix
+
+    @staticmethod
+    def _text(value) -> str | None:
+        return value.decode() if isinstance(value, bytes) else value
+
+    def issue(self, mobile: str, otp: str, ttl: int) -> OTPEntry:
+        key = self.prefix + mobile
+
+        # NX: a concurrent request keeps the OTP that won
+        if self.client.set(key, otp, nx=True, ex=ttl):
+            return OTPEntry(mobile, otp, ttl)
+
+        current = self._text(self.client.get(key))
+        if current is None:
+            # Expired in between
+            self.client.set(key, otp, ex=ttl)
+            return OTPEntry(mobile, otp, ttl)
+
+        return OTPEntry(mobile, current, max(int(self.client.ttl(key)), 0))
+
+    def verify(self, mobile: str, otp: str) -> str:
+        key = self.prefix + mobile
+
+        current = self._text(self.client.get(key))
+        if current is None:
+            return OTP_MISSING
+        if current != otp:
+            return OTP_MISMATCH
+
+        # Only the request that deletes the key gets through
+        return OTP_OK if self.client.delete(key) else OTP_MISSING
+
+
+class SQLOTPStore:
+    """
+    Durable fallback on the mobile_otp table
+    """
+
+    def __init__(self, session_factory):
+        self.session_factory = session_factory
+
+    def issue(self, mobile: str, otp: str, ttl: int) -> OTPEntry:
+        from app.models.otp import MobileOTP
+
+        now = datetime.now(timezone.utc)
+
+        with self.session_factory() as db:
+            existing = (
+                db.query(MobileOTP)
+                .filter(MobileOTP.mobile == mobile, MobileOTP.expires_at > now)
+                .order_by(MobileOTP.created_at.desc())
+                .first()
+            )
+            if existing:
+                return OTPEntry(mobile, existing.otp, int((existing.expires_at - now).total_seconds()))
+
+            # Expired rows of this number go in the same transaction
+            db.query(MobileOTP).filter(
+                MobileOTP.mobile == mobile,
+                MobileOTP.expires_at <= now
+            ).delete(synchronize_session=False)
+
+            db.add(MobileOTP(mobile=mobile, otp=otp, expires_at=now + timedelta(seconds=ttl)))
+            db.commit()
+
+        return OTPEntry(mobile, otp, ttl)
+
+    def verify(self, mobile: str, otp: str) -> str:
+        from app.models.otp import MobileOTP
+
+        now = datetime.now(timezone.utc)
+
+        with self.session_factory() as db:
+            entry = (
+                db.query(MobileOTP)
+                .filter(MobileOTP.mobile == mobile, MobileOTP.expires_at > now)
+                .order_by(MobileOTP.created_at.desc())
+                .first()
+            )
+            if entry is None:
+                return OTP_MISSING
+            if entry.otp != otp:
+                return OTP_MISMATCH
+
+            deleted = db.query(MobileOTP).filter(
+                MobileOTP.id == entry.id
+            ).delete(synchronize_session=False)
+            db.commit()
+
+        return OTP_OK if deleted else OTP_MISSING
+
+
+def _build_store():
+    if OTP_BACKEND == "redis" and OTP_REDIS_URL:
+        import redis  # optional dependency, see requirements-redis.txt
+
+        return RedisOTPStore(redis.Redis.from_url(OTP_REDIS_URL))
+
+    if OTP_BACKEND == "memory":
+        return MemoryOTPStore(max_entries=OTP_MAX_ENTRIES)
+
+    from app.db.session import SessionLocal
+
+    return SQLOTPStore(SessionLocal)
+
+
+_store = _build_store()
+
+
+def get_otp_store():
+    return _store
+
+
+def set_otp_store(store):
+    global _store
+    _store = store
@@ -0,0 +1,214 @@
+import asyncio
+import threading
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import select, delete, func
+
+from app.models.token_blacklist import TokenBlacklist
+from app.core.user_cache import evict_changed_users
+from app.core.config import (
+    REVOCATION_SYNC_SECONDS,
+    TOKEN_PURGE_INTERVAL_SECONDS,
+    TOKEN_PURGE_BATCH_SIZE,
+)
+
+
+# -------------------------------
+# Revoked token ids (per process)
+# -------------------------------
+class RevocationSet:
+    """
+    jti → exp (unix seconds). An entry stops counting, and is
+    dropped, once its token would have expired anyway.
+    """
+
+    def __init__(self):
+        self._expires: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def add(self, jti: str, expires_at: float):
+        with self._lock:
+            self._expires[jti] = max(expires_at, self._expires.get(jti, 0.0))
+
+    def __contains__(self, jti: str) -> bool:
+        expires_at = self._expires.get(jti)
+        if expires_at is None:
+            return False
+
+        if expires_at <= time.time():
+            with self._lock:
+                self._expires.pop(jti, None)
+            return False
+
+        return True
+
+    def prune(self):
+        now = time.time()
+        with self._lock:
+            self._expires = {
+                jti: expires_at for jti, expires_at in self._expires.items()
+                if expires_at > now
+            }
+
+    def __len__(self):
+        return len(self._expires)
+
+
+_revoked = RevocationSet()
+
+# Rows are fetched by created_at, with some overlap for
+# transactions that committed after a later one
+_SYNC_OVERLAP = timedelta(seconds=60)
+
+_synced_at = 0.0
+_sync_cursor: datetime | None = None
+_loaded = False
+_sync_running = False
+_sync_lock = threading.Lock()
+
+
+def revoke(jti: str, exp: float):
+    """
+    Local effect right away, other workers see it on their next sync
+    """
+    _revoked.add(jti, exp)
+
+
+def _sync():
+    global _synced_at, _sync_cursor, _loaded
+
+    # Primary: a lagging replica would miss fresh logouts
+    from app.db.session import SessionLocal
+
+    statement = select(
+        TokenBlacklist.jti,
+        TokenBlacklist.expires_at,
+        TokenBlacklist.created_at
+    ).where(
+        TokenBlacklist.jti.is_not(None),
+        TokenBlacklist.expires_at > func.now()
+    )
+    if _sync_cursor is not None:
+        statement = statement.where(TokenBlacklist.created_at >= _sync_cursor - _SYNC_OVERLAP)
+
+    with SessionLocal() as db:
+        rows = db.execute(statement).all()
+        # Deactivated / deleted users leave every worker's user cache
+        evict_changed_users(db)
+
+    for jti, expires_at, created_at in rows:
+        _revoked.add(jti, expires_at.timestamp())
+        if created_at is not None and (_sync_cursor is None or created_at > _sync_cursor):
+            _sync_cursor = created_at
+
+    _revoked.prune()
+    _synced_at = time.monotonic()
+    _loaded = True
+
+
+def purge_expired_tokens(db, batch_size: int = TOKEN_PURGE_BATCH_SIZE) -> int:
+    """
+    Deletes expired rows, one short transaction per batch.
+    SKIP LOCKED lets several workers purge side by side.
+    """
+    purged = 0
+
+    while True:
+        batch = (
+            select(TokenBlacklist.id)
+            .where(TokenBlacklist.expires_at < func.now())
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        deleted = db.execute(
+            delete(TokenBlacklist).where(TokenBlacklist.id.in_(batch))
+        ).rowcount
+        db.commit()
+
+        purged += deleted
+        if deleted < batch_size:
+            return purged
+
+
+def _purge():
+    from app.db.session import SessionLocal
+
+    with SessionLocal() as db:
+        return purge_expired_tokens(db)
+
+
+async def purge_expired_tokens_periodically(interval: float = TOKEN_PURGE_INTERVAL_SECONDS):
+    """
+    Startup task of every worker (SKIP LOCKED keeps them apart),
+    independent of traffic. Cancelled on shutdown.
+    """
+    while True:
+        try:
+            await asyncio.to_thread(_purge)
+        except Exception:
+            # Retried on the next run
+            pass
+
+        await asyncio.sleep(interval)
+
+
+def _sync_in_background():
+    global _sync_running, _synced_at
+    try:
+        _sync()
+    except Exception:
+        # Keep the current set, retry after the next interval
+        _synced_at = time.monotonic()
+    finally:
+        _sync_running = False
+
+
+def _start_background_sync():
+    global _sync_running
+
+    with _sync_lock:
+        if not _sync_running:
+            _sync_running = True
+            threading.Thread(target=_sync_in_background, daemon=True).start()
+
+
+def preload_revocations():
+    """
+    Startup hook: loads the set before the first request. On failure
+    requests check their jti directly until a background sync succeeds.
+    """
+    try:
+        with _sync_lock:
+            if not _loaded:
+                _sync()
+    except Exception:
+        pass
+
+
+def _is_revoked_in_db(jti: str) -> bool:
+    from app.db.session import SessionLocal
+
+    with SessionLocal() as db:
+        return db.scalar(
+            select(TokenBlacklist.id).where(
+                TokenBlacklist.jti == jti,
+                TokenBlacklist.expires_at > func.now()
+            ).limit(1)
+        ) is not None
+
+
+def is_token_revoked(jti: str) -> bool:
+    """
+    Memory lookup only once the set is loaded (at startup), refreshes
+    run in a background thread. Until the first load succeeds, one
+    primary-key lookup of this jti.
+    """
+    if time.monotonic() - _synced_at >= REVOCATION_SYNC_SECONDS and not _sync_running:
+        _start_background_sync()
+
+    if not _loaded:
+        # Startup load failed: ask the database, never fail the request
+        return _is_revoked_in_db(jti)
+
+    return jti in _revoked
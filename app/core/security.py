@@ -1,7 +1,17 @@
+import hashlib
+import uuid
 from datetime import datetime, timedelta
 from jose import jwt
 from passlib.context import CryptContext
 
+from app.core.config import (
+    BCRYPT_ROUNDS,
+    PASSWORD_HASH_WORKERS,
+    PASSWORD_HASH_MAX_PENDING,
+    PASSWORD_HASH_WAIT_SECONDS,
+)
+from app.core.hash_pool import HashPool
+
 # ================= CONFIG =================
 SECRET_KEY = "SUPER_SECRET_KEY_CHANGE_ME"
 ALGORITHM = "HS256"
@@ -9,30 +19,64 @@ ACCESS_TOKEN_EXPIRE_MINUTES = 480
 REFRESH_TOKEN_EXPIRE_DAYS = 7
 # REFRESH_TOKEN_EXPIRE_MINUTES= 20
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# min = max = rounds: hashes with any other cost "need update"
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__rounds=BCRYPT_ROUNDS,
+    bcrypt__min_rounds=BCRYPT_ROUNDS,
+    bcrypt__max_rounds=BCRYPT_ROUNDS,
+)
+
+# bcrypt runs here, never on the event loop / request threads
+hash_pool = HashPool(
+    workers=PASSWORD_HASH_WORKERS,
+    max_pending=PASSWORD_HASH_MAX_PENDING,
+    wait_seconds=PASSWORD_HASH_WAIT_SECONDS,
+)
 
 
 # ================= PASSWORD =================
-def hash_password(password: str) -> str:
+def _hash(password: str) -> str:
     # bcrypt supports max 72 bytes
     safe_password = password.encode("utf-8")[:72]
     return pwd_context.hash(safe_password)
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
+def _verify(plain_password: str, hashed_password: str) -> bool:
     safe_password = plain_password.encode("utf-8")[:72]
     return pwd_context.verify(safe_password, hashed_password)
 
+def hash_password(password: str) -> str:
+    return hash_pool.run(_hash, password)
+
+def verify_password(plain_password: str, hashed_password: str) -> bool:
+    return hash_pool.run(_verify, plain_password, hashed_password)
+
+async def hash_password_async(password: str) -> str:
+    return await hash_pool.run_async(_hash, password)
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    return await hash_pool.run_async(_verify, plain_password, hashed_password)
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    # Cost factor (or scheme) changed since this hash was made
+    return pwd_context.needs_update(hashed_password)
+
 # ================= JWT =================
 def create_access_token(data: dict, expires_delta: timedelta | None = None):
     to_encode = data.copy()
 
     expire = datetime.utcnow() + (expires_delta or timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES))
-    to_encode.update({"exp": expire})
+    to_encode.update({"exp": expire, "jti": uuid.uuid4().hex})
 
     return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
 
 def create_refresh_token(data: dict):
     to_encode = data.copy()
     expire = datetime.utcnow() + timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS)
-    to_encode.update({"exp": expire, "type": "refresh"})
-    return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
\ No newline at end of file
+    to_encode.update({"exp": expire, "type": "refresh", "jti": uuid.uuid4().hex})
+    return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+
+def token_jti(payload: dict, token: str) -> str:
+    # Tokens minted before the jti claim are keyed by their hash
+    return payload.get("jti") or hashlib.sha256(token.encode()).hexdigest()
\ No newline at end of file
@@ -0,0 +1,86 @@
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import inspect, select, func
+from sqlalchemy.orm import Session, make_transient_to_detached
+
+from app.models.user import User
+from app.utils.ttl_cache import TTLCache
+from app.core.config import (
+    AUTH_USER_CACHE_TTL_SECONDS,
+    AUTH_USER_CACHE_SIZE,
+    REVOCATION_SYNC_SECONDS,
+)
+
+
+# -------------------------------
+# Authenticated users (per process)
+# -------------------------------
+# user id → column values of an active user. Writes in this worker
+# drop the entry at once; every worker also evicts users whose
+# updated_at moved, polled with the token revocation sync.
+_user_cache = TTLCache(maxsize=AUTH_USER_CACHE_SIZE, ttl=AUTH_USER_CACHE_TTL_SECONDS)
+
+_USER_COLUMNS = [column.key for column in inspect(User).column_attrs]
+
+# Same overlap as the revocation sync, for late commits
+_SYNC_OVERLAP = timedelta(seconds=60)
+
+_user_cursor: datetime | None = None
+_users_synced_at = 0.0
+
+
+def invalidate_user(user_id: int):
+    _user_cache.invalidate(user_id)
+
+
+def evict_changed_users(db: Session):
+    """
+    Drops users updated (deactivated, deleted, ...) by any worker
+    since the last call. Run by the revocation sync.
+    """
+    global _user_cursor, _users_synced_at
+
+    if _user_cursor is None:
+        # Nothing cached predates the first sync
+        _user_cursor = db.scalar(select(func.now()))
+    else:
+        rows = db.execute(
+            select(User.id, User.updated_at).where(User.updated_at >= _user_cursor - _SYNC_OVERLAP)
+        ).all()
+
+        for user_id, updated_at in rows:
+            _user_cache.invalidate(user_id)
+            if updated_at > _user_cursor:
+                _user_cursor = updated_at
+
+    _users_synced_at = time.monotonic()
+
+
+def _synced_recently() -> bool:
+    # Sync stalled (or database down): cached rows may be outdated
+    return time.monotonic() - _users_synced_at < 2 * REVOCATION_SYNC_SECONDS
+
+
+def get_active_user(db: Session, user_id: int) -> User | None:
+    """
+    Active user by id, attached to `db` (routes may still update it).
+    A cache hit does not query the database.
+    """
+    values = _user_cache.get(user_id) if _synced_recently() else None
+
+    if values is None:
+        user = db.query(User).filter(
+            User.id == user_id,
+            User.is_active == True,
+            User.is_delete == False
+        ).first()
+
+        if user is not None:
+            _user_cache.put(user_id, {key: getattr(user, key) for key in _USER_COLUMNS})
+        return user
+
+    user = User(**values)
+    make_transient_to_detached(user)
+    # load=False: attach as-is, no SELECT
+    return db.merge(user, load=False)
@@ -0,0 +1,110 @@
+import threading
+import time
+
+from sqlalchemy.pool import QueuePool, AsyncAdaptedQueuePool
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+
+# -------------------------------
+# Connection pool telemetry
+# -------------------------------
+class PoolMetrics:
+    """
+    Counters for one engine pool (per worker process)
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.checkouts = 0
+            self.overflow_checkouts = 0
+            self.timeouts = 0
+            self.wait_seconds_total = 0.0
+            self.wait_seconds_max = 0.0
+            self.peak_in_use = 0
+
+    def observe_checkout(self, waited: float, in_use: int, pool_size: int):
+        with self._lock:
+            self.checkouts += 1
+            self.wait_seconds_total += waited
+            self.wait_seconds_max = max(self.wait_seconds_max, waited)
+            self.peak_in_use = max(self.peak_in_use, in_use)
+
+            # Connection came from max_overflow, not from the pool itself
+            if in_use > pool_size:
+                self.overflow_checkouts += 1
+
+    def observe_timeout(self, waited: float):
+        with self._lock:
+            self.timeouts += 1
+            self.wait_seconds_total += waited
+            self.wait_seconds_max = max(self.wait_seconds_max, waited)
+
+    def snapshot(self, pool) -> dict:
+        with self._lock:
+            attempts = self.checkouts + self.timeouts
+            return {
+                "name": self.name,
+                "pool_size": pool.size(),
+                "in_use": pool.checkedout(),
+                "idle": pool.checkedin(),
+                "overflow": max(pool.overflow(), 0),
+                "peak_in_use": self.peak_in_use,
+                "checkouts": self.checkouts,
+                "overflow_checkouts": self.overflow_checkouts,
+                "timeouts": self.timeouts,
+                "wait_ms_avg": round(self.wait_seconds_total * 1000 / attempts, 3) if attempts else 0.0,
+                "wait_ms_max": round(self.wait_seconds_max * 1000, 3),
+                "wait_ms_total": round(self.wait_seconds_total * 1000, 3),
+            }
+
+
+# Keyed by pool_logging_name, which survives engine.dispose()
+_pool_metrics: dict[str, PoolMetrics] = {}
+_pool_metrics_lock = threading.Lock()
+
+
+def get_pool_metrics(name: str) -> PoolMetrics:
+    with _pool_metrics_lock:
+        if name not in _pool_metrics:
+            _pool_metrics[name] = PoolMetrics(name)
+        return _pool_metrics[name]
+
+
+class _TimedCheckoutMixin:
+    """
+    Times every checkout, including the wait for a free connection
+    when the pool and its overflow are exhausted
+    """
+
+    def _do_get(self):
+        metrics = get_pool_metrics(self.logging_name or "default")
+        started = time.perf_counter()
+
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            metrics.observe_timeout(time.perf_counter() - started)
+            raise
+
+        metrics.observe_checkout(time.perf_counter() - started, self.checkedout(), self.size())
+        return connection
+
+
+class TimedQueuePool(_TimedCheckoutMixin, QueuePool):
+    pass
+
+
+class TimedAsyncAdaptedQueuePool(_TimedCheckoutMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def pool_stats(*engines) -> list[dict]:
+    return [
+        get_pool_metrics(engine.pool.logging_name or "default").snapshot(engine.pool)
+        for engine in engines
+    ]
@@ -1,6 +1,28 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
-from app.core.config import DATABASE_URL
+from sqlalchemy import create_engine, Select, CompoundSelect, TextClause
+from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from app.core.config import (
+    DATABASE_URL,
+    ASYNC_DATABASE_URL,
+    DATABASE_REPLICA_URL,
+    ASYNC_DATABASE_REPLICA_URL,
+    DB_POOL_SIZE,
+    DB_MAX_OVERFLOW,
+    DB_POOL_TIMEOUT,
+    DB_POOL_RECYCLE,
+    DB_POOL_PRE_PING,
+)
+from app.db.pool_metrics import TimedQueuePool, TimedAsyncAdaptedQueuePool
+
+
+# Pool sizing from config, shared by both engines
+POOL_OPTIONS = {
+    "pool_size": DB_POOL_SIZE,
+    "max_overflow": DB_MAX_OVERFLOW,
+    "pool_timeout": DB_POOL_TIMEOUT,
+    "pool_recycle": DB_POOL_RECYCLE,
+    "pool_pre_ping": DB_POOL_PRE_PING,
+}
 
 # Create database engine & session
 # Open DB → do work → close DB
@@ -8,7 +30,9 @@ from app.core.config import DATABASE_URL
 # Creates a connection bridge between FastAPI and PostgreSQL
 engine = create_engine(
     DATABASE_URL,
-    pool_pre_ping=True
+    poolclass=TimedQueuePool,
+    pool_logging_name="primary",
+    **POOL_OPTIONS
 )
 
 # creates DB sessions
@@ -18,3 +42,98 @@ SessionLocal = sessionmaker(
     bind=engine
 )
 
+
+# -------------------------------
+# Async (asyncpg) engine & sessions
+# -------------------------------
+# Used by the async storefront read paths, writes stay on SessionLocal
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL,
+    poolclass=TimedAsyncAdaptedQueuePool,
+    pool_logging_name="async",
+    **POOL_OPTIONS
+)
+
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    autoflush=False,
+    expire_on_commit=False
+)
+
+
+# -------------------------------
+# Read replica & session routing
+# -------------------------------
+# Without a replica URL both names point at the primary engines
+if DATABASE_REPLICA_URL:
+    replica_engine = create_engine(
+        DATABASE_REPLICA_URL,
+        poolclass=TimedQueuePool,
+        pool_logging_name="replica",
+        **POOL_OPTIONS
+    )
+else:
+    replica_engine = engine
+
+if ASYNC_DATABASE_REPLICA_URL:
+    async_replica_engine = create_async_engine(
+        ASYNC_DATABASE_REPLICA_URL,
+        poolclass=TimedAsyncAdaptedQueuePool,
+        pool_logging_name="async_replica",
+        **POOL_OPTIONS
+    )
+else:
+    async_replica_engine = async_engine
+
+
+def _is_read(clause) -> bool:
+    """
+    Plain SELECTs only: DML (ORM or text()), SELECT ... FOR UPDATE
+    and anything unknown go to the primary
+    """
+    if isinstance(clause, (Select, CompoundSelect)):
+        return getattr(clause, "_for_update_arg", None) is None
+
+    if isinstance(clause, TextClause):
+        return clause.text.lstrip().lower().startswith("select")
+
+    return False
+
+
+class RoutingSession(Session):
+    """
+    Reads go to the replica until the session writes.
+    From the first flush / non-SELECT statement on, everything
+    (including the reads right after the write) sticks to the primary.
+    """
+    primary = engine
+    replica = replica_engine
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        if self.info.get("wrote"):
+            return self.primary
+
+        if self._flushing or not _is_read(clause):
+            self.info["wrote"] = True
+            return self.primary
+
+        return self.replica
+
+
+class AsyncRoutingSession(RoutingSession):
+    primary = async_engine.sync_engine
+    replica = async_replica_engine.sync_engine
+
+
+# read-mostly sessions (list routes, zone lookups)
+ReadSessionLocal = sessionmaker(
+    class_=RoutingSession,
+    autocommit=False,
+    autoflush=True
+)
+
+AsyncReadSessionLocal = async_sessionmaker(
+    sync_session_class=AsyncRoutingSession,
+    autoflush=False,
+    expire_on_commit=False
+)
@@ -16,8 +16,13 @@ from fastapi.responses import JSONResponse
 from pydantic import ValidationError
 
 
+import asyncio
+from contextlib import asynccontextmanager
+
 from app.core.exceptions import AppException
 from app.api.v1.router import api_router
+from app.services.search_service import refresh_search_index_in_background
+from app.core.revocation import preload_revocations, purge_expired_tokens_periodically
 
 from app.models import user,category,product,uom,token_blacklist,slider # noqa
 
@@ -26,7 +31,24 @@ from fastapi.middleware.cors import CORSMiddleware
 
 
 
-app = FastAPI(title="MyVegiz API")
+# -----------------------------
+# STARTUP / SHUTDOWN
+# -----------------------------
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Product search index, built off the request path
+    refresh_search_index_in_background()
+    # Revoked token ids, so the first authenticated request stays in memory
+    await asyncio.to_thread(preload_revocations)
+    # Expired token_blacklist rows, whether or not anyone logs in
+    purge_task = asyncio.create_task(purge_expired_tokens_periodically())
+
+    yield
+
+    purge_task.cancel()
+
+
+app = FastAPI(title="MyVegiz API", lifespan=lifespan)
 
 
 # -----------------------------
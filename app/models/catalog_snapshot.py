@@ -0,0 +1,32 @@
+from sqlalchemy import Column, Integer, Boolean, DateTime, ForeignKey, Text, String
+from sqlalchemy.sql import func
+from app.db.base import Base
+
+
+class CatalogSnapshot(Base):
+    """
+    Pre-serialized storefront catalog of one zone
+    (main categories → categories → sub categories → products)
+    """
+    __tablename__ = "catalog_snapshots"
+
+    zone_id = Column(
+        Integer,
+        ForeignKey("zones.id", ondelete="CASCADE"),
+        primary_key=True
+    )
+
+    # JSON text of the "data" part, served as is
+    payload = Column(Text, nullable=False)
+    etag = Column(String(64), nullable=False)
+
+    # Set by admin writes, bumped so a rebuild racing a write never
+    # marks its (older) result as fresh
+    is_stale = Column(Boolean, default=False, nullable=False)
+    version = Column(Integer, default=0, nullable=False)
+
+    built_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    # Set while one request rebuilds a stale snapshot, the others
+    # keep serving the stale payload meanwhile
+    rebuild_claimed_at = Column(DateTime(timezone=True), nullable=True)
@@ -1,10 +1,14 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime,ForeignKey
+from sqlalchemy import Column, Integer, String, Boolean, DateTime,ForeignKey, Index
 from sqlalchemy.sql import func
 from app.db.base import Base
 
 
 class Category(Base):
     __tablename__ = "categories"
+    # Keyset pagination on (created_at, id)
+    __table_args__ = (
+        Index("ix_categories_created_at_id", "created_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     main_category_id = Column(
@@ -22,5 +26,6 @@ class Category(Base):
     is_update = Column(Boolean, default=False)
 
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
-    deleted_at = Column(DateTime(timezone=True), nullable=True)
+    # Indexed for the storefront validators' max()
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now(), index=True)
+    deleted_at = Column(DateTime(timezone=True), nullable=True, index=True)
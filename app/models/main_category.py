@@ -1,10 +1,14 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Index
 from sqlalchemy.sql import func
 from app.db.base import Base
 
 
 class MainCategory(Base):
     __tablename__ = "main_categories"
+    # Keyset pagination on (created_at, id)
+    __table_args__ = (
+        Index("ix_main_categories_created_at_id", "created_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     uu_id = Column(String(255), unique=True, index=True, nullable=False)
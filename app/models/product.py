@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime,ForeignKey,Text
+from sqlalchemy import Column, Integer, String, Boolean, DateTime,ForeignKey,Text, Index
 from sqlalchemy.sql import func
 from app.db.base import Base
 from sqlalchemy.orm import relationship
@@ -6,6 +6,10 @@ from sqlalchemy.orm import relationship
 
 class Product(Base):
     __tablename__ = "products"
+    # Keyset pagination on (created_at, id)
+    __table_args__ = (
+        Index("ix_products_created_at_id", "created_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     category_id = Column(
@@ -35,8 +39,9 @@ class Product(Base):
     is_update = Column(Boolean, default=False)
 
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
-    deleted_at = Column(DateTime(timezone=True), nullable=True)
+    # Indexed for the storefront validators' max()
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now(), index=True)
+    deleted_at = Column(DateTime(timezone=True), nullable=True, index=True)
     
 
     # ✅ ADD THIS
@@ -46,3 +51,10 @@ class Product(Base):
         cascade="all, delete-orphan"
     )
 
+    # Zone / UOM wise prices (load explicitly, never serialized by default)
+    variants = relationship(
+        "ProductVariants",
+        backref="product",
+        lazy="select"
+    )
+
@@ -1,10 +1,15 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime,ForeignKey,Float
+from sqlalchemy import Column, Integer, String, Boolean, DateTime,ForeignKey,Float, Index
 from sqlalchemy.sql import func
 from app.db.base import Base
+from sqlalchemy.orm import relationship
 
 
 class ProductVariants(Base):
     __tablename__ = "product_variants"
+    # Keyset pagination on (created_at, id)
+    __table_args__ = (
+        Index("ix_product_variants_created_at_id", "created_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     uu_id = Column(String(255), unique=True, index=True, nullable=False)
@@ -36,5 +41,8 @@ class ProductVariants(Base):
     is_update = Column(Boolean, default=False)
 
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
-    deleted_at = Column(DateTime(timezone=True), nullable=True)
+    # Indexed for the storefront validators' max()
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now(), index=True)
+    deleted_at = Column(DateTime(timezone=True), nullable=True, index=True)
+
+    uom = relationship("UOM")
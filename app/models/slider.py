@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Index
 from sqlalchemy.sql import func
 
 from app.db.base import Base
@@ -6,6 +6,10 @@ from app.db.base import Base
 
 class Slider(Base):
     __tablename__ = "sliders"
+    # Keyset pagination on (created_at, id)
+    __table_args__ = (
+        Index("ix_sliders_created_at_id", "created_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
 
@@ -20,5 +24,6 @@ class Slider(Base):
     is_update = Column(Boolean, default=False)
 
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
-    deleted_at = Column(DateTime(timezone=True), nullable=True)
+    # Indexed for the storefront validators' max()
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now(), index=True)
+    deleted_at = Column(DateTime(timezone=True), nullable=True, index=True)
@@ -1,10 +1,14 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime,ForeignKey
+from sqlalchemy import Column, Integer, String, Boolean, DateTime,ForeignKey, Index
 from sqlalchemy.sql import func
 from app.db.base import Base
 
 
 class SubCategory(Base):
     __tablename__ = "sub_categories"
+    # Keyset pagination on (created_at, id)
+    __table_args__ = (
+        Index("ix_sub_categories_created_at_id", "created_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     category_id = Column(
@@ -7,5 +7,9 @@ class TokenBlacklist(Base):
     __tablename__ = "token_blacklist"
 
     id = Column(Integer, primary_key=True, index=True)
-    token = Column(String(500), nullable=False, unique=True)
+    # Legacy rows only, revocation is keyed on jti
+    token = Column(String(500), nullable=True, unique=True)
+    jti = Column(String(64), nullable=True, unique=True)
+    # Token's own exp, the row is purged after it
+    expires_at = Column(DateTime(timezone=True), nullable=True, index=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
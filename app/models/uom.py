@@ -1,10 +1,14 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Index
 from sqlalchemy.sql import func
 from app.db.base import Base
 
 
 class UOM(Base):
     __tablename__ = "uoms"
+    # Keyset pagination on (created_at, id)
+    __table_args__ = (
+        Index("ix_uoms_created_at_id", "created_at", "id"),
+    )
 
     uu_id = Column(String(255), unique=True, index=True, nullable=False)
 
@@ -20,5 +24,6 @@ class UOM(Base):
     is_update = Column(Boolean, default=False)
 
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
-    deleted_at = Column(DateTime(timezone=True), nullable=True)
+    # Indexed for the storefront validators' max()
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now(), index=True)
+    deleted_at = Column(DateTime(timezone=True), nullable=True, index=True)
@@ -1,10 +1,14 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Index
 from sqlalchemy.sql import func
 from app.db.base import Base
 
 
 class User(Base):
     __tablename__ = "users"
+    # Keyset pagination on (created_at, id)
+    __table_args__ = (
+        Index("ix_users_created_at_id", "created_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     uu_id = Column(String(255), unique=True, index=True, nullable=False)
@@ -21,5 +25,6 @@ class User(Base):
     is_update = Column(Boolean, default=False)
 
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    # Polled by every worker to evict cached users (app/core/user_cache.py)
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now(), index=True)
     deleted_at = Column(DateTime(timezone=True), nullable=True)
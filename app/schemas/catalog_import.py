@@ -0,0 +1,19 @@
+from pydantic import BaseModel
+from typing import List
+
+
+class ImportRowError(BaseModel):
+    row: int
+    message: str
+
+
+class CatalogImportReport(BaseModel):
+    rows: int
+    imported: int
+    failed: int
+    products_created: int
+    products_updated: int
+    variants_created: int
+    variants_updated: int
+    # Capped at IMPORT_MAX_ERRORS, `failed` has the full count
+    errors: List[ImportRowError]
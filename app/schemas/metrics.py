@@ -0,0 +1,16 @@
+from pydantic import BaseModel
+
+
+class PoolStatsResponse(BaseModel):
+    name: str
+    pool_size: int
+    in_use: int
+    idle: int
+    overflow: int
+    peak_in_use: int
+    checkouts: int
+    overflow_checkouts: int
+    timeouts: int
+    wait_ms_avg: float
+    wait_ms_max: float
+    wait_ms_total: float
@@ -141,3 +141,32 @@ class ProductResponse(BaseModel):
 
     class Config:
         orm_from_attributes = True
+
+
+# -------------------------
+# WEB (zone aware listing)
+# -------------------------
+class VariantUOMResponse(BaseModel):
+    id: int
+    uom_name: str
+    uom_short_name: str
+
+    class Config:
+        orm_from_attributes = True
+
+
+class WebProductVariantResponse(BaseModel):
+    uu_id: str
+    zone_id: int
+    uom_id: int
+    actual_price: float
+    selling_price: float
+    uom: Optional[VariantUOMResponse] = None
+
+    class Config:
+        orm_from_attributes = True
+
+
+class WebProductResponse(ProductResponse):
+    # Only filled when the list is requested for a zone
+    variants: List[WebProductVariantResponse] = []
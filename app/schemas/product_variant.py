@@ -1,5 +1,5 @@
-from pydantic import BaseModel
-from typing import List
+from pydantic import BaseModel, field_validator
+from typing import List, Optional
 from datetime import datetime
 
 
@@ -37,3 +37,35 @@ class ProductVariantResponse(BaseModel):
 
     class Config:
         orm_from_attributes = True
+
+
+# -------------------------
+# BULK PRICE UPDATE
+# -------------------------
+MAX_PRICE_UPDATE_ITEMS = 5000
+
+
+class VariantPriceItem(BaseModel):
+    uu_id: str
+    actual_price: Optional[float] = None
+    selling_price: Optional[float] = None
+    is_active: Optional[bool] = None
+
+
+class ProductVariantBulkPriceUpdate(BaseModel):
+    items: List[VariantPriceItem]
+
+    @field_validator("items")
+    @classmethod
+    def validate_items(cls, v):
+        if not v:
+            raise ValueError("At least one item is required")
+        if len(v) > MAX_PRICE_UPDATE_ITEMS:
+            raise ValueError(f"Maximum {MAX_PRICE_UPDATE_ITEMS} items allowed per request")
+        return v
+
+
+class VariantPriceUpdateResult(BaseModel):
+    uu_id: str
+    status: int
+    message: str
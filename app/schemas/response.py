@@ -1,5 +1,5 @@
 from typing import Generic, TypeVar, Optional,Dict,Any
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from pydantic.generics import GenericModel
 
 
@@ -18,4 +18,12 @@ class PaginatedAPIResponse(GenericModel, Generic[T]):
     status: int
     message: str
     data: Optional[T]
-    pagination: Dict[str, Any]  
+    pagination: Dict[str, Any] = Field(
+        ...,
+        description=(
+            "Page mode: total, per_page, current_page, total_pages, total_exact "
+            "(false when total is cached/estimated or null when skipped, "
+            "then has_more is set). "
+            "Cursor mode: per_page, next_cursor, has_more."
+        )
+    )  
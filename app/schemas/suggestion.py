@@ -0,0 +1,8 @@
+from pydantic import BaseModel
+
+
+class SuggestionResponse(BaseModel):
+    text: str
+    type: str  # "product" | "category"
+    uu_id: str
+    slug: str
@@ -0,0 +1,42 @@
+from pydantic import BaseModel, field_validator
+from typing import List
+
+MAX_RESOLVE_POINTS = 200
+
+
+class Coordinate(BaseModel):
+    lat: float
+    lng: float
+
+    @field_validator("lat")
+    @classmethod
+    def validate_lat(cls, v):
+        if not -90 <= v <= 90:
+            raise ValueError("Latitude must be between -90 and 90")
+        return v
+
+    @field_validator("lng")
+    @classmethod
+    def validate_lng(cls, v):
+        if not -180 <= v <= 180:
+            raise ValueError("Longitude must be between -180 and 180")
+        return v
+
+
+class ZoneResolveRequest(BaseModel):
+    points: List[Coordinate]
+
+    @field_validator("points")
+    @classmethod
+    def validate_points(cls, v):
+        if not v:
+            raise ValueError("At least one point is required")
+        if len(v) > MAX_RESOLVE_POINTS:
+            raise ValueError(f"Maximum {MAX_RESOLVE_POINTS} points allowed per request")
+        return v
+
+
+class ZoneResolveItem(BaseModel):
+    lat: float
+    lng: float
+    zone_ids: List[int]
@@ -1,32 +1,50 @@
+from datetime import datetime, timezone
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from jose import jwt, JWTError
 
 from app.models.user import User
 from app.core.exceptions import AppException
 from app.core.security import (
-    verify_password,
+    verify_password_async,
+    hash_password_async,
+    password_needs_rehash,
     create_access_token,
     create_refresh_token,
+    token_jti,
     SECRET_KEY,
     ALGORITHM
 )
 from app.models.token_blacklist import TokenBlacklist
-
-def login_user(db: Session, email: str, password: str):
-    user = db.query(User).filter(
-        User.email == email,
-        User.is_active == True,
-        User.is_delete == False
-    ).first()
+from app.core.revocation import is_token_revoked, revoke
+from app.core.user_cache import invalidate_user
+
+async def login_user(db: AsyncSession, email: str, password: str):
+    user = (await db.execute(
+        select(User).where(
+            User.email == email,
+            User.is_active == True,
+            User.is_delete == False
+        )
+    )).scalars().first()
 
     
     if not user:
         raise AppException(status=404, message="Email not registered")
 
-    #  Password incorrect
-    if not verify_password(password, user.password):
+    #  Password incorrect (bcrypt in the hash pool, not on the event loop)
+    if not await verify_password_async(password, user.password):
         raise AppException(status=401, message="Incorrect password")
 
+    # BCRYPT_ROUNDS changed since this hash was made → upgrade it now
+    if password_needs_rehash(user.password):
+        user.password = await hash_password_async(password)
+        await db.commit()
+        invalidate_user(user.id)
+
     payload = {
         "user_id": user.id,
         "email": user.email,
@@ -55,27 +73,55 @@ def login_user(db: Session, email: str, password: str):
 
 
 def refresh_access_token(refresh_token: str):
-    blacklisted = db.query(TokenBlacklist).filter(
-        TokenBlacklist.token == refresh_token
-    ).first()
-
-    if blacklisted:
-        raise AppException(status=401, message="Refresh token expired. Please login again")
-
     try:
         payload = jwt.decode(refresh_token, SECRET_KEY, algorithms=[ALGORITHM])
 
-        if payload.get("type") != "refresh":
-            raise AppException(status=401, message="Invalid refresh token")
-
-        return {
-            "access_token": create_access_token({
-                "user_id": payload["user_id"],
-                "email": payload["email"],
-            }),
-            "token_type": "bearer"
-        }
-
     except JWTError:
         raise AppException(status=401, message="Refresh token expired or invalid")
 
+    if is_token_revoked(token_jti(payload, refresh_token)):
+        raise AppException(status=401, message="Refresh token expired. Please login again")
+
+    if payload.get("type") != "refresh":
+        raise AppException(status=401, message="Invalid refresh token")
+
+    return {
+        "access_token": create_access_token({
+            "user_id": payload["user_id"],
+            "email": payload["email"],
+        }),
+        "token_type": "bearer"
+    }
+
+
+def logout_tokens(db: Session, tokens: list[str]):
+    """
+    Revokes every still-valid token by its jti until its own exp
+    """
+    revoked = {}
+
+    for token in tokens:
+        try:
+            payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        except JWTError:
+            # Expired or forged, nothing to revoke
+            continue
+
+        revoked[token_jti(payload, token)] = payload["exp"]
+
+    if not revoked:
+        return
+
+    # One statement, already revoked tokens are skipped by the unique jti
+    db.execute(
+        insert(TokenBlacklist)
+        .values([
+            {"jti": jti, "expires_at": datetime.fromtimestamp(exp, tz=timezone.utc)}
+            for jti, exp in revoked.items()
+        ])
+        .on_conflict_do_nothing(index_elements=["jti"])
+    )
+    db.commit()
+
+    for jti, exp in revoked.items():
+        revoke(jti, exp)
@@ -0,0 +1,106 @@
+import csv
+import io
+import json
+from typing import Iterator
+
+from sqlalchemy import select, and_
+
+from app.db.session import ReadSessionLocal
+from app.models.product import Product
+from app.models.product_variants import ProductVariants
+from app.core.config import EXPORT_YIELD_PER
+
+
+# Same layout as the import file (+ identifiers), so an export
+# can be edited and uploaded back through /products/import
+EXPORT_COLUMNS = (
+    Product.uu_id.label("product_uu_id"),
+    Product.slug,
+    Product.category_id,
+    Product.sub_category_id,
+    Product.product_name,
+    Product.product_short_name,
+    Product.short_description,
+    Product.long_description,
+    Product.hsn_code,
+    Product.sku_code,
+    Product.is_active,
+    ProductVariants.uu_id.label("variant_uu_id"),
+    ProductVariants.zone_id,
+    ProductVariants.uom_id,
+    ProductVariants.actual_price,
+    ProductVariants.selling_price,
+    ProductVariants.is_active.label("variant_is_active"),
+)
+EXPORT_HEADER = [column.key for column in EXPORT_COLUMNS]
+
+EXPORT_FORMATS = {
+    "csv": "text/csv",
+    "ndjson": "application/x-ndjson",
+}
+
+
+def _export_statement():
+    # One row per product / variant, products without variants once
+    return (
+        select(*EXPORT_COLUMNS)
+        .outerjoin(
+            ProductVariants,
+            and_(
+                ProductVariants.product_id == Product.id,
+                ProductVariants.is_delete == False
+            )
+        )
+        .where(Product.is_delete == False)
+        .order_by(Product.id, ProductVariants.id)
+    )
+
+
+def _stream_rows() -> Iterator[list]:
+    """
+    Plain rows in chunks of EXPORT_YIELD_PER, through a
+    server-side cursor (never the whole catalog in memory)
+    """
+    # Own session: the request's one may be closed before streaming ends
+    db = ReadSessionLocal()
+    try:
+        result = db.execute(
+            _export_statement().execution_options(yield_per=EXPORT_YIELD_PER)
+        )
+        for partition in result.partitions():
+            yield partition
+    finally:
+        db.close()
+
+
+def _csv_chunks() -> Iterator[str]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    def drain() -> str:
+        chunk = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+        return chunk
+
+    # Header goes out before the query runs
+    writer.writerow(EXPORT_HEADER)
+    yield drain()
+
+    for rows in _stream_rows():
+        writer.writerows(rows)
+        yield drain()
+
+
+def _ndjson_chunks() -> Iterator[str]:
+    for rows in _stream_rows():
+        yield "".join(
+            json.dumps(dict(zip(EXPORT_HEADER, row)), default=str) + "\n"
+            for row in rows
+        )
+
+
+def export_catalog(export_format: str) -> Iterator[str]:
+    if export_format == "ndjson":
+        return _ndjson_chunks()
+    return _csv_chunks()
@@ -0,0 +1,371 @@
+import csv
+import io
+import uuid
+from typing import Iterator, Optional
+
+from fastapi import UploadFile
+from pydantic import ValidationError
+from sqlalchemy import select, tuple_
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app.models.product import Product
+from app.models.product_variants import ProductVariants
+from app.models.category import Category
+from app.models.sub_category import SubCategory
+from app.models.uom import UOM
+from app.models.zone import Zone
+from app.schemas.product import ProductCreate
+from app.schemas.product_variant import VariantItem
+from app.services.product_service import generate_slug
+from app.core.exceptions import AppException
+from app.core.cache import invalidate_cache, CATALOG_PRODUCTS
+from app.services.catalog_snapshot_service import mark_catalog_stale
+from app.services.search_service import invalidate_search_index
+from app.services.suggest_service import invalidate_suggestion_index
+from app.core.config import IMPORT_BATCH_SIZE, IMPORT_MAX_ERRORS
+
+
+# -------------------------------
+# File layout
+# -------------------------------
+# One row per product (+ optional zone price):
+# category_id, sub_category_id, product_name, product_short_name,
+# short_description, long_description, hsn_code, sku_code, is_active,
+# zone_id, uom_id, actual_price, selling_price
+PRODUCT_COLUMNS = tuple(ProductCreate.model_fields)
+TEXT_COLUMNS = {
+    name for name, field in ProductCreate.model_fields.items()
+    if field.annotation in (str, Optional[str])
+}
+VARIANT_COLUMNS = tuple(VariantItem.model_fields)
+REQUIRED_COLUMNS = ("category_id", "product_name", "product_short_name")
+
+
+def _normalize_header(header) -> list[str]:
+    return [str(name or "").strip().lower() for name in header]
+
+
+def _read_csv(file) -> tuple[list[str], Iterator[dict]]:
+    text = io.TextIOWrapper(file, encoding="utf-8-sig", newline="")
+    reader = csv.DictReader(text)
+    reader.fieldnames = _normalize_header(reader.fieldnames or [])
+
+    def rows():
+        try:
+            yield from reader
+        finally:
+            # Leave the upload's file object open for FastAPI
+            text.detach()
+
+    return reader.fieldnames, rows()
+
+
+def _read_xlsx(file) -> tuple[list[str], Iterator[dict]]:
+    from openpyxl import load_workbook
+
+    # read_only streams the sheet instead of loading it whole
+    workbook = load_workbook(file, read_only=True, data_only=True)
+    sheet_rows = workbook.active.iter_rows(values_only=True)
+    header = _normalize_header(next(sheet_rows, ()))
+
+    def rows():
+        try:
+            for values in sheet_rows:
+                yield dict(zip(header, values))
+        finally:
+            workbook.close()
+
+    return header, rows()
+
+
+def _read_rows(upload: UploadFile) -> tuple[list[str], Iterator[dict]]:
+    filename = (upload.filename or "").lower()
+
+    if filename.endswith((".xlsx", ".xlsm")):
+        return _read_xlsx(upload.file)
+
+    if filename.endswith(".csv") or upload.content_type in ("text/csv", "application/vnd.ms-excel"):
+        return _read_csv(upload.file)
+
+    raise AppException(status=400, message="Only CSV and XLSX files are allowed")
+
+
+# -------------------------------
+# Row validation
+# -------------------------------
+def _clean(value):
+    if isinstance(value, str):
+        value = value.strip()
+        return value or None
+    return value
+
+
+def _error_message(exc: ValidationError) -> str:
+    # Same wording as the API's validation handler
+    error = exc.errors()[0]
+    field = str(error["loc"][-1]) if error["loc"] else "row"
+
+    if error["type"] == "missing":
+        return f"{field.capitalize()} is required"
+
+    message = error.get("msg", "Validation error")
+    if message.lower().startswith("value error"):
+        message = message.split(",", 1)[1].strip()
+    return message
+
+
+def _parse_row(raw: dict) -> tuple[ProductCreate, VariantItem | None]:
+    product_fields = {
+        name: _clean(raw.get(name))
+        for name in PRODUCT_COLUMNS
+        if _clean(raw.get(name)) is not None
+    }
+    # Excel hands numbers back for numeric-looking text cells
+    for name in TEXT_COLUMNS & product_fields.keys():
+        product_fields[name] = str(product_fields[name])
+    # Keep the "is required" messages of ProductCreate
+    for name in ("product_name", "product_short_name"):
+        product_fields.setdefault(name, None)
+
+    product = ProductCreate(**product_fields)
+
+    variant_fields = {
+        name: _clean(raw.get(name))
+        for name in VARIANT_COLUMNS
+        if _clean(raw.get(name)) is not None
+    }
+    variant = VariantItem(**variant_fields) if variant_fields else None
+
+    return product, variant
+
+
+# -------------------------------
+# Batch upsert
+# -------------------------------
+class _Report:
+    def __init__(self):
+        self.rows = 0
+        self.imported = 0
+        self.failed = 0
+        self.counts = {
+            "products_created": 0,
+            "products_updated": 0,
+            "variants_created": 0,
+            "variants_updated": 0,
+        }
+        self.errors = []
+
+    def fail(self, row: int, message: str):
+        self.failed += 1
+        if len(self.errors) < IMPORT_MAX_ERRORS:
+            self.errors.append({"row": row, "message": message})
+
+    def as_dict(self) -> dict:
+        return {
+            "rows": self.rows,
+            "imported": self.imported,
+            "failed": self.failed,
+            **self.counts,
+            "errors": sorted(self.errors, key=lambda error: error["row"]),
+        }
+
+
+def _ids(db: Session, model, ids: set) -> set:
+    if not ids:
+        return set()
+    return set(db.scalars(
+        select(model.id).where(model.id.in_(ids), model.is_delete == False)
+    ))
+
+
+def _row_error(product: ProductCreate, variant: VariantItem | None, valid: dict) -> str | None:
+    if product.category_id not in valid["categories"]:
+        return "Category not found"
+
+    if product.sub_category_id is not None and product.sub_category_id not in valid["sub_categories"]:
+        return "Sub category not found"
+
+    if variant is not None:
+        if variant.zone_id not in valid["zones"]:
+            return f"Zone not found (ID: {variant.zone_id})"
+
+        if variant.uom_id not in valid["uoms"]:
+            return f"UOM not found (ID: {variant.uom_id})"
+
+    return None
+
+
+def _upsert_batch(db: Session, batch: list, report: _Report, columns: set):
+    """
+    batch = [(row_number, ProductCreate, VariantItem | None), ...]
+    committed as ONE transaction. If the database rejects it, the
+    rows are retried one by one so only the bad ones are reported.
+    `columns` = the file's header: existing products only get those.
+    """
+    # Foreign keys: one IN query per table
+    valid = {
+        "categories": _ids(db, Category, {p.category_id for _, p, _ in batch}),
+        "sub_categories": _ids(db, SubCategory, {p.sub_category_id for _, p, _ in batch if p.sub_category_id}),
+        "zones": _ids(db, Zone, {v.zone_id for _, _, v in batch if v}),
+        "uoms": _ids(db, UOM, {v.uom_id for _, _, v in batch if v}),
+    }
+
+    # Products are matched on slug, like create_product's duplicate check
+    slugs = {generate_slug(p.product_name) for _, p, _ in batch}
+    products = {
+        product.slug: product
+        for product in db.scalars(
+            select(Product).where(Product.slug.in_(slugs), Product.is_delete == False)
+        )
+    }
+
+    counts = dict.fromkeys(report.counts, 0)
+    touched = set()
+    accepted = []
+    # Parsed rows of `accepted`, for the one-by-one retry
+    retry = []
+
+    for row, data, variant in batch:
+        error = _row_error(data, variant, valid)
+        if error:
+            report.fail(row, error)
+            continue
+
+        slug = generate_slug(data.product_name)
+        product = products.get(slug)
+
+        if product is None:
+            product = Product(uu_id=str(uuid.uuid4()), slug=slug, **data.model_dump())
+            db.add(product)
+            products[slug] = product
+            counts["products_created"] += 1
+
+        elif slug not in touched:
+            # Blank cells and absent columns keep the stored value
+            # (is_active included: a price update never reactivates)
+            for field, value in data.model_dump(exclude_unset=True).items():
+                if field in columns:
+                    setattr(product, field, value)
+            product.is_update = True
+            counts["products_updated"] += 1
+
+        touched.add(slug)
+        accepted.append((row, product, variant))
+        retry.append((row, data, variant))
+
+    try:
+        _write_variants(db, accepted, counts)
+        # Only the zones these products are sold in
+        mark_catalog_stale(db, select(ProductVariants.zone_id).where(
+            ProductVariants.product_id.in_({product.id for _, product, _ in accepted})
+        ))
+        db.commit()
+    except SQLAlchemyError:
+        db.rollback()
+        db.expunge_all()
+
+        if len(retry) == 1:
+            report.fail(retry[0][0], "Database error while importing row")
+        else:
+            for entry in retry:
+                _upsert_batch(db, [entry], report, columns)
+        return
+
+    report.imported += len(accepted)
+    for name, value in counts.items():
+        report.counts[name] += value
+
+
+def _write_variants(db: Session, accepted: list, counts: dict):
+    # Product ids for the variants
+    db.flush()
+
+    keys = {(p.id, v.zone_id, v.uom_id) for _, p, v in accepted if v}
+    variants = {
+        (pv.product_id, pv.zone_id, pv.uom_id): pv
+        for pv in db.scalars(
+            select(ProductVariants).where(
+                tuple_(ProductVariants.product_id, ProductVariants.zone_id, ProductVariants.uom_id).in_(keys),
+                ProductVariants.is_delete == False
+            )
+        )
+    } if keys else {}
+
+    for _, product, variant in accepted:
+        if variant is None:
+            continue
+
+        key = (product.id, variant.zone_id, variant.uom_id)
+        existing = variants.get(key)
+
+        if existing is None:
+            variants[key] = ProductVariants(
+                uu_id=str(uuid.uuid4()),
+                product_id=product.id,
+                zone_id=variant.zone_id,
+                uom_id=variant.uom_id,
+                actual_price=variant.actual_price,
+                selling_price=variant.selling_price,
+                is_active=True
+            )
+            db.add(variants[key])
+            counts["variants_created"] += 1
+        else:
+            existing.actual_price = variant.actual_price
+            existing.selling_price = variant.selling_price
+            existing.is_update = True
+            counts["variants_updated"] += 1
+
+
+def import_catalog(db: Session, upload: UploadFile, batch_size: int = IMPORT_BATCH_SIZE) -> dict:
+    """
+    Streams the file and upserts products + zone prices in
+    transactions of `batch_size` rows. Bad rows (and rows the
+    database rejects) land in the error report, the rest is kept.
+    """
+    header, rows = _read_rows(upload)
+
+    missing = [name for name in REQUIRED_COLUMNS if name not in header]
+    if missing:
+        raise AppException(status=400, message=f"Missing columns: {', '.join(missing)}")
+
+    report = _Report()
+    batch = []
+    columns = set(header)
+
+    def flush_batch():
+        try:
+            _upsert_batch(db, batch, report, columns)
+        finally:
+            # Nothing from earlier batches stays in memory
+            db.expunge_all()
+            batch.clear()
+
+    # Row 1 is the header
+    for row, raw in enumerate(rows, start=2):
+        if not any(_clean(value) is not None for value in raw.values()):
+            continue
+
+        report.rows += 1
+
+        try:
+            product, variant = _parse_row(raw)
+        except ValidationError as exc:
+            report.fail(row, _error_message(exc))
+            continue
+
+        batch.append((row, product, variant))
+
+        if len(batch) >= batch_size:
+            flush_batch()
+
+    if batch:
+        flush_batch()
+
+    if report.imported:
+        invalidate_cache(CATALOG_PRODUCTS)
+        invalidate_search_index()
+        invalidate_suggestion_index()
+
+    return report.as_dict()
@@ -0,0 +1,262 @@
+import hashlib
+import json
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.models.catalog_snapshot import CatalogSnapshot
+from app.models.main_category import MainCategory
+from app.models.category import Category
+from app.models.sub_category import SubCategory
+from app.models.product_variants import ProductVariants
+from app.models.zone import Zone
+from app.schemas.main_category import MainCategoryResponse
+from app.schemas.category import CategoryResponse
+from app.schemas.sub_category import SubCategoryResponse
+from app.schemas.product import WebProductResponse
+from app.services.web_product_service import all_products_for_zone
+from app.core.exceptions import AppException
+from app.core.config import CATALOG_SNAPSHOT_MAX_AGE, CATALOG_SNAPSHOT_REBUILD_LEASE
+
+
+# -------------------------------
+# Invalidation (called by admin writes, before their commit)
+# -------------------------------
+def mark_catalog_stale(db: Session, zone_ids=None):
+    """
+    zone_ids: ids, a select() of zone ids, or None for every zone.
+    Runs in the caller's transaction, so it commits with the write.
+    """
+    statement = update(CatalogSnapshot).values(
+        is_stale=True,
+        version=CatalogSnapshot.version + 1
+    )
+
+    if zone_ids is not None:
+        statement = statement.where(CatalogSnapshot.zone_id.in_(zone_ids))
+
+    db.execute(statement.execution_options(synchronize_session=False))
+
+
+def zones_of_product(product_id: int):
+    return select(ProductVariants.zone_id).where(ProductVariants.product_id == product_id)
+
+
+# -------------------------------
+# Build
+# -------------------------------
+def _dump(schema, obj) -> dict:
+    return schema.model_validate(obj, from_attributes=True).model_dump(mode="json")
+
+
+def build_catalog(db: Session, zone_id: int) -> dict:
+    """
+    main categories → categories → sub categories → products
+    (with images and this zone's variants), one query per level
+    """
+    main_categories = db.query(MainCategory).filter(
+        MainCategory.is_active == True
+    ).order_by(MainCategory.id).all()
+
+    categories = db.query(Category).filter(
+        Category.is_active == True,
+        Category.is_delete == False
+    ).order_by(Category.id).all()
+
+    sub_categories = db.query(SubCategory).filter(
+        SubCategory.is_active == True,
+        SubCategory.is_delete == False
+    ).order_by(SubCategory.id).all()
+
+    # Group products under their sub category, or their category
+    by_sub_category, by_category = {}, {}
+    for product in all_products_for_zone(db, zone_id):
+        item = _dump(WebProductResponse, product)
+        if product.sub_category_id:
+            by_sub_category.setdefault(product.sub_category_id, []).append(item)
+        else:
+            by_category.setdefault(product.category_id, []).append(item)
+
+    subs_by_category = {}
+    for sub_category in sub_categories:
+        subs_by_category.setdefault(sub_category.category_id, []).append({
+            **_dump(SubCategoryResponse, sub_category),
+            "products": by_sub_category.get(sub_category.id, []),
+        })
+
+    categories_by_main = {}
+    for category in categories:
+        categories_by_main.setdefault(category.main_category_id, []).append({
+            **_dump(CategoryResponse, category),
+            "sub_categories": subs_by_category.get(category.id, []),
+            "products": by_category.get(category.id, []),
+        })
+
+    return {
+        "zone_id": zone_id,
+        "main_categories": [
+            {
+                **_dump(MainCategoryResponse, main_category),
+                "categories": categories_by_main.get(main_category.id, []),
+            }
+            for main_category in main_categories
+        ],
+    }
+
+
+def _build_payload(db: Session, zone_id: int) -> tuple[str, str]:
+    zone = db.query(Zone.id).filter(
+        Zone.id == zone_id,
+        Zone.is_delete == False,
+        Zone.is_active == True
+    ).first()
+
+    if not zone:
+        raise AppException(status=404, message="Zone not found")
+
+    payload = json.dumps(build_catalog(db, zone_id), separators=(",", ":"))
+    return payload, hashlib.sha1(payload.encode()).hexdigest()
+
+
+def rebuild_catalog_snapshot(db: Session, zone_id: int, version: int) -> tuple[str, str]:
+    """
+    Builds the zone's whole snapshot and stores it (invalidation is per
+    zone, the rebuild is not per row). `version` is the one read before
+    building: if a write bumped it meanwhile the result is served but
+    not stored, the next read rebuilds again.
+    """
+    payload, etag = _build_payload(db, zone_id)
+
+    stored = db.execute(
+        update(CatalogSnapshot)
+        .where(
+            CatalogSnapshot.zone_id == zone_id,
+            CatalogSnapshot.version == version
+        )
+        .values(
+            payload=payload,
+            etag=etag,
+            is_stale=False,
+            built_at=datetime.now(timezone.utc),
+            rebuild_claimed_at=None
+        )
+        .execution_options(synchronize_session=False)
+    ).rowcount
+
+    if not stored:
+        # Outdated by a write: hand the claim to the next read
+        _release_rebuild(db, zone_id)
+    db.commit()
+
+    return payload, etag
+
+
+# -------------------------------
+# Rebuild claim (one rebuild per zone at a time)
+# -------------------------------
+def _create_claimed(db: Session, zone_id: int) -> bool:
+    """
+    First build of a zone: an empty, stale, claimed row goes in
+    BEFORE building, so a write committed meanwhile bumps its
+    version (mark_catalog_stale) and the build is not stored as fresh.
+    """
+    try:
+        db.add(CatalogSnapshot(
+            zone_id=zone_id,
+            payload="",
+            etag="",
+            is_stale=True,
+            version=0,
+            rebuild_claimed_at=datetime.now(timezone.utc)
+        ))
+        db.commit()
+        return True
+    except IntegrityError:
+        # Another worker got there first (or no such zone)
+        db.rollback()
+        return False
+
+
+def _claim_rebuild(db: Session, zone_id: int) -> bool:
+    """
+    Committed right away so other workers see it. A claim older
+    than the lease is taken over.
+    """
+    now = datetime.now(timezone.utc)
+    lease = now - timedelta(seconds=CATALOG_SNAPSHOT_REBUILD_LEASE)
+
+    claimed = db.execute(
+        update(CatalogSnapshot)
+        .where(
+            CatalogSnapshot.zone_id == zone_id,
+            (CatalogSnapshot.rebuild_claimed_at.is_(None)) | (CatalogSnapshot.rebuild_claimed_at < lease)
+        )
+        .values(rebuild_claimed_at=now)
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    db.commit()
+
+    return bool(claimed)
+
+
+def _release_rebuild(db: Session, zone_id: int):
+    db.execute(
+        update(CatalogSnapshot)
+        .where(CatalogSnapshot.zone_id == zone_id)
+        .values(rebuild_claimed_at=None)
+        .execution_options(synchronize_session=False)
+    )
+
+
+# -------------------------------
+# Read
+# -------------------------------
+def get_catalog_snapshot(db: Session, zone_id: int) -> tuple[str, str]:
+    """
+    (payload JSON, etag): one primary-key read while the snapshot
+    is fresh. When it is not, one request rebuilds this zone and
+    concurrent ones get the stale payload until it is stored.
+    """
+    row = db.execute(
+        select(
+            CatalogSnapshot.payload,
+            CatalogSnapshot.etag,
+            CatalogSnapshot.is_stale,
+            CatalogSnapshot.version,
+            CatalogSnapshot.built_at
+        ).where(CatalogSnapshot.zone_id == zone_id)
+    ).first()
+
+    if row is None:
+        claimed = _create_claimed(db, zone_id)
+        version = 0
+    else:
+        built_at = row.built_at
+        if built_at is not None and built_at.tzinfo is None:
+            built_at = built_at.replace(tzinfo=timezone.utc)
+
+        # Max age also bounds any invalidation a racing rebuild missed
+        expired = built_at is None or datetime.now(timezone.utc) - built_at > timedelta(seconds=CATALOG_SNAPSHOT_MAX_AGE)
+
+        if not (row.is_stale or expired):
+            return row.payload, row.etag
+
+        claimed = _claim_rebuild(db, zone_id)
+        version = row.version
+
+        if not claimed and row.payload:
+            return row.payload, row.etag
+
+    if not claimed:
+        # First build still running elsewhere: nothing to serve yet
+        return _build_payload(db, zone_id)
+
+    try:
+        return rebuild_catalog_snapshot(db, zone_id, version)
+    except Exception:
+        db.rollback()
+        _release_rebuild(db, zone_id)
+        db.commit()
+        raise
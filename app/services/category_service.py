@@ -8,6 +8,9 @@ import re
 from app.models.category import Category
 from app.schemas.category import CategoryCreate
 from app.core.exceptions import AppException
+from app.core.cache import invalidate_cache, CATALOG_CATEGORIES
+from app.services.suggest_service import refresh_category_suggestion
+from app.services.catalog_snapshot_service import mark_catalog_stale
 import cloudinary.uploader
 from app.models.main_category import MainCategory
 
@@ -90,8 +93,11 @@ def create_category(
 
     try:
         db.add(db_category)
+        mark_catalog_stale(db)
         db.commit()
+        invalidate_cache(CATALOG_CATEGORIES)
         db.refresh(db_category)
+        refresh_category_suggestion(db_category)
         return db_category
 
     except IntegrityError:
@@ -167,8 +173,11 @@ def update_category(
     category.updated_at = func.now()
 
     try:
+        mark_catalog_stale(db)
         db.commit()
+        invalidate_cache(CATALOG_CATEGORIES)
         db.refresh(category)
+        refresh_category_suggestion(category)
         return category
     except IntegrityError:
         db.rollback()
@@ -197,8 +206,11 @@ def soft_delete_category(db: Session, uu_id: str):
     category.deleted_at = func.now()
 
     try:
+        mark_catalog_stale(db)
         db.commit()
+        invalidate_cache(CATALOG_CATEGORIES)
         db.refresh(category)
+        refresh_category_suggestion(category)
         return category
     except IntegrityError:
         db.rollback()
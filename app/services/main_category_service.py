@@ -10,6 +10,8 @@ import cloudinary.uploader
 from app.models.main_category import MainCategory
 from app.schemas.main_category import MainCategoryCreate, MainCategoryUpdate
 from app.core.exceptions import AppException
+from app.services.catalog_snapshot_service import mark_catalog_stale
+from app.utils.pagination import PageParams, paginate
 
 
 MAX_IMAGE_SIZE = 1 * 1024 * 1024
@@ -59,6 +61,7 @@ def create_main_category(
 
     try:
         db.add(category)
+        mark_catalog_stale(db)
         db.commit()
         db.refresh(category)
         return category
@@ -68,11 +71,9 @@ def create_main_category(
 
 
 # ✅ READ (LIST)
-def list_main_categories(db: Session, offset: int, limit: int):
-    query = db.query(MainCategory).order_by(MainCategory.created_at.desc())
-    total = query.count()
-    data = query.offset(offset).limit(limit).all()
-    return total, data
+def list_main_categories(db: Session, params: PageParams):
+    query = db.query(MainCategory)
+    return paginate(query, MainCategory, params)
 
 
 # ✅ UPDATE
@@ -108,6 +109,7 @@ def update_main_category(
     category.is_update = True
     category.updated_at = func.now()
 
+    mark_catalog_stale(db)
     db.commit()
     db.refresh(category)
     return category
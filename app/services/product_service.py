@@ -12,6 +12,10 @@ from app.models.product_image import ProductImage
 from app.models.category import Category
 from app.schemas.product import ProductCreate, ProductUpdate
 from app.core.exceptions import AppException
+from app.core.cache import invalidate_cache, CATALOG_PRODUCTS
+from app.services.catalog_snapshot_service import mark_catalog_stale, zones_of_product
+from app.services.search_service import invalidate_search_index
+from app.services.suggest_service import refresh_product_suggestion
 import cloudinary.uploader
 from sqlalchemy.orm import joinedload
 
@@ -98,9 +102,12 @@ def create_product(
             ))
 
         db.commit()
+        invalidate_cache(CATALOG_PRODUCTS)
+        invalidate_search_index()
         product_with_images = db.query(Product).options(
             joinedload(Product.images)
         ).filter(Product.id == db_product.id).first()
+        refresh_product_suggestion(product_with_images)
 
         return product_with_images
     except IntegrityError as e:
@@ -208,7 +215,11 @@ def update_product(
                 is_primary=(index == 0)
             ))
 
+    mark_catalog_stale(db, zones_of_product(product.id))
     db.commit()
+    invalidate_cache(CATALOG_PRODUCTS)
+    invalidate_search_index()
+    refresh_product_suggestion(product)
 
 
     return db.query(Product).options(
@@ -230,7 +241,11 @@ def soft_delete_product(db: Session, uu_id: str):
     product.is_active = False
     product.deleted_at = func.now()
 
+    mark_catalog_stale(db, zones_of_product(product.id))
     db.commit()
+    invalidate_cache(CATALOG_PRODUCTS)
+    invalidate_search_index()
     db.refresh(product)
+    refresh_product_suggestion(product)
     return product
 
@@ -1,3 +1,4 @@
+from sqlalchemy import select, insert, update, tuple_, values, column, cast, String, Float, Boolean
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.sql import func
@@ -7,8 +8,10 @@ from app.models.product_variants import ProductVariants
 from app.models.product import Product
 from app.models.uom import UOM
 from app.models.zone import Zone
-from app.schemas.product_variant import ProductVariantBulkCreate
+from app.schemas.product_variant import ProductVariantBulkCreate, ProductVariantBulkPriceUpdate
 from app.core.exceptions import AppException
+from app.core.cache import invalidate_cache, CATALOG_PRODUCTS
+from app.services.catalog_snapshot_service import mark_catalog_stale
 
 
 def bulk_create_product_variants(
@@ -26,70 +29,83 @@ def bulk_create_product_variants(
     if not product:
         raise AppException(status=404, message="Product not found")
 
-    variants_to_create = []
+    # -------------------------------
+    # Zones / UOMs / existing variants (one IN query each)
+    # -------------------------------
+    zone_ids = {item.zone_id for item in data.variants}
+    uom_ids = {item.uom_id for item in data.variants}
+    pairs = {(item.zone_id, item.uom_id) for item in data.variants}
+
+    valid_zones = set(db.scalars(
+        select(Zone.id).where(Zone.id.in_(zone_ids), Zone.is_delete == False)
+    )) if zone_ids else set()
+
+    valid_uoms = set(db.scalars(
+        select(UOM.id).where(UOM.id.in_(uom_ids), UOM.is_delete == False)
+    )) if uom_ids else set()
+
+    existing = set(db.execute(
+        select(ProductVariants.zone_id, ProductVariants.uom_id).where(
+            ProductVariants.product_id == data.product_id,
+            tuple_(ProductVariants.zone_id, ProductVariants.uom_id).in_(pairs),
+            ProductVariants.is_delete == False
+        )
+    ).tuples()) if pairs else set()
+
+    # Same checks and messages as before, in payload order
+    rows = []
 
     for item in data.variants:
-        # -------------------------------
-        # Validate Zone
-        # -------------------------------
-        if not db.query(Zone).filter(
-            Zone.id == item.zone_id,
-            Zone.is_delete == False
-        ).first():
+        if item.zone_id not in valid_zones:
             raise AppException(
                 status=404,
                 message=f"Zone not found (ID: {item.zone_id})"
             )
 
-        # -------------------------------
-        # Validate UOM
-        # -------------------------------
-        if not db.query(UOM).filter(
-            UOM.id == item.uom_id,
-            UOM.is_delete == False
-        ).first():
+        if item.uom_id not in valid_uoms:
             raise AppException(
                 status=404,
                 message=f"UOM not found (ID: {item.uom_id})"
             )
 
         # -------------------------------
-        # Prevent duplicate variants
+        # Prevent duplicate variants (also within the payload)
         # -------------------------------
-        exists = db.query(ProductVariants).filter(
-            ProductVariants.product_id == data.product_id,
-            ProductVariants.zone_id == item.zone_id,
-            ProductVariants.uom_id == item.uom_id,
-            ProductVariants.is_delete == False
-        ).first()
-
-        if exists:
+        if (item.zone_id, item.uom_id) in existing:
             raise AppException(
                 status=400,
                 message=f"Variant already exists (zone={item.zone_id}, uom={item.uom_id})"
             )
+        existing.add((item.zone_id, item.uom_id))
 
-        variants_to_create.append(
-            ProductVariants(
-                uu_id=str(uuid.uuid4()),
-                product_id=data.product_id,
-                zone_id=item.zone_id,
-                uom_id=item.uom_id,
-                actual_price=item.actual_price,
-                selling_price=item.selling_price,
-                is_active=True
-            )
-        )
+        rows.append({
+            "uu_id": str(uuid.uuid4()),
+            "product_id": data.product_id,
+            "zone_id": item.zone_id,
+            "uom_id": item.uom_id,
+            "actual_price": item.actual_price,
+            "selling_price": item.selling_price,
+            "is_active": True,
+        })
+
+    if not rows:
+        return []
 
     try:
-        db.add_all(variants_to_create)
+        # One multi-row INSERT ... RETURNING (id & created_at included)
+        created = db.execute(
+            insert(ProductVariants.__table__).returning(
+                *ProductVariants.__table__.c,
+                sort_by_parameter_order=True
+            ),
+            rows
+        ).mappings().all()
+
+        mark_catalog_stale(db, zone_ids)
         db.commit()
+        invalidate_cache(CATALOG_PRODUCTS)
 
-        # Refresh each object to get ID & created_at
-        for variant in variants_to_create:
-            db.refresh(variant)
-
-        return variants_to_create
+        return [dict(variant) for variant in created]
 
     except IntegrityError:
         db.rollback()
@@ -105,21 +121,17 @@ def bulk_create_product_variants(
 import math
 from sqlalchemy.orm import Session
 from app.models.product_variants import ProductVariants
+from app.utils.pagination import PageParams, paginate
 
 def list_all_product_variants(
     db: Session,
-    offset: int,
-    limit: int,
+    params: PageParams,
 ):
     base_query = db.query(ProductVariants).filter(
         ProductVariants.is_delete == False
-    ).order_by(ProductVariants.created_at.desc())
-
-    total = base_query.count()
-
-    variants = base_query.offset(offset).limit(limit).all()
+    )
 
-    return variants, total
+    return paginate(base_query, ProductVariants, params)
 
 from app.schemas.product_variant import VariantItem
 from app.core.exceptions import AppException
@@ -149,7 +161,9 @@ def update_product_variant(
         variant.is_active = data["is_active"]
 
     try:
+        mark_catalog_stale(db, [variant.zone_id])
         db.commit()
+        invalidate_cache(CATALOG_PRODUCTS)
         db.refresh(variant)
         return variant
     except IntegrityError:
@@ -159,6 +173,81 @@ def update_product_variant(
 
 
 
+def bulk_update_variant_prices(
+    db: Session,
+    data: ProductVariantBulkPriceUpdate
+) -> list[dict]:
+    """
+    Applies every price / status change with ONE
+    UPDATE ... FROM (VALUES ...) and reports each item
+    """
+    results = {}
+    changes = []
+
+    for item in data.items:
+        if item.uu_id in results:
+            results[item.uu_id] = {"status": 400, "message": "Duplicate uu_id in request"}
+            continue
+
+        if item.actual_price is None and item.selling_price is None and item.is_active is None:
+            results[item.uu_id] = {"status": 400, "message": "No changes provided"}
+            continue
+
+        if any(price is not None and price < 0 for price in (item.actual_price, item.selling_price)):
+            results[item.uu_id] = {"status": 400, "message": "Price cannot be negative"}
+            continue
+
+        results[item.uu_id] = {"status": 404, "message": "Variant not found"}
+        changes.append((item.uu_id, item.actual_price, item.selling_price, item.is_active))
+
+    # A duplicated uu_id is rejected as a whole
+    changes = [change for change in changes if results[change[0]]["status"] == 404]
+
+    if changes:
+        # NULL keeps the current value
+        new_values = values(
+            column("uu_id", String),
+            column("actual_price", Float),
+            column("selling_price", Float),
+            column("is_active", Boolean),
+            name="new_values"
+        ).data(changes)
+
+        try:
+            updated = db.execute(
+                update(ProductVariants)
+                .where(
+                    ProductVariants.uu_id == new_values.c.uu_id,
+                    ProductVariants.is_delete == False
+                )
+                .values(
+                    actual_price=func.coalesce(cast(new_values.c.actual_price, Float), ProductVariants.actual_price),
+                    selling_price=func.coalesce(cast(new_values.c.selling_price, Float), ProductVariants.selling_price),
+                    is_active=func.coalesce(cast(new_values.c.is_active, Boolean), ProductVariants.is_active),
+                    is_update=True
+                )
+                .returning(ProductVariants.uu_id)
+                .execution_options(synchronize_session=False)
+            ).scalars().all()
+
+            mark_catalog_stale(
+                db,
+                select(ProductVariants.zone_id).where(ProductVariants.uu_id.in_(updated))
+            )
+            db.commit()
+        except IntegrityError:
+            db.rollback()
+            raise AppException(status=500, message="Failed to update variant prices")
+
+        for uu_id in updated:
+            results[uu_id] = {"status": 200, "message": "Variant updated"}
+
+        if updated:
+            invalidate_cache(CATALOG_PRODUCTS)
+
+    return [{"uu_id": uu_id, **result} for uu_id, result in results.items()]
+
+
 from sqlalchemy.sql import func
 
 
@@ -179,7 +268,9 @@ def soft_delete_product_variant(
     variant.deleted_at = func.now()
 
     try:
+        mark_catalog_stale(db, [variant.zone_id])
         db.commit()
+        invalidate_cache(CATALOG_PRODUCTS)
         db.refresh(variant)
         return variant
     except IntegrityError:
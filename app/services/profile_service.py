@@ -7,6 +7,7 @@ from app.models.user import User
 from app.schemas.profile_update import UserUpdate
 from app.core.security import hash_password
 from app.core.exceptions import AppException
+from app.core.user_cache import invalidate_user
 import cloudinary.uploader
 
 MAX_IMAGE_SIZE = 1 * 1024 * 1024  # 1MB
@@ -67,6 +68,7 @@ def update_user_profile(
 
     try:
         db.commit()
+        invalidate_user(user.id)
         db.refresh(user)
         return user
     except IntegrityError:
@@ -0,0 +1,203 @@
+import threading
+import time
+
+from sqlalchemy import select, literal, literal_column, or_, func, text
+from sqlalchemy.orm import Session
+
+from app.models.product import Product
+from app.services.web_product_service import (
+    _web_product_filters,
+    _web_product_options,
+    web_products_query,
+)
+from app.utils.search_index import ProductSearchIndex
+from app.core.config import (
+    SEARCH_MODE,
+    SEARCH_INDEX_TTL_SECONDS,
+    SEARCH_MIN_SIMILARITY,
+    SEARCH_MAX_CANDIDATES,
+)
+
+
+# Indexed columns and their weight in the ranking
+SEARCH_FIELDS = {
+    "product_name": 1.0,
+    "product_short_name": 0.9,
+    "sku_code": 0.9,
+    "slug": 0.7,
+}
+
+
+# -------------------------------
+# Product search index (per process)
+# -------------------------------
+# Marked dirty after product writes and rebuilt at least every
+# SEARCH_INDEX_TTL_SECONDS so other workers pick up changes too.
+# Rebuilds run in a background thread, requests keep using the old
+# index until the new one is published.
+_search_index = None
+_search_index_built_at = 0.0
+_search_index_generation = 0
+_search_index_lock = threading.Lock()
+_search_generation_lock = threading.Lock()
+
+
+def invalidate_search_index():
+    global _search_index_generation
+    with _search_generation_lock:
+        _search_index_generation += 1
+
+
+_searchable_products = (
+    select(Product.id, *(getattr(Product, field) for field in SEARCH_FIELDS))
+    .where(Product.is_delete == False, Product.is_active == True)
+    # Equal scores keep this order: newest first
+    .order_by(Product.created_at.desc(), Product.id.desc())
+)
+
+
+def _build_search_index(db: Session) -> ProductSearchIndex:
+    rows = (
+        (row.id, {field: getattr(row, field) for field in SEARCH_FIELDS})
+        for row in db.execute(_searchable_products)
+    )
+    return ProductSearchIndex(SEARCH_FIELDS, SEARCH_MIN_SIMILARITY).build(rows)
+
+
+def _is_fresh(generation: int) -> bool:
+    return (
+        _search_index is not None
+        and _search_index.generation == generation
+        and time.monotonic() - _search_index_built_at < SEARCH_INDEX_TTL_SECONDS
+    )
+
+
+def _publish(index: ProductSearchIndex, generation: int):
+    global _search_index, _search_index_built_at
+
+    index.generation = generation
+    _search_index = index
+    _search_index_built_at = time.monotonic()
+
+
+def _rebuild_in_background():
+    try:
+        from app.db.session import ReadSessionLocal
+
+        generation = _search_index_generation
+        with ReadSessionLocal() as db:
+            _publish(_build_search_index(db), generation)
+    except Exception:
+        # Keep the current index, the next request retries
+        pass
+    finally:
+        _search_index_lock.release()
+
+
+def refresh_search_index_in_background():
+    """
+    Starts a rebuild in a daemon thread unless one is running.
+    Also called at startup, so the first search finds a warm index.
+    """
+    if SEARCH_MODE != "python":
+        return
+
+    if _search_index_lock.acquire(blocking=False):
+        threading.Thread(target=_rebuild_in_background, daemon=True).start()
+
+
+def get_search_index(db: Session) -> ProductSearchIndex:
+    generation = _search_index_generation
+    if _is_fresh(generation):
+        return _search_index
+
+    # Stale but usable: rebuilt off the request, served meanwhile
+    if _search_index is not None:
+        refresh_search_index_in_background()
+        return _search_index
+
+    # Cold (no startup build yet): wait for the running build, or build
+    with _search_index_lock:
+        if _search_index is None:
+            _publish(_build_search_index(db), generation)
+        return _search_index
+
+
+# -------------------------------
+# Ranking
+# -------------------------------
+def _rank_python(db: Session, q: str, limit: int, filters: list) -> list[tuple[int, float]]:
+    ranked = []
+
+    # Zone / category filters per batch of candidates, pulling more
+    # until `limit` is filled or every match was checked
+    for batch in get_search_index(db).search_batches(q, SEARCH_MAX_CANDIDATES):
+        allowed = set(db.scalars(
+            select(Product.id).where(*filters, Product.id.in_([product_id for product_id, _ in batch]))
+        ))
+        ranked.extend((product_id, score) for product_id, score in batch if product_id in allowed)
+
+        if len(ranked) >= limit:
+            break
+
+    return ranked[:limit]
+
+
+def _rank_postgres(db: Session, q: str, limit: int, filters: list) -> list[tuple[int, float]]:
+    """
+    pg_trgm word_similarity, `<%` is served by the GIN trigram indexes
+    """
+    db.execute(
+        text("SELECT set_config('pg_trgm.word_similarity_threshold', :threshold, true)"),
+        {"threshold": str(SEARCH_MIN_SIMILARITY)}
+    )
+
+    query = literal(q.lower())
+    # Inlined '' so the expressions match the index definitions
+    columns = [
+        (func.lower(func.coalesce(getattr(Product, field), literal_column("''"))), weight)
+        for field, weight in SEARCH_FIELDS.items()
+    ]
+
+    score = func.greatest(*(func.word_similarity(query, column) * weight for column, weight in columns))
+
+    rows = db.execute(
+        select(Product.id, score.label("score"))
+        .where(*filters, or_(*(query.op("<%")(column) for column, _ in columns)))
+        .order_by(score.desc(), Product.created_at.desc(), Product.id.desc())
+        .limit(limit)
+    ).all()
+
+    return [(row.id, round(float(row.score), 4)) for row in rows]
+
+
+def search_products(
+    db: Session,
+    q: str,
+    limit: int,
+    category_id: int | None = None,
+    zone_ids: list[int] | None = None,
+) -> list[Product]:
+    """
+    Active products matching `q` on name / short name / slug / SKU,
+    best match first. Prefixes and small typos still match.
+    """
+    filters = _web_product_filters(category_id=category_id, zone_ids=zone_ids)
+
+    if SEARCH_MODE == "postgres":
+        ranked = _rank_postgres(db, q, limit, filters)
+    else:
+        ranked = _rank_python(db, q, limit, filters)
+
+    if not ranked:
+        return []
+
+    ids = [product_id for product_id, _ in ranked]
+    products = {
+        product.id: product
+        for product in web_products_query(db, zone_ids=zone_ids)
+        .filter(Product.id.in_(ids))
+        .options(*_web_product_options(zone_ids))
+    }
+
+    return [products[product_id] for product_id in ids if product_id in products]
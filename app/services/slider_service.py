@@ -5,6 +5,8 @@ import cloudinary.uploader
 from app.models.slider import Slider
 from app.schemas.slider import SliderCreate,SliderUpdate
 from app.core.exceptions import AppException
+from app.core.cache import invalidate_cache, CATALOG_SLIDERS
+from app.utils.pagination import PageParams, paginate
 
 from sqlalchemy.sql import func
 
@@ -56,26 +58,23 @@ def create_slider(
 
     db.add(slider)
     db.commit()
+    invalidate_cache(CATALOG_SLIDERS)
     db.refresh(slider)
 
     return slider
 
 
 
-def list_sliders(db: Session, offset: int, limit: int):
+def list_sliders(db: Session, params: PageParams):
     # -------------------------------
     # Base filters (soft delete aware)
     # -------------------------------
     base_query = db.query(Slider).filter(
         Slider.is_delete == False,
         Slider.is_active == True
-    ).order_by(Slider.created_at.desc())
-
-    total_records = base_query.count()
-
-    sliders = base_query.offset(offset).limit(limit).all()
+    )
 
-    return total_records, sliders
+    return paginate(base_query, Slider, params)
 
 
 
@@ -117,6 +116,7 @@ def update_slider(
     slider.updated_at = func.now()
 
     db.commit()
+    invalidate_cache(CATALOG_SLIDERS)
     db.refresh(slider)
 
     return slider
@@ -139,6 +139,7 @@ def soft_delete_slider(db: Session, slider_id: int):
     slider.deleted_at = func.now()
 
     db.commit()
+    invalidate_cache(CATALOG_SLIDERS)
     db.refresh(slider)
 
     return slider
@@ -10,6 +10,9 @@ from app.models.sub_category import SubCategory
 from app.models.category import Category
 from app.schemas.sub_category import SubCategoryCreate, SubCategoryUpdate
 from app.core.exceptions import AppException
+from app.core.cache import invalidate_cache, CATALOG_CATEGORIES
+from app.services.catalog_snapshot_service import mark_catalog_stale
+from app.utils.pagination import PageParams, paginate
 
 
 MAX_IMAGE_SIZE = 1 * 1024 * 1024
@@ -74,7 +77,9 @@ def create_sub_category(
 
     try:
         db.add(sub_category)
+        mark_catalog_stale(db)
         db.commit()
+        invalidate_cache(CATALOG_CATEGORIES)
         db.refresh(sub_category)
         return sub_category
     except IntegrityError:
@@ -85,14 +90,12 @@ def create_sub_category(
 # =========================
 # LIST
 # =========================
-def list_sub_categories(db: Session, offset: int, limit: int):
+def list_sub_categories(db: Session, params: PageParams):
     query = db.query(SubCategory).filter(
         SubCategory.is_delete == False
-    ).order_by(SubCategory.created_at.desc())
+    )
 
-    total = query.count()
-    data = query.offset(offset).limit(limit).all()
-    return total, data
+    return paginate(query, SubCategory, params)
 
 
 # =========================
@@ -144,7 +147,9 @@ def update_sub_category(
     sub_category.is_update = True
     sub_category.updated_at = func.now()
 
+    mark_catalog_stale(db)
     db.commit()
+    invalidate_cache(CATALOG_CATEGORIES)
     db.refresh(sub_category)
     return sub_category
 
@@ -165,6 +170,8 @@ def soft_delete_sub_category(db: Session, uu_id: str):
     sub_category.is_active = False
     sub_category.deleted_at = func.now()
 
+    mark_catalog_stale(db)
     db.commit()
+    invalidate_cache(CATALOG_CATEGORIES)
     db.refresh(sub_category)
     return sub_category
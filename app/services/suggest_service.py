@@ -0,0 +1,141 @@
+import asyncio
+import threading
+import time
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.product import Product
+from app.models.category import Category
+from app.utils.suggest_index import SuggestionIndex
+from app.core.config import SUGGEST_INDEX_TTL_SECONDS
+
+
+SUGGEST_PRODUCT = "product"
+SUGGEST_CATEGORY = "category"
+
+
+# -------------------------------
+# Suggestion index (per process)
+# -------------------------------
+# Admin writes in this worker patch the index in place, other
+# workers catch up through the SUGGEST_INDEX_TTL_SECONDS rebuild.
+_suggest_index = None
+_suggest_index_built_at = 0.0
+_suggest_index_generation = 0
+_suggest_index_lock = threading.Lock()
+# One rebuild at a time, the others serve the old index meanwhile
+_suggest_build_lock = asyncio.Lock()
+
+
+_active_products = select(Product.id, Product.uu_id, Product.slug, Product.product_name).where(
+    Product.is_delete == False,
+    Product.is_active == True
+)
+
+_active_categories = select(Category.id, Category.uu_id, Category.slug, Category.category_name).where(
+    Category.is_delete == False,
+    Category.is_active == True
+)
+
+
+def _add(index: SuggestionIndex, kind: str, row):
+    id, uu_id, slug, name = row
+    index.add(kind, id, name, uu_id=uu_id, slug=slug)
+
+
+def _build_index(categories, products) -> SuggestionIndex:
+    return SuggestionIndex.build(
+        (kind, id, name, {"uu_id": uu_id, "slug": slug})
+        for kind, rows in ((SUGGEST_CATEGORY, categories), (SUGGEST_PRODUCT, products))
+        for id, uu_id, slug, name in rows
+    )
+
+
+def invalidate_suggestion_index():
+    """
+    Full rebuild on next lookup (bulk writes, e.g. catalog import)
+    """
+    global _suggest_index, _suggest_index_generation
+    with _suggest_index_lock:
+        _suggest_index = None
+        _suggest_index_generation += 1
+
+
+def _refresh(kind: str, id: int, row):
+    global _suggest_index_generation
+    with _suggest_index_lock:
+        # A rebuild that started before this write must not be published
+        _suggest_index_generation += 1
+
+        if _suggest_index is None:
+            return
+
+        if row is None:
+            _suggest_index.remove(kind, id)
+        else:
+            _add(_suggest_index, kind, row)
+
+
+def refresh_product_suggestion(product: Product):
+    active = product.is_active and not product.is_delete
+    _refresh(
+        SUGGEST_PRODUCT,
+        product.id,
+        (product.id, product.uu_id, product.slug, product.product_name) if active else None
+    )
+
+
+def refresh_category_suggestion(category: Category):
+    active = category.is_active and not category.is_delete
+    _refresh(
+        SUGGEST_CATEGORY,
+        category.id,
+        (category.id, category.uu_id, category.slug, category.category_name) if active else None
+    )
+
+
+def _current_index(stale_ok: bool) -> SuggestionIndex | None:
+    with _suggest_index_lock:
+        if _suggest_index is None:
+            return None
+        if stale_ok or time.monotonic() - _suggest_index_built_at < SUGGEST_INDEX_TTL_SECONDS:
+            return _suggest_index
+        return None
+
+
+async def get_suggestion_index_async(db: AsyncSession) -> SuggestionIndex:
+    global _suggest_index, _suggest_index_built_at
+
+    index = _current_index(stale_ok=_suggest_build_lock.locked())
+    if index is not None:
+        return index
+
+    async with _suggest_build_lock:
+        # Built by the request we waited for
+        index = _current_index(stale_ok=False)
+        if index is not None:
+            return index
+
+        with _suggest_index_lock:
+            generation = _suggest_index_generation
+
+        categories = (await db.execute(_active_categories)).all()
+        products = (await db.execute(_active_products)).all()
+
+        # Sorting all keys is CPU work, keep it off the event loop
+        index = await asyncio.to_thread(_build_index, categories, products)
+
+        with _suggest_index_lock:
+            if generation == _suggest_index_generation:
+                _suggest_index = index
+                _suggest_index_built_at = time.monotonic()
+
+    return index
+
+
+async def suggest_async(db: AsyncSession, q: str, limit: int) -> list[dict]:
+    index = await get_suggestion_index_async(db)
+
+    with _suggest_index_lock:
+        return index.suggest(q, limit)
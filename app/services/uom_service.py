@@ -7,6 +7,8 @@ import re
 from app.models.uom import UOM
 from app.schemas.uom import UOMCreate, UOMUpdate
 from app.core.exceptions import AppException
+from app.services.catalog_snapshot_service import mark_catalog_stale
+from app.core.cache import invalidate_cache, CATALOG_PRODUCTS
 
 
 def generate_uom_code(name: str) -> str:
@@ -116,7 +118,10 @@ def update_uom(db: Session, uu_id: str, data: UOMUpdate):
     uom.updated_at = func.now()
 
     try:
+        mark_catalog_stale(db)
         db.commit()
+        # Product lists embed variant.uom
+        invalidate_cache(CATALOG_PRODUCTS)
         db.refresh(uom)
         return uom
     except IntegrityError:
@@ -139,7 +144,10 @@ def soft_delete_uom(db: Session, uu_id: str):
     uom.deleted_at = func.now()
 
     try:
+        mark_catalog_stale(db)
         db.commit()
+        # Product lists embed variant.uom
+        invalidate_cache(CATALOG_PRODUCTS)
         db.refresh(uom)
         return uom
     except IntegrityError:
@@ -7,6 +7,7 @@ from app.schemas.user import UserCreate
 from app.core.exceptions import AppException
 from app.core.security import hash_password
 from app.schemas.user import UserUpdate
+from app.core.user_cache import invalidate_user
 from fastapi import UploadFile
 
 
@@ -187,6 +188,7 @@ def update_user(
 
     try:
         db.commit()
+        invalidate_user(db_user.id)
         db.refresh(db_user)
         return db_user
 
@@ -213,6 +215,7 @@ def soft_delete_user(db: Session,  uu_id: str):
 
     try:
         db.commit()
+        invalidate_user(user.id)
         db.refresh(user)
         return user
     except IntegrityError:
@@ -70,78 +70,26 @@ def register_and_login_customer(db: Session, data):
     }
 
 
-from sqlalchemy.orm import Session
-from datetime import datetime, timedelta, timezone
-
-from app.models.otp import MobileOTP
+from app.core.otp_store import get_otp_store, OTPEntry, OTP_MISSING, OTP_MISMATCH
+from app.core.config import OTP_TTL_SECONDS
 
 DEFAULT_OTP = "123456"
-OTP_EXPIRY_MINUTES = 10
-
-
-def send_otp(db: Session, mobile: str):
-    now = datetime.now(timezone.utc)
 
-    # 🔍 STEP 1: Check for existing unverified & unexpired OTP
-    existing_otp = (
-        db.query(MobileOTP)
-        .filter(
-            MobileOTP.mobile == mobile,
-            MobileOTP.is_verified == False,
-            MobileOTP.expires_at > now
-        )
-        .order_by(MobileOTP.created_at.desc())
-        .first()
-    )
 
-    # ✅ STEP 2: If valid OTP exists → reuse it
-    if existing_otp:
-        return existing_otp
-
-    # 🔴 STEP 3: Delete expired OTPs
-    db.query(MobileOTP).filter(
-        MobileOTP.mobile == mobile,
-        MobileOTP.expires_at <= now
-    ).delete(synchronize_session=False)
-
-    # 🔴 STEP 4: Create new OTP
-    otp_entry = MobileOTP(
-        mobile=mobile,
-        otp=DEFAULT_OTP,
-        expires_at=now + timedelta(minutes=OTP_EXPIRY_MINUTES)
-    )
-
-    db.add(otp_entry)
-    db.commit()
-    db.refresh(otp_entry)
-
-    return otp_entry
+def send_otp(mobile: str) -> OTPEntry:
+    # A still valid OTP is sent again instead of a new one
+    return get_otp_store().issue(mobile, DEFAULT_OTP, OTP_TTL_SECONDS)
 
 
 def verify_otp(db: Session, mobile: str, otp: str):
-    now = datetime.now(timezone.utc)
-    otp_entry = (
-        db.query(MobileOTP)
-        .filter(
-            MobileOTP.mobile == mobile,
-            MobileOTP.expires_at > now
-        )
-        .order_by(MobileOTP.created_at.desc())
-        .first()
-    )
+    result = get_otp_store().verify(mobile, otp)
 
-    if not otp_entry:
+    if result == OTP_MISSING:
         raise AppException(status=404, message="OTP not requested. Please request OTP first.")
 
-    if otp_entry.expires_at < datetime.now(timezone.utc):
-        raise AppException(status=401, message="OTP expired. Please request a new one.")
-
-    if otp_entry.otp != otp:
+    if result == OTP_MISMATCH:
         raise AppException(status=401, message="Incorrect OTP.")
 
-    db.delete(otp_entry)
-    db.commit()
-
     customer = db.query(Customer).filter(
         Customer.contact == mobile,
         Customer.is_active == True,
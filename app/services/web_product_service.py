@@ -0,0 +1,122 @@
+from sqlalchemy import and_, select
+from sqlalchemy.orm import Session, selectinload, noload
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.product import Product
+from app.models.product_variants import ProductVariants
+from app.models.uom import UOM
+from app.utils.pagination import PageParams, paginate_async, COUNT_EXACT
+
+
+def _in_zone(zone_ids: list[int]):
+    return and_(
+        ProductVariants.zone_id.in_(zone_ids),
+        ProductVariants.is_delete == False,
+        ProductVariants.is_active == True
+    )
+
+
+def _web_product_filters(
+    category_id: int | None = None,
+    sub_category_id: int | None = None,
+    zone_ids: list[int] | None = None,
+) -> list:
+    filters = [
+        Product.is_delete == False,
+        Product.is_active == True
+    ]
+
+    # 🔍 Optional filters
+    if category_id:
+        filters.append(Product.category_id == category_id)
+
+    if sub_category_id:
+        filters.append(Product.sub_category_id == sub_category_id)
+
+    if zone_ids is not None:
+        # Only products sold in the zone (EXISTS on product_id / zone_id indexes)
+        filters.append(Product.variants.any(_in_zone(zone_ids)))
+
+    return filters
+
+
+def _web_product_options(zone_ids: list[int] | None = None) -> list:
+    if zone_ids is not None:
+        # All variants of the page in ONE extra query
+        variants_loader = selectinload(
+            Product.variants.and_(_in_zone(zone_ids))
+        ).joinedload(ProductVariants.uom)
+    else:
+        variants_loader = noload(Product.variants)
+
+    return [selectinload(Product.images), variants_loader]
+
+
+def web_products_query(
+    db: Session,
+    category_id: int | None = None,
+    sub_category_id: int | None = None,
+    zone_ids: list[int] | None = None,
+):
+    return db.query(Product).filter(
+        *_web_product_filters(category_id, sub_category_id, zone_ids)
+    )
+
+
+def web_products_statement(
+    category_id: int | None = None,
+    sub_category_id: int | None = None,
+    zone_ids: list[int] | None = None,
+):
+    return select(Product).where(
+        *_web_product_filters(category_id, sub_category_id, zone_ids)
+    )
+
+
+def web_products_validator_sources(
+    category_id: int | None = None,
+    sub_category_id: int | None = None,
+    zone_ids: list[int] | None = None,
+) -> list:
+    """
+    (query, Model) pairs whose changes alter the web product list,
+    for catalog_validator_async()
+    """
+    # Image changes always touch products.updated_at
+    sources = [
+        (web_products_statement(category_id, sub_category_id, zone_ids), Product),
+    ]
+
+    if zone_ids is not None:
+        sources.append((select(ProductVariants).where(_in_zone(zone_ids)), ProductVariants))
+        sources.append((select(UOM), UOM))
+
+    return sources
+
+
+def all_products_for_zone(db: Session, zone_id: int) -> list[Product]:
+    """
+    Every active product sold in the zone, with images and
+    zone variants loaded (catalog snapshot)
+    """
+    return (
+        web_products_query(db, zone_ids=[zone_id])
+        .options(*_web_product_options([zone_id]))
+        .order_by(Product.created_at.desc(), Product.id.desc())
+        .all()
+    )
+
+
+async def list_products_for_web_async(
+    db: AsyncSession,
+    params: PageParams,
+    category_id: int | None = None,
+    sub_category_id: int | None = None,
+    zone_ids: list[int] | None = None,
+    count: str = COUNT_EXACT,
+):
+    statement = web_products_statement(category_id, sub_category_id, zone_ids).options(
+        *_web_product_options(zone_ids)
+    )
+
+    return await paginate_async(db, statement, Product, params, count=count)
@@ -1,26 +1,27 @@
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import UploadFile
 import cloudinary.uploader
 
 from app.models.slider import Slider
 from app.core.exceptions import AppException
+from app.utils.pagination import PageParams, paginate_async, COUNT_EXACT
 
 from sqlalchemy.sql import func
 
 
-def list_sliders(db: Session, offset: int, limit: int):
-    # -------------------------------
-    # Base filters (soft delete aware)
-    # -------------------------------
-    base_query = db.query(Slider).filter(
-        Slider.is_delete == False,
-        Slider.is_active == True
-    ).order_by(Slider.created_at.desc())
+# -------------------------------
+# Base filters (soft delete aware)
+# -------------------------------
+_WEB_SLIDER_FILTERS = (
+    Slider.is_delete == False,
+    Slider.is_active == True
+)
 
-    total_records = base_query.count()
 
-    sliders = base_query.offset(offset).limit(limit).all()
-
-    return total_records, sliders
+def web_sliders_statement():
+    return select(Slider).where(*_WEB_SLIDER_FILTERS)
 
 
+async def list_sliders_async(db: AsyncSession, params: PageParams, count: str = COUNT_EXACT):
+    return await paginate_async(db, web_sliders_statement(), Slider, params, count=count)
@@ -1,12 +1,163 @@
+import threading
+import time
+
+import numpy as np
+from sqlalchemy import text, literal_column, select
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql import func
 from app.models.zone import Zone
 from app.schemas.zone import ZoneCreate, ZoneUpdate
 from app.core.exceptions import AppException
+from app.services.catalog_snapshot_service import mark_catalog_stale
 from sqlalchemy.exc import IntegrityError
-from app.utils.geo import point_in_polygon
+from app.utils.geo import CompiledPolygon, points_in_polygons
+from app.utils.spatial_index import ZoneGridIndex
+from app.utils.polygon_cache import CompiledPolygonCache
+from app.core.config import (
+    ZONE_INDEX_CELL_SIZE,
+    ZONE_INDEX_TTL_SECONDS,
+    ZONE_POLYGON_CACHE_SIZE,
+    ZONE_LOOKUP_MODE,
+)
 from app.models.zone import Zone
 
+
+# -------------------------------
+# Zone spatial index (per process)
+# -------------------------------
+# Rebuilt lazily after any zone write, and at most every
+# ZONE_INDEX_TTL_SECONDS so other workers pick up changes too.
+_zone_index = None
+_zone_index_built_at = 0.0
+_zone_index_generation = 0
+_zone_index_lock = threading.Lock()
+
+# Compiled polygons keyed by (zone.id, zone.updated_at), so a rebuild
+# only decodes the polygon JSON of zones that actually changed
+_polygon_cache = CompiledPolygonCache(maxsize=ZONE_POLYGON_CACHE_SIZE)
+
+
+def invalidate_zone_index(zone_id: int | None = None):
+    global _zone_index, _zone_index_generation
+    with _zone_index_lock:
+        _zone_index = None
+        _zone_index_generation += 1
+
+    if zone_id is not None:
+        _polygon_cache.invalidate(zone_id)
+
+
+_active_zone_versions = select(Zone.id, Zone.updated_at).where(
+    Zone.is_delete == False,
+    Zone.is_active == True
+)
+
+
+def _split_cached(rows) -> tuple[dict[int, CompiledPolygon], list]:
+    compiled = {}
+    missing = []
+
+    for zone_id, updated_at in rows:
+        polygon = _polygon_cache.get((zone_id, updated_at))
+        if polygon is None:
+            missing.append((zone_id, updated_at))
+        else:
+            compiled[zone_id] = polygon
+
+    return compiled, missing
+
+
+def _polygons_of(missing: list):
+    return select(Zone.id, Zone.polygon).where(
+        Zone.id.in_([zone_id for zone_id, _ in missing])
+    )
+
+
+def _compile_missing(compiled: dict, missing: list, polygons: dict) -> dict[int, CompiledPolygon]:
+    for zone_id, updated_at in missing:
+        if not polygons.get(zone_id):
+            continue
+
+        polygon = CompiledPolygon(polygons[zone_id])
+        _polygon_cache.put((zone_id, updated_at), polygon)
+        compiled[zone_id] = polygon
+
+    return compiled
+
+
+def _load_compiled_polygons(db: Session) -> dict[int, CompiledPolygon]:
+    compiled, missing = _split_cached(db.execute(_active_zone_versions).all())
+
+    if missing:
+        # JSON is only fetched (and decoded) for new / edited zones
+        polygons = dict(db.execute(_polygons_of(missing)).all())
+        _compile_missing(compiled, missing, polygons)
+
+    return compiled
+
+
+async def _load_compiled_polygons_async(db: AsyncSession) -> dict[int, CompiledPolygon]:
+    compiled, missing = _split_cached((await db.execute(_active_zone_versions)).all())
+
+    if missing:
+        polygons = dict((await db.execute(_polygons_of(missing))).all())
+        _compile_missing(compiled, missing, polygons)
+
+    return compiled
+
+
+def _build_zone_index(polygons: dict[int, CompiledPolygon]) -> ZoneGridIndex:
+    index = ZoneGridIndex(cell_size=ZONE_INDEX_CELL_SIZE)
+    for zone_id, polygon in polygons.items():
+        index.add(zone_id, polygon)
+    return index
+
+
+def _current_zone_index() -> ZoneGridIndex | None:
+    if (
+        _zone_index is not None
+        and time.monotonic() - _zone_index_built_at < ZONE_INDEX_TTL_SECONDS
+    ):
+        return _zone_index
+    return None
+
+
+def get_zone_index(db: Session) -> ZoneGridIndex:
+    global _zone_index, _zone_index_built_at
+
+    with _zone_index_lock:
+        index = _current_zone_index()
+        if index is not None:
+            return index
+
+        index = _build_zone_index(_load_compiled_polygons(db))
+
+        _zone_index = index
+        _zone_index_built_at = time.monotonic()
+        return index
+
+
+async def get_zone_index_async(db: AsyncSession) -> ZoneGridIndex:
+    global _zone_index, _zone_index_built_at
+
+    index = _current_zone_index()
+    if index is not None:
+        return index
+
+    # The lock can't be held across awaits: build outside of it and
+    # only publish when no zone write happened in the meantime
+    generation = _zone_index_generation
+    index = _build_zone_index(await _load_compiled_polygons_async(db))
+
+    with _zone_index_lock:
+        if generation == _zone_index_generation:
+            _zone_index = index
+            _zone_index_built_at = time.monotonic()
+
+    return index
+
+
 def create_zone(db: Session, data: ZoneCreate):
     zone = Zone(
         zone_name=data.zone_name,
@@ -20,6 +171,7 @@ def create_zone(db: Session, data: ZoneCreate):
     db.add(zone)
     db.commit()
     db.refresh(zone)
+    invalidate_zone_index(zone.id)
     return zone
 
 
@@ -57,8 +209,10 @@ def update_zone(db: Session, zone_id: int, data: ZoneUpdate):
     zone.is_update = True
     zone.updated_at = func.now()
 
+    mark_catalog_stale(db, [zone.id])
     db.commit()
     db.refresh(zone)
+    invalidate_zone_index(zone.id)
     return zone
 
 
@@ -77,24 +231,114 @@ def delete_zone(db: Session, zone_id: int):
 
   
     try:
+        mark_catalog_stale(db, [zone.id])
         db.commit()
         db.refresh(zone)
+        invalidate_zone_index(zone.id)
         return zone
     except IntegrityError:
         db.rollback()
         raise AppException(status=500, message="Database error while deleting zone")
 
 
+def _match_zone_ids(index: ZoneGridIndex, lat: float, lng: float) -> list[int]:
+    # Only polygons whose bbox contains the point are tested
+    return sorted(
+        zone_id
+        for zone_id in index.candidates(lat, lng)
+        if index.polygons[zone_id].contains(lat, lng)
+    )
+
+
+def _match_zone_ids_batch(index: ZoneGridIndex, points: list[tuple[float, float]]) -> list[list[int]]:
+    if len(points) == 1:
+        return [_match_zone_ids(index, *points[0])]
+
+    # Every point against every zone in one vectorized pass
+    zone_ids, polygons = index.batch()
+    matrix = points_in_polygons(points, polygons)
+    return [[zone_ids[column] for column in np.flatnonzero(row)] for row in matrix]
+
+
+# -------------------------------
+# PostGIS mode (zones.geom + GiST)
+# -------------------------------
+def _st_contains_point(lat: float, lng: float):
+    return func.ST_Contains(
+        literal_column("zones.geom"),
+        func.ST_SetSRID(func.ST_MakePoint(lng, lat), 4326)
+    )
+
+
+def _get_zones_by_lat_lng_postgis(db: Session, lat: float, lng: float):
+    return db.query(Zone).filter(
+        Zone.is_delete == False,
+        Zone.is_active == True,
+        _st_contains_point(lat, lng)
+    ).order_by(Zone.id).all()
+
+
+_RESOLVE_POINTS_SQL = text("""
+    SELECT p.ord, z.id
+    FROM unnest(CAST(:lats AS float8[]), CAST(:lngs AS float8[]))
+         WITH ORDINALITY AS p(lat, lng, ord)
+    JOIN zones z
+      ON ST_Contains(z.geom, ST_SetSRID(ST_MakePoint(p.lng, p.lat), 4326))
+    WHERE z.is_delete = false
+      AND z.is_active = true
+    ORDER BY p.ord, z.id
+""")
+
+
+def _resolve_points_params(points: list[tuple[float, float]]) -> dict:
+    return {
+        "lats": [lat for lat, _ in points],
+        "lngs": [lng for _, lng in points],
+    }
+
+
+def _group_by_point(points: list[tuple[float, float]], rows) -> list[list[int]]:
+    result = [[] for _ in points]
+    for position, zone_id in rows:
+        result[position - 1].append(zone_id)
+    return result
+
+
+def _resolve_zone_ids_postgis(db: Session, points: list[tuple[float, float]]) -> list[list[int]]:
+    rows = db.execute(_RESOLVE_POINTS_SQL, _resolve_points_params(points)).all()
+    return _group_by_point(points, rows)
+
+
 def get_zones_by_lat_lng(db, lat: float, lng: float):
-    zones = db.query(Zone).filter(
+    if ZONE_LOOKUP_MODE == "postgis":
+        return _get_zones_by_lat_lng_postgis(db, lat, lng)
+
+    matched_ids = _match_zone_ids(get_zone_index(db), lat, lng)
+
+    if not matched_ids:
+        return []
+
+    return db.query(Zone).filter(
+        Zone.id.in_(matched_ids),
         Zone.is_delete == False,
         Zone.is_active == True
-    ).all()
+    ).order_by(Zone.id).all()
+
+
+def resolve_zone_ids(db: Session, points: list[tuple[float, float]]) -> list[list[int]]:
+    """
+    Zone ids for every (lat, lng) point, all resolved
+    against the same index snapshot
+    """
+    if ZONE_LOOKUP_MODE == "postgis":
+        return _resolve_zone_ids_postgis(db, points)
+
+    return _match_zone_ids_batch(get_zone_index(db), points)
 
-    matched_zones = []
 
-    for zone in zones:
-        if zone.polygon and point_in_polygon(lat, lng, zone.polygon):
-            matched_zones.append(zone)
+async def resolve_zone_ids_async(db: AsyncSession, points: list[tuple[float, float]]) -> list[list[int]]:
+    if ZONE_LOOKUP_MODE == "postgis":
+        rows = (await db.execute(_RESOLVE_POINTS_SQL, _resolve_points_params(points))).all()
+        return _group_by_point(points, rows)
 
-    return matched_zones
\ No newline at end of file
+    return _match_zone_ids_batch(await get_zone_index_async(db), points)
@@ -0,0 +1,98 @@
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+
+from fastapi import Request
+from fastapi.responses import Response
+from sqlalchemy import select, func
+from sqlalchemy.orm import Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+def _validator_statement(sources: list):
+    columns = []
+    for query, model in sources:
+        statement = query.statement if isinstance(query, Query) else query
+        columns.append(
+            statement
+            .with_only_columns(func.count(), maintain_column_froms=True)
+            .order_by(None)
+            .scalar_subquery()
+        )
+        # Indexed: each max() is one index lookup, not a scan
+        columns.append(select(func.max(model.created_at)).scalar_subquery())
+        columns.append(select(func.max(model.updated_at)).scalar_subquery())
+        if hasattr(model, "deleted_at"):
+            columns.append(select(func.max(model.deleted_at)).scalar_subquery())
+
+    return select(*columns)
+
+
+async def catalog_validator_async(db: AsyncSession, request: Request, sources: list) -> tuple[str, datetime | None]:
+    """
+    Cheap (ETag, Last-Modified) for a list response, in ONE aggregate query.
+    Same result on every worker, so it can answer 304s before any row
+    is loaded.
+
+    sources = [(filtered_select, Model), ...]
+      - row count of every filtered query
+      - max(created_at / updated_at / deleted_at) of the whole table,
+        so rows leaving the filtered set (deactivate / delete) still
+        move the validator
+    """
+    return _validator(request, (await db.execute(_validator_statement(sources))).one())
+
+
+def _validator(request: Request, values) -> tuple[str, datetime | None]:
+    timestamps = [v for v in values if isinstance(v, datetime)]
+    last_modified = max(timestamps) if timestamps else None
+    if last_modified is not None and last_modified.tzinfo is None:
+        last_modified = last_modified.replace(tzinfo=timezone.utc)
+
+    query = "&".join(f"{k}={v}" for k, v in sorted(request.query_params.multi_items()))
+    digest = hashlib.sha1(
+        f"{request.url.path}?{query}|{'|'.join(map(str, values))}".encode()
+    ).hexdigest()[:32]
+
+    return f'W/"{digest}"', last_modified
+
+
+def validator_headers(etag: str, last_modified: datetime | None) -> dict:
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if last_modified is not None:
+        headers["Last-Modified"] = format_datetime(last_modified.astimezone(timezone.utc), usegmt=True)
+    return headers
+
+
+def not_modified(request: Request, etag: str, last_modified: datetime | None) -> Response | None:
+    """
+    304 when If-None-Match / If-Modified-Since still match, else None.
+    If-None-Match wins when both are sent.
+    """
+    if_none_match = request.headers.get("if-none-match")
+
+    if if_none_match is not None:
+        tags = [t.strip() for t in if_none_match.split(",")]
+        # Weak comparison: W/"x" and "x" are the same validator
+        bare = etag.removeprefix("W/")
+        matched = "*" in tags or any(t.removeprefix("W/") == bare for t in tags)
+
+    else:
+        if_modified_since = request.headers.get("if-modified-since")
+        if not if_modified_since or last_modified is None:
+            return None
+
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return None
+
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+
+        matched = last_modified.replace(microsecond=0) <= since
+
+    if not matched:
+        return None
+
+    return Response(status_code=304, headers=validator_headers(etag, last_modified))
@@ -1,3 +1,6 @@
+import numpy as np
+
+
 def point_in_polygon(lat: float, lng: float, polygon: list[dict]) -> bool:
     """
     Ray Casting Algorithm
@@ -22,3 +25,139 @@ def point_in_polygon(lat: float, lng: float, polygon: list[dict]) -> bool:
             inside = not inside
 
     return inside
+
+
+class CompiledPolygon:
+    """
+    One polygon decoded once into flat float64 arrays.
+
+    Keeps the bounding box and, per edge, the slope terms
+    dx = xj - xi and dy = yj - yi + 1e-9, so contains() evaluates
+    exactly the same expression as point_in_polygon without
+    touching any dicts.
+    """
+
+    __slots__ = ("xi", "yi", "yj", "dx", "dy", "bbox")
+
+    def __init__(self, polygon: list[dict]):
+        if not polygon:
+            raise ValueError("Polygon must have at least 1 point")
+
+        self.xi = np.ascontiguousarray([p["lng"] for p in polygon], dtype=np.float64)
+        self.yi = np.ascontiguousarray([p["lat"] for p in polygon], dtype=np.float64)
+
+        # j = (i - 1) % n  →  previous vertex, wrapping around
+        xj = np.roll(self.xi, 1)
+        self.yj = np.roll(self.yi, 1)
+
+        self.dx = xj - self.xi
+        self.dy = self.yj - self.yi + 1e-9
+
+        # (min_lat, min_lng, max_lat, max_lng)
+        self.bbox = (
+            float(self.yi.min()),
+            float(self.xi.min()),
+            float(self.yi.max()),
+            float(self.xi.max()),
+        )
+
+    def contains(self, lat: float, lng: float) -> bool:
+        straddles = (self.yi > lat) != (self.yj > lat)
+        if not straddles.any():
+            return False
+
+        yi = self.yi[straddles]
+        x_cross = self.dx[straddles] * (lat - yi) / self.dy[straddles] + self.xi[straddles]
+
+        return bool(np.count_nonzero(lng < x_cross) % 2)
+
+
+# =========================
+# BATCH (VECTORIZED) ENGINE
+# =========================
+# Max (points x edges) cells evaluated at once, keeps memory bounded
+BATCH_CHUNK_CELLS = 2_000_000
+
+
+class CompiledPolygons:
+    """
+    Many CompiledPolygon edge arrays concatenated into one set of
+    contiguous float64 arrays (the per-polygon ones are reused, not
+    decoded again).
+
+    Edge k goes from vertex j = i - 1 to vertex i of its polygon,
+    exactly like point_in_polygon walks it.
+    Edges of one polygon are stored next to each other, starting at
+    `starts[m]` for the m-th non-empty polygon (`columns[m]`).
+    """
+
+    def __init__(self, polygons: list):
+        compiled, starts, columns = [], [], []
+        edges = 0
+
+        for column, polygon in enumerate(polygons):
+            if not isinstance(polygon, CompiledPolygon):
+                if not polygon:
+                    continue
+                polygon = CompiledPolygon(polygon)
+
+            starts.append(edges)
+            columns.append(column)
+            compiled.append(polygon)
+            edges += len(polygon.xi)
+
+        def joined(name: str) -> np.ndarray:
+            arrays = [getattr(polygon, name) for polygon in compiled]
+            return np.concatenate(arrays) if arrays else np.zeros(0, dtype=np.float64)
+
+        self.size = len(polygons)
+        self.xi = joined("xi")
+        self.yi = joined("yi")
+        self.yj = joined("yj")
+        self.dx = joined("dx")
+        self.dy = joined("dy")
+        self.starts = np.asarray(starts, dtype=np.intp)
+        self.columns = np.asarray(columns, dtype=np.intp)
+
+
+def compile_polygons(polygons: list) -> CompiledPolygons:
+    return CompiledPolygons(polygons)
+
+
+def points_in_polygons(points, polygons) -> np.ndarray:
+    """
+    Ray Casting Algorithm for N points against M polygons at once
+    points   = [(lat, lng), ...]   (or an (N, 2) array)
+    polygons = [[{"lat": float, "lng": float}, ...] or CompiledPolygon, ...]
+               or CompiledPolygons
+
+    Returns a boolean (N, M) matrix, matrix[p, m] is
+    point_in_polygon(lat_p, lng_p, polygons[m]).
+    """
+    compiled = polygons if isinstance(polygons, CompiledPolygons) else CompiledPolygons(polygons)
+
+    pts = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    result = np.zeros((len(pts), compiled.size), dtype=bool)
+
+    edges = len(compiled.xi)
+    if not len(pts) or not edges:
+        return result
+
+    chunk = max(1, BATCH_CHUNK_CELLS // edges)
+
+    for start in range(0, len(pts), chunk):
+        y = pts[start:start + chunk, 0:1]
+        x = pts[start:start + chunk, 1:2]
+
+        straddles = (compiled.yi > y) != (compiled.yj > y)
+
+        # Same operation order as point_in_polygon → identical float results
+        with np.errstate(divide="ignore", invalid="ignore"):
+            x_cross = compiled.dx * (y - compiled.yi) / compiled.dy + compiled.xi
+
+        crossings = straddles & (x < x_cross)
+
+        counts = np.add.reduceat(crossings, compiled.starts, axis=1)
+        result[start:start + chunk, compiled.columns] = (counts % 2) == 1
+
+    return result
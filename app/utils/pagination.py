@@ -0,0 +1,269 @@
+import base64
+import json
+import math
+import threading
+import time
+from datetime import datetime
+from typing import Optional
+
+from fastapi import Query
+from sqlalchemy import tuple_, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.exceptions import AppException
+from app.core.config import PAGINATION_COUNT_CACHE_TTL, PAGINATION_COUNT_CACHE_SIZE
+
+
+# =========================
+# TOTAL COUNT STRATEGIES
+# =========================
+COUNT_EXACT = "exact"        # SELECT count(*) before the page (default)
+COUNT_WINDOW = "window"      # count(*) OVER () in the page query itself
+COUNT_ESTIMATE = "estimate"  # count(*) cached for PAGINATION_COUNT_CACHE_TTL
+COUNT_NONE = "none"          # no total, only has_more
+
+
+# =========================
+# CURSOR TOKEN
+# =========================
+def encode_cursor(created_at: datetime, id: int) -> str:
+    raw = json.dumps([created_at.isoformat(), id]).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created_at, id = json.loads(raw)
+        return datetime.fromisoformat(created_at), int(id)
+    except (ValueError, TypeError):
+        raise AppException(status=400, message="Invalid cursor")
+
+
+# =========================
+# QUERY PARAMS
+# =========================
+class PageParams:
+    """
+    page / limit  → classic page mode (default)
+    cursor        → keyset mode on (created_at, id)
+                    send an empty cursor for the first page,
+                    then the returned next_cursor
+    """
+
+    def __init__(self, page: int = 1, limit: int = 10, cursor: Optional[str] = None):
+        self.page = page
+        self.limit = limit
+        self.cursor_mode = cursor is not None
+        self.after = decode_cursor(cursor) if cursor else None
+
+    @property
+    def offset(self) -> int:
+        return (self.page - 1) * self.limit
+
+
+def page_params(
+    page: int = Query(1, ge=1),
+    limit: int = Query(10, ge=1),
+    cursor: Optional[str] = Query(
+        None,
+        description="Keyset pagination: empty for the first page, then next_cursor"
+    ),
+) -> PageParams:
+    return PageParams(page=page, limit=limit, cursor=cursor)
+
+
+# =========================
+# CACHED COUNTER
+# =========================
+_count_cache: dict[tuple, tuple[float, int]] = {}
+_count_cache_lock = threading.Lock()
+
+
+def _count_cache_key(statement, dialect) -> tuple:
+    compiled = statement.compile(dialect=dialect)
+    return str(compiled), repr(sorted(compiled.params.items()))
+
+
+def _get_cached_count(key: tuple) -> int | None:
+    with _count_cache_lock:
+        hit = _count_cache.get(key)
+        if hit and hit[0] > time.monotonic():
+            return hit[1]
+    return None
+
+
+def _set_cached_count(key: tuple, total: int):
+    with _count_cache_lock:
+        if len(_count_cache) >= PAGINATION_COUNT_CACHE_SIZE:
+            _count_cache.clear()
+        _count_cache[key] = (time.monotonic() + PAGINATION_COUNT_CACHE_TTL, total)
+
+
+def cached_count(query) -> int:
+    key = _count_cache_key(query.statement, query.session.get_bind().dialect)
+
+    total = _get_cached_count(key)
+    if total is None:
+        total = query.count()
+        _set_cached_count(key, total)
+
+    return total
+
+
+# =========================
+# PAGINATE
+# =========================
+def _page_pagination(params: PageParams, total: int | None, exact: bool, has_more: bool | None = None):
+    pagination = {
+        "total": total,
+        "per_page": params.limit,
+        "current_page": params.page,
+        "total_pages": math.ceil(total / params.limit) if total is not None and params.limit else None,
+        "total_exact": exact,
+    }
+    if has_more is not None:
+        pagination["has_more"] = has_more
+    return pagination
+
+
+def _paginate_pages(query, order, params: PageParams, count: str):
+    page_query = query.order_by(*order).offset(params.offset)
+
+    if count == COUNT_WINDOW:
+        rows = (
+            page_query
+            .add_columns(func.count().over().label("total_count"))
+            .limit(params.limit)
+            .all()
+        )
+        items = [row[0] for row in rows]
+
+        # Past the last page the window has no row to report on
+        if rows:
+            total = rows[0][1]
+        else:
+            total = query.count() if params.offset else 0
+
+        return items, _page_pagination(params, total, exact=True)
+
+    if count == COUNT_NONE:
+        rows = page_query.limit(params.limit + 1).all()
+        items = rows[:params.limit]
+        return items, _page_pagination(params, None, exact=False, has_more=len(rows) > params.limit)
+
+    if count == COUNT_ESTIMATE:
+        total = cached_count(query)
+        exact = False
+    else:
+        total = query.count()
+        exact = True
+
+    items = page_query.limit(params.limit).all()
+    return items, _page_pagination(params, total, exact=exact)
+
+
+def _order(model) -> tuple:
+    return model.created_at.desc(), model.id.desc()
+
+
+def _after(model, params: PageParams):
+    created_at, last_id = params.after
+    return tuple_(model.created_at, model.id) < tuple_(created_at, last_id)
+
+
+def _cursor_page(rows: list, params: PageParams):
+    # One extra row tells us whether there is a next page
+    items = rows[:params.limit]
+    has_more = len(rows) > params.limit
+
+    return items, {
+        "per_page": params.limit,
+        "next_cursor": encode_cursor(items[-1].created_at, items[-1].id) if has_more else None,
+        "has_more": has_more,
+    }
+
+
+def paginate(query, model, params: PageParams, count: str = COUNT_EXACT):
+    """
+    Orders `query` by (created_at desc, id desc) and returns
+    (items, pagination) for page or cursor mode.
+
+    `count` picks how page mode gets its total (COUNT_* above),
+    pagination["total_exact"] says whether the total can be trusted.
+    """
+    order = _order(model)
+
+    if not params.cursor_mode:
+        return _paginate_pages(query, order, params, count)
+
+    if params.after:
+        query = query.filter(_after(model, params))
+
+    return _cursor_page(query.order_by(*order).limit(params.limit + 1).all(), params)
+
+
+# =========================
+# PAGINATE (AsyncSession)
+# =========================
+# Same contract as paginate(), for 2.0 select() statements
+def _count_statement(statement):
+    return select(func.count()).select_from(statement.order_by(None).subquery())
+
+
+async def _count_async(db: AsyncSession, statement, cached: bool = False) -> int:
+    count_statement = _count_statement(statement)
+
+    if not cached:
+        return (await db.execute(count_statement)).scalar_one()
+
+    key = _count_cache_key(count_statement, db.get_bind().dialect)
+
+    total = _get_cached_count(key)
+    if total is None:
+        total = (await db.execute(count_statement)).scalar_one()
+        _set_cached_count(key, total)
+
+    return total
+
+
+async def _paginate_pages_async(db: AsyncSession, statement, order, params: PageParams, count: str):
+    page_statement = statement.order_by(*order).offset(params.offset)
+
+    if count == COUNT_WINDOW:
+        rows = (await db.execute(
+            page_statement
+            .add_columns(func.count().over().label("total_count"))
+            .limit(params.limit)
+        )).all()
+        items = [row[0] for row in rows]
+
+        # Past the last page the window has no row to report on
+        if rows:
+            total = rows[0][1]
+        else:
+            total = await _count_async(db, statement) if params.offset else 0
+
+        return items, _page_pagination(params, total, exact=True)
+
+    if count == COUNT_NONE:
+        rows = (await db.execute(page_statement.limit(params.limit + 1))).scalars().all()
+        items = rows[:params.limit]
+        return items, _page_pagination(params, None, exact=False, has_more=len(rows) > params.limit)
+
+    total = await _count_async(db, statement, cached=count == COUNT_ESTIMATE)
+    items = (await db.execute(page_statement.limit(params.limit))).scalars().all()
+    return items, _page_pagination(params, total, exact=count != COUNT_ESTIMATE)
+
+
+async def paginate_async(db: AsyncSession, statement, model, params: PageParams, count: str = COUNT_EXACT):
+    order = _order(model)
+
+    if not params.cursor_mode:
+        return await _paginate_pages_async(db, statement, order, params, count)
+
+    if params.after:
+        statement = statement.where(_after(model, params))
+
+    rows = (await db.execute(statement.order_by(*order).limit(params.limit + 1))).scalars().all()
+    return _cursor_page(list(rows), params)
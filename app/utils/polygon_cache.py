@@ -0,0 +1,46 @@
+import threading
+from collections import OrderedDict
+
+from app.utils.geo import CompiledPolygon
+
+
+class CompiledPolygonCache:
+    """
+    Process level LRU cache of compiled zone polygons.
+
+    Key = (zone_id, updated_at), so an edited zone simply misses
+    and gets recompiled. invalidate(zone_id) drops every version
+    of a zone right away.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._data: "OrderedDict[tuple, CompiledPolygon]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple) -> CompiledPolygon | None:
+        with self._lock:
+            compiled = self._data.get(key)
+            if compiled is not None:
+                self._data.move_to_end(key)
+            return compiled
+
+    def put(self, key: tuple, compiled: CompiledPolygon):
+        with self._lock:
+            self._data[key] = compiled
+            self._data.move_to_end(key)
+
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def invalidate(self, zone_id: int):
+        with self._lock:
+            for key in [k for k in self._data if k[0] == zone_id]:
+                del self._data[key]
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
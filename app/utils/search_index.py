@@ -0,0 +1,189 @@
+import re
+
+import numpy as np
+
+
+_WORD = re.compile(r"[a-z0-9]+")
+
+
+def words(text: str | None) -> list[str]:
+    return _WORD.findall(text.lower()) if text else []
+
+
+def trigrams(word: str) -> set[str]:
+    """
+    pg_trgm style: two leading blanks, one trailing
+    ("tom" → "  t", " to", "tom", "om ")
+    """
+    padded = f"  {word} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class ProductSearchIndex:
+    """
+    In-process trigram index (no database extension needed).
+
+    Vocabulary = distinct words of the indexed fields. Each query word
+    is scored against the whole vocabulary with one np.bincount over
+    the trigram postings, so cost depends on the query, not on the
+    number of products:
+
+        score(word) = (trigram jaccard + share of query trigrams found) / 2
+
+    Exact words score 1, prefixes ("tom" → "tomato") and typos
+    ("tomatoe") stay above `min_similarity`.
+    A product's score is the mean over query words of its best
+    (score × field weight).
+    """
+
+    def __init__(self, fields: dict[str, float], min_similarity: float = 0.3):
+        self.fields = fields
+        self.min_similarity = min_similarity
+        # Set by the owner, to tell which invalidation it reflects
+        self.generation = 0
+        self.product_ids = np.zeros(0, dtype=np.int64)
+
+    def build(self, rows):
+        """
+        rows = [(product_id, {field: text}), ...]
+        """
+        vocabulary: dict[str, int] = {}
+        # word id → {product position: best field weight}
+        entries: list[dict[int, float]] = []
+        product_ids = []
+
+        for position, (product_id, values) in enumerate(rows):
+            product_ids.append(product_id)
+
+            for field, weight in self.fields.items():
+                for word in words(values.get(field)):
+                    word_id = vocabulary.setdefault(word, len(vocabulary))
+                    if word_id == len(entries):
+                        entries.append({})
+                    if entries[word_id].get(position, 0.0) < weight:
+                        entries[word_id][position] = weight
+
+        postings: dict[str, list[int]] = {}
+        word_trigram_counts = np.zeros(len(vocabulary), dtype=np.float32)
+
+        for word, word_id in vocabulary.items():
+            grams = trigrams(word)
+            word_trigram_counts[word_id] = len(grams)
+            for gram in grams:
+                postings.setdefault(gram, []).append(word_id)
+
+        # Word → products as CSR arrays
+        offsets = np.zeros(len(vocabulary) + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum([len(e) for e in entries])
+        entry_products = np.fromiter(
+            (position for e in entries for position in e), dtype=np.int64, count=int(offsets[-1])
+        )
+        entry_weights = np.fromiter(
+            (weight for e in entries for weight in e.values()), dtype=np.float32, count=int(offsets[-1])
+        )
+
+        self.vocabulary = vocabulary
+        self.postings = {gram: np.array(ids, dtype=np.int64) for gram, ids in postings.items()}
+        self.word_trigram_counts = word_trigram_counts
+        self.offsets = offsets
+        self.entry_products = entry_products
+        self.entry_weights = entry_weights
+        self.product_ids = np.array(product_ids, dtype=np.int64)
+        return self
+
+    def _word_scores(self, word: str) -> np.ndarray:
+        """
+        Best score per product position for one query word
+        """
+        scores = np.zeros(len(self.product_ids), dtype=np.float32)
+
+        grams = [gram for gram in trigrams(word) if gram in self.postings]
+        if not grams:
+            return scores
+
+        query_count = len(trigrams(word))
+        shared = np.bincount(
+            np.concatenate([self.postings[gram] for gram in grams]),
+            minlength=len(self.vocabulary)
+        ).astype(np.float32)
+
+        jaccard = shared / (query_count + self.word_trigram_counts - shared)
+        coverage = shared / query_count
+        similarity = (jaccard + coverage) / 2
+
+        exact = self.vocabulary.get(word)
+        if exact is not None:
+            similarity[exact] = 1.0
+
+        matched = np.nonzero(similarity >= self.min_similarity)[0]
+        if not len(matched):
+            return scores
+
+        starts, ends = self.offsets[matched], self.offsets[matched + 1]
+        sizes = ends - starts
+        # Entry indexes of every matched word, without a Python loop
+        index = np.repeat(starts - np.cumsum(sizes) + sizes, sizes) + np.arange(sizes.sum())
+
+        np.maximum.at(
+            scores,
+            self.entry_products[index],
+            np.repeat(similarity[matched], sizes) * self.entry_weights[index]
+        )
+        return scores
+
+    def _scores(self, query: str) -> np.ndarray | None:
+        query_words = words(query)
+        if not query_words or not len(self.product_ids):
+            return None
+
+        total = np.zeros(len(self.product_ids), dtype=np.float32)
+        for word in dict.fromkeys(query_words):
+            total += self._word_scores(word)
+        total /= len(set(query_words))
+        return total
+
+    def _ranked(self, total: np.ndarray, candidates: np.ndarray) -> list[tuple[int, float]]:
+        # Ties keep the index order (newest first)
+        order = candidates[np.lexsort((candidates, -total[candidates]))]
+        return [(int(self.product_ids[i]), round(float(total[i]), 4)) for i in order]
+
+    def search(self, query: str, limit: int) -> list[tuple[int, float]]:
+        """
+        [(product_id, score), ...] best first
+        """
+        return next(self.search_batches(query, limit), [])
+
+    def search_batches(self, query: str, first: int):
+        """
+        Every match, best first, in batches of `first`, then twice
+        as many each time (up to 16 × `first`): callers filtering the
+        results pull more until they have enough. Scores are computed once.
+        """
+        total = self._scores(query)
+        if total is None:
+            return
+
+        candidates = np.nonzero(total > 0)[0]
+        if len(candidates) <= first:
+            if len(candidates):
+                yield self._ranked(total, candidates)
+            return
+
+        # Score of the `first`-th best, then every candidate at or above
+        # it: ties at the cutoff are ordered by index like the rest,
+        # not picked in argpartition's arbitrary order
+        cutoff = -np.partition(-total[candidates], first - 1)[first - 1]
+        top = candidates[total[candidates] >= cutoff]
+        top = top[np.lexsort((top, -total[top]))][:first]
+        yield self._ranked(total, top)
+
+        taken = np.zeros(len(self.product_ids), dtype=bool)
+        taken[top] = True
+        rest = self._ranked(total, candidates[~taken[candidates]])
+        start, size = 0, first * 2
+        while start < len(rest):
+            yield rest[start:start + size]
+            start, size = start + size, min(size * 2, first * 16)
+
+    def __len__(self):
+        return len(self.product_ids)
@@ -0,0 +1,76 @@
+import math
+
+from app.utils.geo import CompiledPolygon, CompiledPolygons
+
+
+class ZoneGridIndex:
+    """
+    Uniform grid over zone bounding boxes.
+
+    Every zone is registered in each grid cell its bounding box touches,
+    so a lookup only has to look at the zones of ONE cell and then
+    test the compiled polygons whose bbox contains the point.
+
+    Zones whose bbox covers more than `max_cells_per_zone` cells
+    (e.g. a whole-state zone) are kept in a separate list and only
+    bbox-checked, to keep the grid small.
+    """
+
+    def __init__(self, cell_size: float = 0.05, max_cells_per_zone: int = 4096):
+        self.cell_size = cell_size
+        self.max_cells_per_zone = max_cells_per_zone
+        self.cells: dict[tuple[int, int], list[int]] = {}
+        self.large_zones: list[int] = []
+        self.bboxes: dict[int, tuple[float, float, float, float]] = {}
+        self.polygons: dict[int, CompiledPolygon] = {}
+        self._batch: tuple[list[int], CompiledPolygons] | None = None
+
+    def _cell(self, lat: float, lng: float) -> tuple[int, int]:
+        return (
+            math.floor(lat / self.cell_size),
+            math.floor(lng / self.cell_size)
+        )
+
+    def add(self, zone_id: int, polygon: CompiledPolygon):
+        bbox = polygon.bbox
+        self.bboxes[zone_id] = bbox
+        self.polygons[zone_id] = polygon
+        self._batch = None
+
+        min_row, min_col = self._cell(bbox[0], bbox[1])
+        max_row, max_col = self._cell(bbox[2], bbox[3])
+
+        if (max_row - min_row + 1) * (max_col - min_col + 1) > self.max_cells_per_zone:
+            self.large_zones.append(zone_id)
+            return
+
+        for row in range(min_row, max_row + 1):
+            for col in range(min_col, max_col + 1):
+                self.cells.setdefault((row, col), []).append(zone_id)
+
+    def candidates(self, lat: float, lng: float) -> list[int]:
+        """
+        Zone ids whose bounding box contains the point
+        """
+        matched = []
+
+        for zone_id in self.cells.get(self._cell(lat, lng), []) + self.large_zones:
+            min_lat, min_lng, max_lat, max_lng = self.bboxes[zone_id]
+            if min_lat <= lat <= max_lat and min_lng <= lng <= max_lng:
+                matched.append(zone_id)
+
+        return matched
+
+    def batch(self) -> tuple[list[int], CompiledPolygons]:
+        """
+        (zone ids in id order, their polygons as one CompiledPolygons)
+        for points_in_polygons(), built from the same compiled
+        polygons on first use
+        """
+        if self._batch is None:
+            zone_ids = sorted(self.polygons)
+            self._batch = (zone_ids, CompiledPolygons([self.polygons[zone_id] for zone_id in zone_ids]))
+        return self._batch
+
+    def __len__(self):
+        return len(self.bboxes)
@@ -0,0 +1,107 @@
+from bisect import bisect_left, insort
+
+
+def normalize(text: str | None) -> str:
+    return " ".join(text.lower().split()) if text else ""
+
+
+class SuggestionIndex:
+    """
+    Type-ahead over names, kept as two sorted arrays of keys:
+
+      - whole names          "cherry tomato"
+      - later word starts    "tomato"   (→ "Cherry Tomato")
+
+    A lookup is a bisect to the first key >= prefix plus a scan of at
+    most `limit` keys per array. Whole-name matches come first, each
+    group alphabetical (so shorter names before longer ones).
+
+    Not thread-safe on its own, callers hold a lock.
+    """
+
+    def __init__(self):
+        # (kind, id) → suggestion dict
+        self._entries: dict[tuple[str, int], dict] = {}
+        self._names: list[tuple[str, str, int]] = []
+        self._words: list[tuple[str, str, int]] = []
+
+    @staticmethod
+    def _keys(text: str, kind: str, id: int):
+        name = normalize(text)
+        parts = name.split(" ")
+        whole = (name, kind, id)
+        inner = [(" ".join(parts[i:]), kind, id) for i in range(1, len(parts))]
+        return whole, inner
+
+    @classmethod
+    def build(cls, items) -> "SuggestionIndex":
+        """
+        Bulk load of (kind, id, text, extra) items: keys are collected
+        and sorted once, instead of an O(n) insort per key.
+        """
+        index = cls()
+
+        for kind, id, text, extra in items:
+            whole, inner = cls._keys(text, kind, id)
+            if not whole[0] or (kind, id) in index._entries:
+                continue
+
+            index._entries[(kind, id)] = {"text": text, "type": kind, **extra}
+            index._names.append(whole)
+            index._words.extend(inner)
+
+        index._names.sort()
+        index._words.sort()
+        return index
+
+    def add(self, kind: str, id: int, text: str, **extra):
+        if (kind, id) in self._entries:
+            self.remove(kind, id)
+
+        whole, inner = self._keys(text, kind, id)
+        if not whole[0]:
+            return
+
+        self._entries[(kind, id)] = {"text": text, "type": kind, **extra}
+        insort(self._names, whole)
+        for key in inner:
+            insort(self._words, key)
+
+    def remove(self, kind: str, id: int):
+        entry = self._entries.pop((kind, id), None)
+        if entry is None:
+            return
+
+        whole, inner = self._keys(entry["text"], kind, id)
+        self._delete(self._names, whole)
+        for key in inner:
+            self._delete(self._words, key)
+
+    @staticmethod
+    def _delete(keys: list, key: tuple):
+        position = bisect_left(keys, key)
+        if position < len(keys) and keys[position] == key:
+            del keys[position]
+
+    def suggest(self, prefix: str, limit: int) -> list[dict]:
+        prefix = normalize(prefix)
+        if not prefix:
+            return []
+
+        found: dict[tuple[str, int], dict] = {}
+
+        for keys in (self._names, self._words):
+            position = bisect_left(keys, (prefix,))
+
+            while position < len(keys) and len(found) < limit:
+                name, kind, id = keys[position]
+                if not name.startswith(prefix):
+                    break
+
+                found.setdefault((kind, id), self._entries[(kind, id)])
+                position += 1
+
+        return list(found.values())
+
+    def __len__(self):
+        return len(self._entries)